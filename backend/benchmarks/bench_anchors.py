@@ -0,0 +1,42 @@
+"""
+Benchmark for locating the config.FIELD_CONFIG anchors of the ANCHOR_FIELDS: the
+single compiled prefix-tree pattern used by AnchorEngine versus one case-insensitive
+regex per anchor (what wiring the config up naively would cost), plus the engine's
+full extraction of those fields, on letters with growing annexures.
+
+Run from the backend directory:
+    python -m benchmarks.bench_anchors [--repeat N]
+"""
+import re
+import argparse
+from extractor.anchors import AnchorEngine
+from extractor.config import ANCHOR_FIELDS, FIELD_CONFIG
+from benchmarks.bench_patterns import build_letter, time_call
+
+PER_ANCHOR = [re.compile(r'(?<!\w)' + re.escape(anchor).replace(r'\ ', r'\s+') + (r'(?!\w)' if anchor[-1].isalnum() else ""),
+                         re.IGNORECASE)
+              for field in ANCHOR_FIELDS for anchor in FIELD_CONFIG[field]]
+
+
+def hits_per_anchor(text: str) -> int:
+    return sum(1 for pattern in PER_ANCHOR for _ in pattern.finditer(text))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    engine = AnchorEngine()
+    print(f"{len(PER_ANCHOR)} anchors")
+    print(f"{'chars':>9} {'single scan us':>15} {'per anchor us':>14} {'extract us':>11}")
+    for annex in (0, 50, 500, 2000):
+        text = build_letter(annex)
+        single = time_call(lambda: sum(1 for _ in engine.hits(text)), args.repeat)
+        per_anchor = time_call(lambda: hits_per_anchor(text), args.repeat)
+        extract = time_call(lambda: engine.extract(text, ANCHOR_FIELDS), args.repeat)
+        print(f"{len(text):9} {single:15.1f} {per_anchor:14.1f} {extract:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Split + parse cost per document on letters with growing annexures: time per
+call and the peak memory allocated while parsing one letter (tracemalloc),
+through pipeline.parse_text, i.e. what every file pays once its text is
+extracted.
+
+Run from the backend directory:
+    python -m benchmarks.bench_document [--repeat N]
+"""
+import argparse
+import tracemalloc
+from extractor.field_parser import FIELD_EXTRACTORS
+from extractor.pipeline import new_file_result, parse_text
+from benchmarks.bench_patterns import build_letter, time_call
+
+
+def peak_bytes(text: str) -> int:
+    """Peak traced memory during one split + parse, counting the text itself."""
+    tracemalloc.start()
+    try:
+        parse_text(text, new_file_result("letter.docx"))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    # Everything but the anchor scan, which has nothing to share with the other extractors
+    without_anchors = [field for field, extractor in FIELD_EXTRACTORS.items() if extractor != "anchors"]
+    print(f"{'chars':>9} {'parse us':>10} {'no anchors us':>14} {'peak KiB':>9}")
+    for annex in (0, 50, 500, 2000):
+        text = build_letter(annex)
+        parse_text(text, new_file_result("letter.docx"))  # warm caches and lazy imports
+        us = time_call(lambda: parse_text(text, new_file_result("letter.docx")), args.repeat)
+        narrow_us = time_call(lambda: parse_text(text, new_file_result("letter.docx"), without_anchors), args.repeat)
+        peak = peak_bytes(text)
+        print(f"{len(text):9} {us:10.1f} {narrow_us:14.1f} {peak / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for DOCX text extraction: the python-docx engine versus the streaming
+engine (extractor.docx_stream). Every document is first checked to produce
+identical text with both engines, then each engine is timed on the synthetic
+corpus letters and on a letter with a large merged salary table.
+
+Run from the backend directory:
+    python -m benchmarks.bench_docx [--letters N] [--table-rows N] [--repeat N]
+"""
+import io
+import random
+import argparse
+import tempfile
+import tracemalloc
+from extractor.text_extractor import TextExtractor
+from benchmarks.corpus import generate_corpus
+from benchmarks.run import load_corpus
+from benchmarks.bench_patterns import time_call
+
+ENGINES = ["python-docx", "stream"]
+
+
+def merged_table_docx(rows: int, seed: int = 3) -> bytes:
+    """
+    A salary annexure whose table has a vertically merged category column, a
+    horizontally merged total row every 10 rows and multi-paragraph cells.
+    """
+    import docx
+
+    rng = random.Random(seed)
+    document = docx.Document()
+    document.add_paragraph("Schedule A")
+    document.add_paragraph("Salary Computation")
+    table = document.add_table(rows=rows + 1, cols=4)
+    for cell, text in zip(table.rows[0].cells, ["Category", "Component", "Per Annum", "Per Month"]):
+        cell.text = text
+    for start in range(1, rows + 1, 10):
+        end = min(start + 9, rows)
+        for i in range(start, end):
+            cells = table.rows[i].cells
+            cells[1].text = f"Component {i}\n(taxable)"
+            monthly = rng.randint(1, 99) * 1000
+            cells[2].text = f"{monthly * 12:,}"
+            cells[3].text = f"{monthly:,}"
+        category = table.cell(start, 0).merge(table.cell(end - 1, 0))
+        category.text = f"Group {start // 10}"
+        total = table.cell(end, 0).merge(table.cell(end, 1))
+        total.text = "Sub Total"
+    document.add_paragraph("Acceptance")
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def extract(content: bytes, engine: str) -> str:
+    return TextExtractor()._extract_docx(content, engine=engine)
+
+
+def peak_kib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--letters", type=int, default=10)
+    ap.add_argument("--table-rows", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_corpus(tmp, count=args.letters, formats=("docx",), salary_rows=12, annex_paragraphs=20, min_pages=3)
+        letters = [doc["content"] for doc in load_corpus(tmp)]
+    cases = {
+        f"{len(letters)} corpus letters": letters,
+        f"merged table, {args.table_rows} rows": [merged_table_docx(args.table_rows)],
+    }
+
+    print(f"{'documents':28} {'engine':12} {'ms':>10} {'peak KiB':>10}")
+    for name, docs in cases.items():
+        for content in docs:
+            if extract(content, "stream") != extract(content, "python-docx"):
+                raise SystemExit(f"{name}: engines produced different text")
+        for engine in ENGINES:
+            run = lambda: [extract(content, engine) for content in docs]
+            ms = time_call(run, args.repeat, rounds=3) / 1000
+            print(f"{name:28} {engine:12} {ms:10.1f} {peak_kib(run):10.0f}")
+    print("text identical for every document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark for the export builders on synthetic batches: the streaming CSV writer
+and the write-only XLSX writer versus the previous pandas DataFrame exports, and
+the Parquet tables. Reports time per export and the peak memory traced while
+producing it, then the downstream cost of loading each format and summing per-annum
+amounts per salary component (from the wide XLSX sheet versus the salary rows table).
+
+Run from the backend directory:
+    python -m benchmarks.bench_exports [--files N] [--components N] [--repeat N]
+"""
+import io
+import random
+import argparse
+import tracemalloc
+from typing import Dict, Any, List
+from extractor.exports import XLSX_COLUMNS, XLSX_SHEET, iter_csv, iter_parquet, iter_xlsx
+from benchmarks.bench_patterns import time_call
+
+
+def synthetic_results(files: int, components: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """file_results shaped like FieldParser output, each with a random subset of salary components."""
+    rng = random.Random(seed)
+    names = [f"Component {i:02d}" for i in range(components)]
+    results = []
+    for i in range(files):
+        rows = [{"component": name, "per_annum": rng.randint(1, 99) * 12000, "per_month": rng.randint(1, 99) * 1000}
+                for name in rng.sample(names, rng.randint(components // 2, components))]
+        results.append({
+            "file_name": f"offer_{i:05d}.pdf",
+            "fields": {
+                "designation": "Field Sales Manager", "location_city": "Pune", "location_state": "Maharashtra",
+                "date_of_joining_raw": "01-04-2025", "comp_total_annual_inr": rng.randint(3, 30) * 100000,
+                "scheduleA_name": f"Employee {i}", "scheduleA_grade": "2.1", "byod_clause": "No",
+                "salary_table_rows": rows,
+                "salary_table_totals": {"gross_salary": 1, "long_term_benefits": 2, "fixed_ctc": 3, "total_ctc": 4},
+            },
+            "error_code": "SCANNED_PDF" if i % 50 == 0 else None,
+            "error_message": "scanned" if i % 50 == 0 else None,
+        })
+    return results
+
+
+def pandas_csv(results) -> bytes:
+    import pandas as pd
+
+    flat_data = []
+    for item in results:
+        row = {"File Name": item.get("file_name")}
+        row.update(item.get("fields", {}))
+        if item.get("error_code"):
+            row["Error Code"] = item.get("error_code")
+            row["Error Message"] = item.get("error_message")
+        flat_data.append(row)
+    stream = io.StringIO()
+    pd.DataFrame(flat_data).to_csv(stream, index=False)
+    return stream.getvalue().encode("utf-8")
+
+
+def pandas_xlsx(results) -> bytes:
+    """The previous export: linear component lookups per cell, DataFrame, in-memory workbook."""
+    import pandas as pd
+
+    components = sorted({r.get("component") for item in results
+                         for r in item.get("fields", {}).get("salary_table_rows", [])})
+    flat_data = []
+    for item in results:
+        fields = item.get("fields", {})
+        row = {"File Name": item.get("file_name")}
+        for header, key in XLSX_COLUMNS[1:]:
+            row[header] = fields.get(key[0], {}).get(key[1]) if isinstance(key, tuple) else fields.get(key)
+        salary_rows = fields.get("salary_table_rows", [])
+        for comp in components:
+            match = next((r for r in salary_rows if r.get("component") == comp), None)
+            row[f"{comp} (Per Annum)"] = match.get("per_annum") if match else None
+            row[f"{comp} (Per Month)"] = match.get("per_month") if match else None
+        if item.get("error_code"):
+            row["Error Code"] = item.get("error_code")
+            row["Error Message"] = item.get("error_message")
+        flat_data.append(row)
+
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        pd.DataFrame(flat_data).to_excel(writer, index=False, sheet_name="Extracted Data")
+    return output.getvalue()
+
+
+def streamed_csv(results) -> int:
+    # Consume the chunks as a response would, without joining them
+    return sum(len(chunk) for chunk in iter_csv(results))
+
+
+def peak_kib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def streamed_xlsx(results) -> int:
+    return sum(len(chunk) for chunk in iter_xlsx(results))
+
+
+def parquet_tables(results) -> int:
+    return sum(len(chunk) for table in ("fields", "salary_rows") for chunk in iter_parquet(results, table))
+
+
+BUILDERS = {
+    "csv pandas": pandas_csv,
+    "csv streamed": streamed_csv,
+    "xlsx pandas": pandas_xlsx,
+    "xlsx write-only": streamed_xlsx,
+    "parquet tables": parquet_tables,
+}
+
+
+def query_xlsx(content: bytes) -> dict:
+    """Per-annum totals per component, read back from the wide sheet's dynamic columns."""
+    import pandas as pd
+
+    frame = pd.read_excel(io.BytesIO(content), sheet_name=XLSX_SHEET)
+    columns = [c for c in frame.columns if c.endswith(" (Per Annum)")]
+    return {c[:-len(" (Per Annum)")]: frame[c].sum() for c in columns}
+
+
+def query_parquet(content: bytes) -> dict:
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(io.BytesIO(content), columns=["component", "per_annum"])
+    totals = table.group_by("component").aggregate([("per_annum", "sum")])
+    return dict(zip(totals["component"].to_pylist(), totals["per_annum_sum"].to_pylist()))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--files", type=int, default=2000)
+    ap.add_argument("--components", type=int, default=30)
+    ap.add_argument("--repeat", type=int, default=1)
+    args = ap.parse_args()
+
+    results = synthetic_results(args.files, args.components)
+    print(f"{args.files} files, {args.components} salary components")
+    print(f"{'export':16} {'ms':>10} {'peak KiB':>10}")
+    for name, build in BUILDERS.items():
+        ms = time_call(lambda: build(results), args.repeat, rounds=3) / 1000
+        print(f"{name:16} {ms:10.1f} {peak_kib(lambda: build(results)):10.0f}")
+
+    xlsx = b"".join(iter_xlsx(results))
+    salary_rows = b"".join(iter_parquet(results, "salary_rows"))
+    assert query_xlsx(xlsx) == query_parquet(salary_rows)
+    print(f"\n{'load + query':16} {'ms':>10} {'KiB':>10}")
+    for name, query, content in (("xlsx", query_xlsx, xlsx), ("parquet", query_parquet, salary_rows)):
+        ms = time_call(lambda: query(content), args.repeat, rounds=3) / 1000
+        print(f"{name:16} {ms:10.1f} {len(content) / 1024:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
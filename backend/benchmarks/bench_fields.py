@@ -0,0 +1,57 @@
+"""
+Selective extraction benchmark: split + parse docs/sec over corpus letters for
+the default (every field) and for narrow ?fields= selections, after checking
+that each selection returns exactly the values of the full parse.
+
+Run from the backend directory:
+    python -m benchmarks.bench_fields [--count N] [--annex-paragraphs N] [--rounds N]
+"""
+import time
+import argparse
+import tempfile
+from extractor.text_extractor import TextExtractor
+from extractor.field_parser import FieldParser, required_sections
+from benchmarks.run import load_corpus
+from benchmarks.corpus import generate_corpus
+
+SELECTIONS = {
+    "all fields": None,
+    "designation, ctc, doj": ["designation", "comp_total_annual_inr", "date_of_joining_norm"],
+    "designation, doj": ["designation", "date_of_joining_raw", "date_of_joining_norm"],
+    "salary table": ["salary_table_rows", "salary_table_totals"],
+}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--count", type=int, default=20, help="letters per format")
+    ap.add_argument("--annex-paragraphs", type=int, default=200)
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args()
+
+    extractor, parser = TextExtractor(), FieldParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_corpus(tmp, count=args.count, annex_paragraphs=args.annex_paragraphs)
+        texts = [extractor.extract_text(doc["content"], doc["file_name"]) for doc in load_corpus(tmp)]
+    full = [parser.parse(extractor.split_sections(text))["fields"] for text in texts]
+
+    print(f"{len(texts)} documents, {sum(map(len, texts)) // len(texts)} chars on average")
+    print(f"{'selection':24} {'docs/s':>10} {'speedup':>8}")
+    baseline = None
+    for name, fields in SELECTIONS.items():
+        keys = required_sections(fields)
+        for text, expected in zip(texts, full):
+            got = parser.parse(extractor.split_sections(text, keys), fields)["fields"]
+            assert got == {k: v for k, v in expected.items() if fields is None or k in fields}, name
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for text in texts:
+                parser.parse(extractor.split_sections(text, keys), fields)
+        rate = args.rounds * len(texts) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{name:24} {rate:10.1f} {rate / baseline:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark for PDF line reconstruction: the NumPy words_to_text versus the
+pure-Python dict/sort reference, on generated word-heavy salary-table pages.
+Asserts byte-identical output before timing.
+
+Run from the backend directory:
+    python -m benchmarks.bench_layout [--rows N] [--cols N] [--repeat N]
+"""
+import random
+import argparse
+import fitz
+from extractor.layout import words_to_text, words_to_text_reference
+from benchmarks.bench_patterns import time_call
+
+
+def dense_page_words(rows: int, cols: int, seed: int = 1):
+    """Words of one page holding a rows x cols table with slightly jittered baselines."""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    page = doc.new_page(width=40 + cols * 85, height=40 + rows * 11)
+    for r in range(rows):
+        y = 20 + r * 11
+        for c in range(cols):
+            jitter = rng.choice([0, 0, 0.4, 1.1, -0.7])
+            page.insert_text((10 + c * 85, y + jitter), f"{rng.randint(1000, 999999):,}", fontsize=8)
+    return page.get_text("words")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rows", type=int, default=150)
+    ap.add_argument("--cols", type=int, default=14)
+    ap.add_argument("--repeat", type=int, default=100)
+    args = ap.parse_args()
+
+    print(f"{'words':>7} {'numpy us':>10} {'reference us':>13} {'speedup':>8}")
+    for rows in sorted({10, args.rows // 4, args.rows}):
+        words = dense_page_words(rows, args.cols)
+        assert words_to_text(words) == words_to_text_reference(words)
+        vectorised = time_call(lambda: words_to_text(words), args.repeat)
+        reference = time_call(lambda: words_to_text_reference(words), args.repeat)
+        print(f"{len(words):7} {vectorised:10.1f} {reference:13.1f} {reference / vectorised:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
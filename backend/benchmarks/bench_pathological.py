@@ -0,0 +1,83 @@
+"""
+Worst-case regex timings on pathological text: every registered pattern is
+searched in documents built to defeat it (long digit runs, repeated keywords
+with no amount, one very long line), and the full split + parse is timed on
+each. Every search runs under extractor.budget.time_budget, so a catastrophic
+pattern shows up as "> cap" instead of hanging the run.
+
+Run from the backend directory:
+    python -m benchmarks.bench_pathological [--chars N] [--cap SECONDS]
+"""
+import time
+import argparse
+from extractor.budget import DocumentTimeout, time_budget
+from extractor.field_parser import FieldParser
+from extractor.patterns import PATTERNS, list_patterns
+from extractor.text_extractor import TextExtractor
+
+
+def pathological_inputs(chars: int) -> dict:
+    """Adversarial documents of about chars characters, by name."""
+    def fill(unit: str) -> str:
+        return (unit * (chars // len(unit) + 1))[:chars]
+
+    return {
+        "digit run": fill("1,0"),
+        "spaced numbers": fill("1,00,000 "),
+        "bonus keywords": fill("Joining Bonus Retention Bonus "),
+        "equity keywords": fill("ESOP ESAR "),
+        "schedule labels": fill("Name Entity Department Sub Department "),
+        "currency no amount": fill("INR Rs. ₹ "),
+        "one long line": fill("lorem ipsum dolor sit amet "),
+        "many short lines": fill("Total CTC 1\n"),
+    }
+
+
+def timed_search(pattern, text: str, cap: float):
+    start = time.perf_counter()
+    try:
+        with time_budget(cap):
+            pattern.search(text)
+    except DocumentTimeout:
+        return None
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--chars", type=int, default=20000)
+    ap.add_argument("--cap", type=float, default=5.0, help="seconds before a search is abandoned")
+    ap.add_argument("--top", type=int, default=12, help="patterns to list, slowest first")
+    args = ap.parse_args()
+
+    inputs = pathological_inputs(args.chars)
+    worst = {}
+    for name in list_patterns():
+        for label, text in inputs.items():
+            seconds = timed_search(PATTERNS[name], text, args.cap)
+            seconds = float("inf") if seconds is None else seconds
+            if seconds > worst.get(name, (-1.0, ""))[0]:
+                worst[name] = (seconds, label)
+
+    def show(seconds: float) -> str:
+        return f"> {args.cap:g}s" if seconds == float("inf") else f"{seconds * 1000:.2f} ms"
+
+    print(f"worst search per pattern on {args.chars}-char inputs (slowest {args.top} of {len(worst)})")
+    for name, (seconds, label) in sorted(worst.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {name:36} {show(seconds):>12}  {label}")
+
+    extractor, parser = TextExtractor(), FieldParser()
+    print("\nsplit + parse per input")
+    for label, text in inputs.items():
+        start = time.perf_counter()
+        try:
+            with time_budget(args.cap):
+                parser.parse(extractor.split_sections(text))
+            seconds = time.perf_counter() - start
+        except DocumentTimeout:
+            seconds = float("inf")
+        print(f"  {label:36} {show(seconds):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Rule-iteration benchmark: processes a synthetic corpus once with a text store,
+as `python -m backend.extractor --text-store` would, then re-parses the stored
+text, and compares the docs/sec of both runs and the store's size on disk.
+
+Run from the backend directory:
+    python -m benchmarks.bench_reparse [--count N] [--workers N]
+"""
+import io
+import os
+import time
+import argparse
+import tempfile
+from extractor.cli import run
+from extractor.reparse import reparse
+from benchmarks.corpus import generate_corpus
+
+
+def directory_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--count", type=int, default=100, help="letters per format")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        letters, store = os.path.join(tmp, "letters"), os.path.join(tmp, "store")
+        generate_corpus(letters, count=args.count, salary_rows=12, annex_paragraphs=20, min_pages=3)
+        documents = 2 * args.count
+
+        start = time.perf_counter()
+        run([letters], os.path.join(tmp, "results.jsonl"), args.workers, progress_seconds=0, stream=io.StringIO(),
+            text_store=store)
+        extract_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reparse(store, os.path.join(tmp, "diff.jsonl"), args.workers, stream=io.StringIO())
+        reparse_seconds = time.perf_counter() - start
+
+        print(f"{documents} documents, {args.workers} workers")
+        print(f"{'extract + parse':16} {documents / extract_seconds:10.1f} docs/s")
+        print(f"{'reparse':16} {documents / reparse_seconds:10.1f} docs/s  ({extract_seconds / reparse_seconds:.1f}x)")
+        print(f"corpus {directory_bytes(letters) / 1024:.0f} KiB, text store {directory_bytes(store) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark for the header scan in TextExtractor.split_sections: the single-pass
+locator versus one re.finditer scan per header, on letters with growing annexures.
+
+Run from the backend directory:
+    python -m benchmarks.bench_sections [--repeat N]
+"""
+import re
+import argparse
+from extractor.config import SECTION_HEADERS
+from extractor.text_extractor import TextExtractor
+from benchmarks.bench_patterns import build_letter, time_call
+
+
+def find_headers_per_header(full_text: str):
+    found = []
+    for header, key in SECTION_HEADERS.items():
+        pattern = re.escape(header).replace(r'\ ', r'\s+')
+        for match in re.finditer(pattern, full_text, re.IGNORECASE):
+            found.append((match.start(), key))
+            break
+    return found
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=100)
+    args = ap.parse_args()
+
+    extractor = TextExtractor()
+    print(f"{'chars':>9} {'BYOD':>5} {'single pass us':>15} {'per header us':>14}")
+    for annex in (0, 50, 500, 2000):
+        for with_byod in (True, False):
+            # A missing section forces a scan to the end of the annexure
+            text = build_letter(annex)
+            if not with_byod:
+                text = text.replace("BYOD\n", "")
+            single = time_call(lambda: extractor._find_headers(text), args.repeat)
+            per_header = time_call(lambda: find_headers_per_header(text), args.repeat)
+            print(f"{len(text):9} {'yes' if with_byod else 'no':>5} {single:15.1f} {per_header:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
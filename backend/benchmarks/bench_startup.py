@@ -0,0 +1,95 @@
+"""
+Cold-start benchmark. Measures, each in a fresh interpreter, the import time of
+the API module and of every heavy dependency, then starts uvicorn and reports the
+time until /health first answers and the latency of the first and second /parse
+(which is where deferred imports are paid), with and without EXTRACTOR_WARM_UP.
+
+Run from the backend directory:
+    python -m benchmarks.bench_startup [--runs N]
+"""
+import os
+import sys
+import time
+import socket
+import random
+import argparse
+import tempfile
+import subprocess
+import statistics
+import httpx
+from benchmarks.corpus import build_letter, write_docx
+
+MODULES = ["main", "fitz", "docx", "dateparser", "numpy", "openpyxl", "pandas"]
+
+
+def import_seconds(module: str) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def sample_docx() -> bytes:
+    blocks, _ = build_letter(random.Random(1), "sales", salary_rows=6, annex_paragraphs=2, min_pages=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "letter.docx")
+        write_docx(blocks, path)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def cold_start(warm_up: bool, letter: bytes, timeout: float = 60.0):
+    """Seconds to first healthy /health, then to the first and second /parse."""
+    port = free_port()
+    env = dict(os.environ, EXTRACTOR_WARM_UP="1" if warm_up else "0", RESULT_CACHE_SIZE="0")
+    start = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+                              env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            while True:
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError("server did not become healthy")
+                try:
+                    if client.get("/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.01)
+            healthy = time.perf_counter() - start
+
+            parses = []
+            for _ in range(2):
+                t0 = time.perf_counter()
+                client.post("/parse", files=[("files", ("letter.docx", letter))]).raise_for_status()
+                parses.append(time.perf_counter() - t0)
+        return healthy, parses[0], parses[1]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'import':12} {'ms':>8}")
+    for module in MODULES:
+        ms = statistics.median(import_seconds(module) for _ in range(args.runs)) * 1000
+        print(f"{module:12} {ms:8.0f}")
+
+    letter = sample_docx()
+    print(f"\n{'warm-up':8} {'healthy ms':>11} {'1st parse ms':>13} {'2nd parse ms':>13}")
+    for warm_up in (False, True):
+        runs = [cold_start(warm_up, letter) for _ in range(args.runs)]
+        healthy, first, second = (statistics.median(col) * 1000 for col in zip(*runs))
+        print(f"{'on' if warm_up else 'off':8} {healthy:11.0f} {first:13.0f} {second:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Reproducible synthetic offer-letter corpus.
+
+Letters follow the two shapes modelled in tests/test_parser.py: the support
+template (no BYOD clause) and the sales/field template (BYOD, bonuses, ESOP).
+Page count, salary-table size and annexure length can be varied, and every
+letter is written as DOCX and/or PDF next to a manifest.json holding the values
+the parser is expected to find.
+
+Run from the backend directory:
+    python -m benchmarks.corpus OUT_DIR [--count N] [--seed N] [--formats docx,pdf]
+        [--salary-rows N] [--annex-paragraphs N] [--min-pages N]
+"""
+import os
+import json
+import random
+import argparse
+import textwrap
+from typing import Dict, Any, List, Tuple
+
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sara", "Vikram", "Anaya", "Ishaan", "Neha"]
+LAST_NAMES = ["Sharma", "Iyer", "Khan", "Das", "Mehta", "Reddy", "Bose", "Nair", "Gupta", "Singh"]
+LOCATIONS = [("Gurugram", "Haryana"), ("Rajkot", "Gujarat"), ("Pune", "Maharashtra"), ("Chennai", "Tamil Nadu")]
+SUPPORT_ROLES = ["Customer Support Executive", "Claims Associate", "Service Desk Analyst"]
+SALES_ROLES = ["Field Sales Manager", "Area Sales Executive", "Relationship Manager"]
+EXTRA_COMPONENTS = [
+    "Special Allowance", "Conveyance Allowance", "Medical Allowance", "Leave Travel Allowance",
+    "Telephone Reimbursement", "Fuel Reimbursement", "Meal Card", "Education Allowance",
+    "Uniform Allowance", "Shift Allowance", "Performance Incentive", "Night Shift Allowance",
+]
+ANNEX_SENTENCES = [
+    "The employee shall abide by the policies of the company as amended from time to time.",
+    "Leave entitlements are governed by the leave policy published on the intranet.",
+    "Confidential information must not be disclosed during or after employment.",
+    "The company may transfer the employee to any of its offices or group entities.",
+    "Working hours and weekly offs will be as per the requirements of the business.",
+]
+
+# A block is ("para", text), ("table", rows) or ("page_break", None)
+Block = Tuple[str, Any]
+
+
+def build_letter(rng: random.Random, template: str, salary_rows: int, annex_paragraphs: int,
+                 min_pages: int) -> Tuple[List[Block], Dict[str, Any]]:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    city, state = rng.choice(LOCATIONS)
+    designation = rng.choice(SALES_ROLES if template == "sales" else SUPPORT_ROLES)
+    day, month = rng.randint(1, 28), rng.randint(1, 12)
+    joining = f"{day:02d}-{month:02d}-2025"
+    grade = f"{rng.randint(1, 4)}.{rng.randint(1, 3)}"
+
+    components = [("Basic", rng.randint(10, 40) * 12000), ("HRA", rng.randint(5, 20) * 12000)]
+    for comp in rng.sample(EXTRA_COMPONENTS, min(max(0, salary_rows - 2), len(EXTRA_COMPONENTS))):
+        components.append((comp, rng.randint(1, 10) * 12000))
+    gross = sum(amount for _, amount in components)
+    pf = 21600
+    total = gross + pf
+
+    def amount(value: int) -> str:
+        return f"{value:,}"
+
+    sections: List[List[Block]] = []
+    sections.append([
+        ("para", "OFFER LETTER"),
+        ("para", f"Dear {name},"),
+        ("para", f"We are pleased to offer you the position of {designation} at Plot No. 12, Sector 20, {city}, {state}, India."),
+        ("para", f"Your employment will be effective from your {joining} and you will be on probation for a period of 6 months."),
+    ])
+    compensation = [
+        ("para", "Compensation & Benefits"),
+        ("para", f"Your total annual compensation of INR {amount(total)} per annum."),
+    ]
+    expected = {
+        "designation": designation,
+        "location_city": city,
+        "location_state": state,
+        "date_of_joining_norm": f"2025-{month:02d}-{day:02d}",
+        "comp_total_annual_inr": total,
+        "byod_clause": "No",
+        "scheduleA_grade": grade,
+        "salary_rows": len(components) + 4,
+    }
+    if template == "sales":
+        joining_bonus = rng.randint(2, 10) * 10000
+        compensation.append(("para", "ESOP:"))
+        compensation.append(("para", "You are also entitled to the ESOP program and will be offered ESOPs worth total of INR 500000 at Fair Market Value."))
+        compensation.append(("para", "Joining Bonus:"))
+        compensation.append(("para", f"You will receive Rs {amount(joining_bonus)} as a Joining Bonus in your first paycheck."))
+        expected.update(bonus_joining_inr=joining_bonus, esop_amount_inr=500000, byod_clause="Yes")
+    sections.append(compensation)
+    if template == "sales":
+        sections.append([("para", "BYOD"), ("para", "You are required to bring your own device for field work.")])
+    if annex_paragraphs:
+        sections.append([("para", "Additional Terms and Conditions")] + [
+            ("para", " ".join(rng.choice(ANNEX_SENTENCES) for _ in range(4))) for _ in range(annex_paragraphs)
+        ])
+    sections.append([
+        ("para", "Schedule A"),
+        ("table", [["Name", name], ["Designation", designation], ["Entity", "GFPL"],
+                   ["Department", "Operations"], ["Sub-Department", "Customer Excellence"],
+                   ["Band", grade.split(".")[0]], ["Grade", grade]]),
+    ])
+    salary = [[comp, amount(value), amount(value // 12)] for comp, value in components]
+    salary += [["(A) Gross Salary", amount(gross), amount(gross // 12)],
+               ["Provident Fund", amount(pf), amount(pf // 12)],
+               ["(B) Long Term Benefits", amount(pf), amount(pf // 12)],
+               ["Total CTC", amount(total), amount(total // 12)]]
+    sections.append([("para", "SALARY COMPUTATION"), ("table", salary)])
+    sections.append([
+        ("para", "ACCEPTANCE OF OFFER TERMS AND CONDITIONS"),
+        ("para", f"Date of Joining: {joining.replace('-', '/')}"),
+        ("para", f"Signature: {name}"),
+    ])
+
+    # Spread sections over extra pages until the requested page count is reachable
+    blocks: List[Block] = []
+    breaks = max(0, min_pages - 1)
+    for i, section in enumerate(sections):
+        if i and breaks:
+            blocks.append(("page_break", None))
+            breaks -= 1
+        blocks.extend(section)
+    return blocks, expected
+
+
+def write_docx(blocks: List[Block], path: str) -> None:
+    import docx
+    from docx.enum.text import WD_BREAK
+
+    document = docx.Document()
+    for kind, value in blocks:
+        if kind == "para":
+            document.add_paragraph(value)
+        elif kind == "table":
+            table = document.add_table(rows=len(value), cols=len(value[0]))
+            for row, cells in zip(table.rows, value):
+                for cell, text in zip(row.cells, cells):
+                    cell.text = text
+        else:
+            document.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+    document.save(path)
+
+
+def write_pdf(blocks: List[Block], path: str) -> None:
+    import fitz
+
+    width, height, margin, leading = 595, 842, 50, 14
+    column_x = [margin, 330, 450]
+    doc = fitz.open()
+    page = doc.new_page(width=width, height=height)
+    y = margin
+
+    def next_line():
+        nonlocal page, y
+        y += leading
+        if y > height - margin:
+            page = doc.new_page(width=width, height=height)
+            y = margin + leading
+
+    for kind, value in blocks:
+        if kind == "page_break":
+            page = doc.new_page(width=width, height=height)
+            y = margin
+        elif kind == "para":
+            for line in textwrap.wrap(value, 90) or [""]:
+                next_line()
+                page.insert_text((margin, y), line, fontsize=10)
+        else:
+            for cells in value:
+                next_line()
+                for x, text in zip(column_x, cells):
+                    page.insert_text((x, y), text, fontsize=10)
+    doc.save(path)
+    doc.close()
+
+
+def generate_corpus(out_dir: str, count: int = 20, seed: int = 42, formats=("docx", "pdf"),
+                    salary_rows: int = 6, annex_paragraphs: int = 5, min_pages: int = 1) -> List[Dict[str, Any]]:
+    """
+    Writes count letters per format into out_dir plus manifest.json, and returns the manifest.
+    The same arguments always produce the same letters.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    manifest = []
+    for i in range(count):
+        template = "sales" if i % 2 else "support"
+        blocks, expected = build_letter(rng, template, salary_rows, annex_paragraphs, min_pages)
+        for fmt in formats:
+            file_name = f"offer_{i:05d}_{template}.{fmt}"
+            (write_docx if fmt == "docx" else write_pdf)(blocks, os.path.join(out_dir, file_name))
+            manifest.append({"file_name": file_name, "template": template, "expected": expected})
+
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("out_dir")
+    ap.add_argument("--count", type=int, default=20, help="Letters per format")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--formats", default="docx,pdf")
+    ap.add_argument("--salary-rows", type=int, default=6, help="Salary components before the totals")
+    ap.add_argument("--annex-paragraphs", type=int, default=5)
+    ap.add_argument("--min-pages", type=int, default=1, help="Spread sections over at least this many pages")
+    args = ap.parse_args()
+
+    manifest = generate_corpus(args.out_dir, args.count, args.seed, tuple(args.formats.split(",")),
+                               args.salary_rows, args.annex_paragraphs, args.min_pages)
+    print(f"Wrote {len(manifest)} letters to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Per-stage throughput benchmark over a synthetic (or existing) offer-letter corpus.
+
+Times TextExtractor.extract_text (split by PDF/DOCX), TextExtractor.split_document
+and FieldParser.parse per document, then the end-to-end POST /parse through the
+FastAPI test client. Reports docs/sec and p50/p95/p99 latencies, checks parsed
+values against the corpus manifest, and writes machine-readable results so runs
+can be compared.
+
+Run from the backend directory:
+    python -m benchmarks.run [--corpus DIR | --count N ...] [--out results.json] [--compare baseline.json]
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+from typing import Dict, Any, List
+from extractor.text_extractor import TextExtractor
+from extractor.field_parser import FieldParser
+from benchmarks.corpus import generate_corpus
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    total = sum(samples)
+    return {
+        "count": len(samples),
+        "total_seconds": total,
+        "docs_per_sec": len(samples) / total if total else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def load_corpus(corpus_dir: str):
+    with open(os.path.join(corpus_dir, "manifest.json")) as f:
+        manifest = json.load(f)
+    for entry in manifest:
+        with open(os.path.join(corpus_dir, entry["file_name"]), "rb") as f:
+            entry["content"] = f.read()
+    return manifest
+
+
+def check_fields(fields: Dict[str, Any], expected: Dict[str, Any]) -> int:
+    """Number of expected values the parser got wrong."""
+    misses = 0
+    for key, value in expected.items():
+        got = len(fields.get("salary_table_rows", [])) if key == "salary_rows" else fields.get(key)
+        misses += got != value
+    return misses
+
+
+def bench_stages(docs, rounds: int) -> Dict[str, Any]:
+    extractor = TextExtractor()
+    parser = FieldParser()
+    timings = {"extract_text.pdf": [], "extract_text.docx": [], "split_sections": [], "parse": [], "pipeline": []}
+    checked = misses = 0
+
+    for round_no in range(rounds):
+        for doc in docs:
+            kind = "pdf" if doc["file_name"].endswith(".pdf") else "docx"
+            t0 = time.perf_counter()
+            text = extractor.extract_text(doc["content"], doc["file_name"])
+            t1 = time.perf_counter()
+            document = extractor.split_document(text)
+            t2 = time.perf_counter()
+            parsed = parser.parse(document)
+            t3 = time.perf_counter()
+
+            timings[f"extract_text.{kind}"].append(t1 - t0)
+            timings["split_sections"].append(t2 - t1)
+            timings["parse"].append(t3 - t2)
+            timings["pipeline"].append(t3 - t0)
+            if round_no == 0:
+                checked += len(doc["expected"])
+                misses += check_fields(parsed["fields"], doc["expected"])
+
+    stages = {name: summarize(samples) for name, samples in timings.items() if samples}
+    stages["accuracy"] = {"checked": checked, "wrong": misses}
+    return stages
+
+
+def bench_api(docs, batch_size: int) -> Dict[str, Any]:
+    from fastapi.testclient import TestClient
+    import main as api
+    from extractor.cache import ResultCache
+
+    # Measure real work, not cache hits from the stage benchmark or earlier batches
+    api.runner.cache = ResultCache(max_entries=0)
+    latencies = []
+    start = time.perf_counter()
+    with TestClient(api.app) as client:
+        for i in range(0, len(docs), batch_size):
+            batch = docs[i:i + batch_size]
+            files = [("files", (d["file_name"], d["content"], "application/octet-stream")) for d in batch]
+            t0 = time.perf_counter()
+            response = client.post("/parse", files=files)
+            latencies.append(time.perf_counter() - t0)
+            response.raise_for_status()
+    wall = time.perf_counter() - start
+
+    result = summarize(latencies)
+    result["docs"] = len(docs)
+    result["batch_size"] = batch_size
+    result["docs_per_sec"] = len(docs) / wall if wall else 0.0
+    return result
+
+
+def print_report(results: Dict[str, Any], baseline: Dict[str, Any] = None) -> None:
+    print(f"{'stage':20} {'docs/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = dict(results["stages"])
+    rows.pop("accuracy")
+    rows["api /parse (batch)"] = results["api"]
+    base_rows = {}
+    if baseline:
+        base_rows = dict(baseline["stages"])
+        base_rows["api /parse (batch)"] = baseline["api"]
+    for name, row in rows.items():
+        line = f"{name:20} {row['docs_per_sec']:10.1f} {row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {row['p99_ms']:9.2f}"
+        if name in base_rows and base_rows[name]["p50_ms"]:
+            line += f"   p50 {row['p50_ms'] / base_rows[name]['p50_ms']:.2f}x of baseline"
+        print(line)
+    accuracy = results["stages"]["accuracy"]
+    print(f"\nmanifest check: {accuracy['checked'] - accuracy['wrong']}/{accuracy['checked']} expected values matched")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--corpus", help="Existing corpus directory (with manifest.json)")
+    ap.add_argument("--count", type=int, default=20, help="Letters per format when generating")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--salary-rows", type=int, default=6)
+    ap.add_argument("--annex-paragraphs", type=int, default=5)
+    ap.add_argument("--min-pages", type=int, default=1)
+    ap.add_argument("--rounds", type=int, default=3, help="Passes over the corpus for stage timings")
+    ap.add_argument("--batch-size", type=int, default=120)
+    ap.add_argument("--out", help="Write results JSON here")
+    ap.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = ap.parse_args()
+
+    corpus_args = {"count": args.count, "seed": args.seed, "salary_rows": args.salary_rows,
+                   "annex_paragraphs": args.annex_paragraphs, "min_pages": args.min_pages}
+    if args.corpus:
+        docs = load_corpus(args.corpus)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_corpus(tmp, **corpus_args)
+            docs = load_corpus(tmp)
+
+    results = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "corpus": args.corpus or corpus_args,
+        "documents": len(docs),
+        "stages": bench_stages(docs, args.rounds),
+        "api": bench_api(docs, args.batch_size),
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .config import ANCHOR_FIELDS, FIELD_CONFIG, MULTIPLIERS
+from .patterns import PATTERNS, compile_anchor_pattern
+
+# Anchors up to this length ("To", "VP", "DOJ", "Mr.") only count with the case given in FIELD_CONFIG
+CASE_SENSITIVE_MAX_LEN = 3
+
+# Characters after an anchor searched for a typed value (amount, duration)
+VALUE_WINDOW = 120
+
+# A free-text value is only read after an anchor that is a label (followed by a
+# separator or starting a line) or a phrase ending in one of these words
+PHRASE_ENDINGS = {"of", "as", "to", "at", "by", "from", "on", "for", "with", "in"}
+
+WORD_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+                "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12}
+
+
+def normalize_amount(text: str, multipliers: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """
+    INR value of a currency expression such as "INR 7,29,600", "7.5 Lakhs" or
+    "Rs. 1.2 Cr", scaled by the matching MULTIPLIERS word.
+    """
+    multipliers = MULTIPLIERS if multipliers is None else multipliers
+    match = PATTERNS["anchors.amount"].search(text)
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", ""))
+    unit = (match.group(2) or "").lower()
+    return int(round(value * multipliers.get(unit, 1)))
+
+
+def _is_label(text: str, start: int, end: int, anchor: str) -> bool:
+    if PATTERNS["anchors.separator"].match(text, end):
+        return True
+    line_start = text.rfind("\n", 0, start) + 1
+    return not text[line_start:start].strip() or anchor.rsplit(" ", 1)[-1] in PHRASE_ENDINGS
+
+
+def read_text(text: str, start: int, end: int, anchor: str) -> Optional[str]:
+    """The rest of the line (up to a comma, semicolon or sentence end) after a label."""
+    if not _is_label(text, start, end, anchor):
+        return None
+    match = PATTERNS["anchors.text_value"].match(text, end)
+    if not match:
+        return None
+    value = re.split(r'\.(?:\s|$)', match.group(1), 1)[0].strip(" .")
+    return value or None
+
+
+def read_name(text: str, start: int, end: int, anchor: str) -> Optional[str]:
+    """Two to four capitalised words right after the anchor ("Dear Jane Smith", "Name: Mr. A B")."""
+    match = PATTERNS["anchors.name_value"].match(text, end)
+    return match.group(1) if match else None
+
+
+def read_amount(text: str, start: int, end: int, anchor: str) -> Optional[int]:
+    """The first currency amount within VALUE_WINDOW characters, in INR."""
+    match = PATTERNS["anchors.currency"].search(text, end, end + VALUE_WINDOW)
+    return normalize_amount(match.group()) if match else None
+
+
+def read_duration(text: str, start: int, end: int, anchor: str) -> Optional[str]:
+    """
+    The first duration within VALUE_WINDOW characters, as "<n> <unit>s", or else
+    one that runs into the anchor ("60 days notice", "two months' notice").
+    """
+    pattern = PATTERNS["anchors.duration"]
+    match = pattern.search(text, end, end + VALUE_WINDOW)
+    if not match:
+        before = [m for m in pattern.finditer(text, max(0, start - 24), end)
+                  if m.end() > start or not text[m.end():start].strip(" '’")]
+        if not before:
+            return None
+        match = before[-1]
+    count = match.group(1).lower()
+    count = WORD_NUMBERS[count] if count in WORD_NUMBERS else int(count)
+    unit = match.group(2).lower()
+    return f"{count} {unit}{'s' if count != 1 else ''}"
+
+
+# How the value after each anchor field's anchors is read; other fields use read_text
+VALUE_READERS: Dict[str, Callable[[str, int, int, str], Any]] = {
+    "candidate_name": read_name,
+    "ctc": read_amount,
+    "probation_period": read_duration,
+    "notice_period": read_duration,
+}
+
+
+class AnchorEngine:
+    """
+    Label-anchored field extraction driven by config.FIELD_CONFIG, by default for
+    config.ANCHOR_FIELDS only. The anchors of those fields are compiled into one
+    pattern (see patterns.compile_anchor_pattern) and located in a single scan of
+    the text; other fields' anchors are not searched for. For each requested field, its hits
+    are then tried in the order the anchors are listed in FIELD_CONFIG (most
+    specific first), earliest hit first, until a value can be read after one.
+    """
+
+    def __init__(self, field_config: Optional[Dict[str, List[str]]] = None):
+        if field_config is None:
+            self.field_config = {field: FIELD_CONFIG[field] for field in ANCHOR_FIELDS}
+            self._pattern = PATTERNS["anchors.fields"]
+        else:
+            self.field_config = field_config
+            self._pattern = compile_anchor_pattern([a for anchors in field_config.values() for a in anchors])
+        # Matched anchor (lowercased, single-spaced) -> [(field, priority)]
+        self._fields: Dict[str, List[Tuple[str, int]]] = {}
+        # Short anchors that must match case-sensitively -> the anchor as configured
+        self._exact: Dict[str, str] = {}
+        for field, anchors in self.field_config.items():
+            for priority, anchor in enumerate(anchors):
+                key = " ".join(anchor.lower().split())
+                self._fields.setdefault(key, []).append((field, priority))
+                if len(anchor) <= CASE_SENSITIVE_MAX_LEN:
+                    self._exact[key] = anchor
+        self._pattern_ci = None
+
+    def hits(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yields (start, end, anchor) for every anchor occurrence, in one scan."""
+        search_text = text.lower()
+        pattern = self._pattern
+        if len(search_text) != len(text):
+            # A few characters change length when lowercased, which would shift offsets
+            if self._pattern_ci is None:
+                self._pattern_ci = re.compile(pattern.pattern, re.IGNORECASE)
+            search_text, pattern = text, self._pattern_ci
+
+        for match in pattern.finditer(search_text):
+            anchor = " ".join(match.group().lower().split())
+            if anchor in self._exact and text[match.start():match.end()] != self._exact[anchor]:
+                continue
+            yield match.start(), match.end(), anchor
+
+    def extract(self, text: str, fields: Optional[List[str]] = None) -> Dict[str, Tuple[Any, float, str]]:
+        """
+        (value, confidence, method) for each requested field (default: every field in
+        the config). Values read after a label separator get confidence 0.9, others 0.7.
+        """
+        wanted = list(self.field_config) if fields is None else fields
+        candidates: Dict[str, List[Tuple[int, int, int, str]]] = {field: [] for field in wanted}
+        for start, end, anchor in self.hits(text):
+            for field, priority in self._fields[anchor]:
+                if field in candidates:
+                    candidates[field].append((priority, start, end, anchor))
+
+        results = {}
+        for field in wanted:
+            read = VALUE_READERS.get(field, read_text)
+            results[field] = (None, 0.0, "missing")
+            for priority, start, end, anchor in sorted(candidates[field]):
+                value = read(text, start, end, anchor)
+                if value is not None:
+                    labeled = PATTERNS["anchors.separator"].match(text, end) is not None
+                    results[field] = (value, 0.9 if labeled else 0.7, "anchor")
+                    break
+        return results
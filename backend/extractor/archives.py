@@ -0,0 +1,97 @@
+import io
+import zipfile
+import threading
+from typing import Iterator
+from . import config
+from .uploads import SpooledUpload
+
+SUPPORTED_EXTENSIONS = (".docx", ".pdf")
+
+
+class ArchiveMemberTooLarge(ValueError):
+    pass
+
+
+def is_archive(filename: str) -> bool:
+    return filename.lower().endswith(".zip")
+
+
+def is_supported(filename: str) -> bool:
+    return filename.lower().endswith(SUPPORTED_EXTENSIONS)
+
+
+class Archive:
+    """
+    An uploaded ZIP archive. Members are decompressed one at a time, when they are
+    spooled for processing, so the archive is never unpacked as a whole. The
+    archive's own upload is discarded once every member has been spooled or dropped
+    and the creator has called release() for its own reference.
+    """
+
+    def __init__(self, upload: SpooledUpload):
+        self.upload = upload
+        source = upload.source
+        self._zip = zipfile.ZipFile(source if isinstance(source, str) else io.BytesIO(source))
+        self._lock = threading.Lock()
+        self._pending = 1
+
+    def members(self) -> Iterator[zipfile.ZipInfo]:
+        """
+        File entries in archive order, skipping directories and macOS resource forks.
+        """
+        for info in self._zip.infolist():
+            if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                continue
+            yield info
+
+    def member(self, info: zipfile.ZipInfo) -> "ArchiveMember":
+        with self._lock:
+            self._pending += 1
+        return ArchiveMember(self, info)
+
+    def release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._pending > 0:
+                return
+        self.close()
+
+    def close(self) -> None:
+        self._zip.close()
+        self.upload.discard()
+
+
+class ArchiveMember:
+    """
+    A supported file inside an Archive, read lazily. spool() decompresses it into
+    a SpooledUpload, enforcing the per-file size limit on the bytes actually
+    produced rather than on the size the archive declares.
+    """
+
+    def __init__(self, archive: Archive, info: zipfile.ZipInfo):
+        self.archive = archive
+        self.info = info
+        self._released = False
+
+    def spool(self) -> SpooledUpload:
+        upload = SpooledUpload()
+        try:
+            with self.archive._zip.open(self.info) as member:
+                while True:
+                    chunk = member.read(config.UPLOAD_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    if upload.size + len(chunk) > config.MAX_FILE_SIZE_BYTES:
+                        raise ArchiveMemberTooLarge("File exceeds 10MB limit.")
+                    upload.write(chunk)
+            return upload.finish()
+        except Exception:
+            upload.discard()
+            raise
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        if not self._released:
+            self._released = True
+            self.archive.release()
@@ -0,0 +1,52 @@
+"""
+Per-document time budget. Extraction is CPU-bound (regex scans over the whole
+document, PDF layout), so the budget is enforced with a SIGALRM interval timer:
+its handler raises DocumentTimeout in the middle of whatever is running, including
+a long regex search. Signals are only delivered to the main thread, so elsewhere
+(test clients, or job threads whose documents DocumentRunner could not send to its
+process pool) the budget is not enforced. Platforms without setitimer (Windows)
+never enforce it.
+"""
+import signal
+import threading
+from contextlib import contextmanager
+
+
+class DocumentTimeout(BaseException):
+    """
+    Raised when a document exceeds its time budget. A BaseException, like
+    KeyboardInterrupt, so the extractors' `except Exception` fallbacks cannot
+    swallow it and carry on.
+    """
+
+
+def supported() -> bool:
+    return hasattr(signal, "setitimer")
+
+
+def can_enforce() -> bool:
+    return supported() and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def time_budget(seconds: float):
+    """Raises DocumentTimeout in the body once it has run for seconds (<= 0: no budget)."""
+    if seconds <= 0 or not can_enforce():
+        yield
+        return
+
+    active = True
+
+    def expire(signum, frame):
+        # The timer may fire just after the body finished, before it is cancelled
+        if active:
+            raise DocumentTimeout(f"exceeded the {seconds:g}s time budget")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        active = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL if previous is None else previous)
@@ -0,0 +1,141 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from . import config
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_rules_version = None
+
+
+def rules_version() -> str:
+    """
+    Fingerprint of the extraction rules: a hash over every module in this package.
+    Any edit to a regex, a section header or the pipeline invalidates cached results.
+    """
+    global _rules_version
+    if _rules_version is None:
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(_PACKAGE_DIR)):
+            if name.endswith(".py"):
+                digest.update(name.encode())
+                with open(os.path.join(_PACKAGE_DIR, name), "rb") as f:
+                    digest.update(f.read())
+        _rules_version = digest.hexdigest()[:16]
+    return _rules_version
+
+
+# config settings, set from the environment, that change what is extracted from a file
+RESULT_SETTINGS = ("PDF_EARLY_STOP", "PDF_REQUIRED_SECTIONS", "PDF_TRAILING_PAGES", "PDF_MAX_PAGES", "DOCX_ENGINE")
+
+
+def settings_version() -> str:
+    """
+    Fingerprint of the RESULT_SETTINGS values, read on every call. Unlike the rules
+    they can differ between runs sharing one SQLite cache, so a result extracted
+    with other page limits or another DOCX engine is never served.
+    """
+    values = json.dumps([getattr(config, name) for name in RESULT_SETTINGS])
+    return hashlib.sha256(values.encode()).hexdigest()[:8]
+
+
+class ResultCache:
+    """
+    Content-addressed cache of per-file results.
+    Tier 1 is an in-process LRU bounded by entry count, tier 2 an optional SQLite
+    file that survives restarts. Entries are stored as JSON so callers always
+    receive a private copy.
+    """
+
+    # Results that depend on something other than the file content are not cached
+    UNCACHEABLE_ERRORS = {"UNKNOWN_ERROR", "FILE_TOO_LARGE", "TIMEOUT"}
+
+    def __init__(self, max_entries: int = 1024, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.counters = {"hits": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self._db is not None
+
+    @staticmethod
+    def key(content: Optional[bytes], filename: str, digest: Optional[str] = None,
+            fields: Optional[List[str]] = None) -> str:
+        """
+        digest is the content's SHA-256 hex digest when the caller already has it
+        (uploads hash their bytes while they are read); content is ignored then.
+        A field selection gets its own entry, apart from the full result.
+        """
+        # The extension decides which extractor runs, so it is part of the key
+        ext = os.path.splitext(filename.lower())[1]
+        if digest is None:
+            digest = hashlib.sha256(content).hexdigest()
+        key = f"{digest}:{ext}:{rules_version()}:{settings_version()}"
+        if fields:
+            key += ":" + ",".join(sorted(fields))
+        return key
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.counters["hits"] += 1
+                self.counters["memory_hits"] += 1
+                return json.loads(value)
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row:
+                    self._remember(key, row[0])
+                    self.counters["hits"] += 1
+                    self.counters["disk_hits"] += 1
+                    return json.loads(row[0])
+
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: str, file_result: Dict[str, Any]) -> None:
+        if file_result.get("error_code") in self.UNCACHEABLE_ERRORS:
+            return
+        # Copy first: in process mode the result may be handed to the caller while this runs
+        entry = dict(file_result)
+        for k in ("file_name", "cache_hit", "timings"):
+            entry.pop(k, None)
+        value = json.dumps(entry)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", (key, value))
+                self._db.commit()
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.max_entries <= 0:
+            return
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats["entries"] = len(self._lru)
+            stats["max_entries"] = self.max_entries
+            stats["persistent"] = self._db is not None
+            stats["rules_version"] = rules_version()
+            stats["settings_version"] = settings_version()
+            return stats
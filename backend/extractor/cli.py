@@ -0,0 +1,219 @@
+"""
+Headless batch extraction: runs the extract -> split -> parse pipeline over a
+directory tree or glob and appends one JSON line per file to an output file.
+
+    python -m backend.extractor LETTERS_DIR 'archive/**/*.pdf' -o results.jsonl [--workers N] [--parquet DIR]
+
+Each line has the same shape as a /parse file_result, with the file's path as
+file_name. Files already present in the output are skipped, so an interrupted
+run resumes where it stopped when started again with the same arguments.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterator, List, Optional, Set, TextIO
+from . import config
+from .archives import is_supported
+from .pipeline import new_summary, process_document, tally, warm_up
+from .field_parser import select_fields
+
+# Documents submitted to the pool per worker; keeps the pool busy without
+# queueing the whole corpus
+PENDING_PER_WORKER = 4
+
+
+def find_files(inputs: List[str]) -> Iterator[str]:
+    """
+    DOCX and PDF files under each input, which is a file, a directory (walked
+    recursively) or a glob pattern (** matches across directories), in sorted order.
+    A file reached through several inputs is yielded once.
+    """
+    seen = set()
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            paths = []
+            for root, dirs, files in os.walk(pattern):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files))
+        elif os.path.isfile(pattern):
+            paths = [pattern]
+        else:
+            paths = sorted(glob.glob(pattern, recursive=True))
+        for path in paths:
+            if is_supported(path) and os.path.isfile(path) and path not in seen:
+                seen.add(path)
+                yield path
+
+
+def done_files(output: str) -> Set[str]:
+    """
+    file_name of every complete record in an existing output file. A trailing
+    partial line, left by an interrupted run, is cut off so appending stays valid.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, "rb+") as f:
+        complete = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            complete += len(line)
+            try:
+                done.add(json.loads(line)["file_name"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        f.truncate(complete)
+    return done
+
+
+class JsonlRecords:
+    """The records of a JSONL output file, re-read from disk on every iteration."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self) -> Iterator[dict]:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def write_parquet_tables(output: str, out_dir: str, include_confidence: bool = False) -> List[str]:
+    """
+    Converts a JSONL output file into out_dir/<table>.parquet for every Parquet
+    export table, streaming the records from disk. Returns the paths written.
+    """
+    from .exports import PARQUET_TABLES, write_parquet
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for table in PARQUET_TABLES:
+        path = os.path.join(out_dir, f"{table}.parquet")
+        write_parquet(JsonlRecords(output), path, table, include_confidence)
+        paths.append(path)
+    return paths
+
+
+class Progress:
+    """Prints files done, throughput and failures to a stream every interval seconds."""
+
+    def __init__(self, total: int, skipped: int, interval: float, stream: TextIO):
+        self.total = total
+        self.skipped = skipped
+        self.interval = interval
+        self.stream = stream
+        self.summary = new_summary()
+        self.done = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def add(self, file_result) -> None:
+        tally(self.summary, file_result)
+        self.done += 1
+        now = time.perf_counter()
+        if self.interval and now - self._last >= self.interval:
+            self._last = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        elapsed = time.perf_counter() - self.start
+        rate = self.done / elapsed if elapsed else 0.0
+        failed = self.done - self.summary["success"]
+        label = "done" if final else "progress"
+        print(f"{label}: {self.done}/{self.total} files, {rate:.1f} files/s, {failed} failed, "
+              f"{self.skipped} skipped, {elapsed:.1f}s", file=self.stream, flush=True)
+
+
+def run_all(fn: Callable, calls: List[tuple], workers: int, initializer: Optional[Callable] = None,
+            initargs: tuple = ()) -> Iterator[Any]:
+    """
+    Yields fn(*args) for every args in calls, in completion order, from a pool of
+    workers processes (workers=0 calls fn in this process, after initializer). At
+    most PENDING_PER_WORKER calls per worker are submitted ahead of the results.
+    """
+    if workers <= 0:
+        if initializer is not None:
+            initializer(*initargs)
+        for args in calls:
+            yield fn(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = set()
+        for args in calls:
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+            pending.add(pool.submit(fn, *args))
+        for future in wait(pending).done:
+            yield future.result()
+
+
+def _init_worker(text_store: Optional[str]) -> None:
+    if text_store:
+        config.TEXT_STORE_DIR = text_store
+    if config.WARM_UP:
+        warm_up()
+
+
+def run(inputs: List[str], output: str, workers: int, progress_seconds: float = 5.0,
+        stream: TextIO = sys.stderr, text_store: Optional[str] = None, fields: Optional[List[str]] = None) -> dict:
+    """
+    Processes every new file and returns the batch summary of this run. workers=0
+    runs the pipeline in this process. text_store keeps the extracted text there
+    (overriding TEXT_STORE_DIR) for later re-parsing. fields limits extraction to
+    those fields.
+    """
+    done = done_files(output)
+    paths = [path for path in find_files(inputs) if path not in done]
+    progress = Progress(len(paths), len(done), progress_seconds, stream)
+
+    previous_store = config.TEXT_STORE_DIR
+    try:
+        with open(output, "a", encoding="utf-8") as out:
+            for file_result in run_all(process_document, [(path, path, fields) for path in paths], workers,
+                                       initializer=_init_worker, initargs=(text_store,)):
+                progress.add(file_result)
+                out.write(json.dumps(file_result, ensure_ascii=False) + "\n")
+                out.flush()
+    finally:
+        config.TEXT_STORE_DIR = previous_store
+
+    progress.report(final=True)
+    progress.summary["processing_seconds"] = round(time.perf_counter() - progress.start, 2)
+    return progress.summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m backend.extractor",
+                                 description="Extract offer letter fields from DOCX/PDF files into JSONL.")
+    ap.add_argument("inputs", nargs="+", help="files, directories or glob patterns")
+    ap.add_argument("-o", "--output", required=True, help="JSONL file to append results to")
+    ap.add_argument("--workers", type=int, default=config.WORKER_COUNT,
+                    help="worker processes (default: EXTRACTOR_WORKERS or CPU count; 0 = no pool)")
+    ap.add_argument("--progress-seconds", type=float, default=5.0,
+                    help="seconds between progress lines (0 = only the final line)")
+    ap.add_argument("--text-store", metavar="DIR", default=config.TEXT_STORE_DIR,
+                    help="keep the extracted text there for `python -m backend.extractor.reparse` (default: TEXT_STORE_DIR)")
+    ap.add_argument("--fields", help="comma-separated fields to extract (default: all); only their extractors run")
+    ap.add_argument("--parquet", metavar="DIR",
+                    help="afterwards, also write every result in the output as DIR/fields.parquet and DIR/salary_rows.parquet")
+    ap.add_argument("--include-confidence", action="store_true",
+                    help="add confidence_<field> and method_<field> columns to the Parquet fields table")
+    args = ap.parse_args(argv)
+    try:
+        fields = select_fields(args.fields.split(",")) if args.fields else None
+    except ValueError as e:
+        ap.error(str(e))
+
+    run(args.inputs, args.output, args.workers, args.progress_seconds, text_store=args.text_store, fields=fields)
+    if args.parquet:
+        for path in write_parquet_tables(args.output, args.parquet, args.include_confidence):
+            print(f"wrote {path}", file=sys.stderr)
+    return 0
@@ -1,14 +1,98 @@
+import os
 import re
 
-SECTION_HEADERS = [
-    "OFFER LETTER",
-    "Compensation & Benefits",
-    "Additional Terms and Conditions",
-    "BYOD",
-    "Schedule A",
-    "SALARY COMPUTATION",
-    "ACCEPTANCE OF OFFER TERMS AND CONDITIONS"
-]
+# Upload limits enforced by the API
+MAX_FILES_PER_REQUEST = 120
+MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024
+
+# ZIP uploads are expanded into their members, each limited to MAX_FILE_SIZE_BYTES.
+# Archive members do not count towards MAX_FILES_PER_REQUEST.
+MAX_ARCHIVE_SIZE_BYTES = int(os.environ.get("MAX_ARCHIVE_SIZE_BYTES", str(512 * 1024 * 1024)))
+MAX_ARCHIVE_MEMBERS = int(os.environ.get("MAX_ARCHIVE_MEMBERS", "5000"))
+
+# Uploads are parsed from the request body as it arrives, and a file stops being
+# stored once it crosses its size limit. Files up to UPLOAD_SPOOL_MEMORY_BYTES stay
+# in memory; larger ones are spooled to a temporary file in UPLOAD_SPOOL_DIR
+# (default: the system temp dir) and opened by path. Archive members are read in
+# UPLOAD_CHUNK_BYTES chunks.
+UPLOAD_CHUNK_BYTES = 256 * 1024
+UPLOAD_SPOOL_MEMORY_BYTES = int(os.environ.get("UPLOAD_SPOOL_MEMORY_BYTES", str(1024 * 1024)))
+UPLOAD_SPOOL_DIR = os.environ.get("UPLOAD_SPOOL_DIR") or None
+
+# How the per-file extract -> split -> parse pipeline is executed.
+# "inline" runs files one after another inside the request handler,
+# "process" fans them out over a pool of worker processes.
+EXECUTION_MODE = os.environ.get("EXTRACTOR_EXECUTION_MODE", "inline").lower()
+WORKER_COUNT = int(os.environ.get("EXTRACTOR_WORKERS", "0")) or (os.cpu_count() or 1)
+# Documents submitted to the process pool but not finished yet; further submissions
+# wait, which bounds the spooled bytes held for large batches and archives.
+MAX_PENDING_DOCUMENTS = int(os.environ.get("MAX_PENDING_DOCUMENTS", "0")) or 4 * WORKER_COUNT
+
+# PyMuPDF, python-docx, NumPy, dateparser and openpyxl are imported on first use,
+# so the API answers /health quickly after a cold start. With EXTRACTOR_WARM_UP
+# they are all loaded (and the process pool started) before traffic is accepted.
+WARM_UP = os.environ.get("EXTRACTOR_WARM_UP", "0").lower() in ("1", "true", "yes")
+
+# Seconds one document may spend in the extract -> split -> parse pipeline before
+# it is interrupted and reported with error_code TIMEOUT (0 disables the budget).
+# Enforced with SIGALRM, so only where documents run on a process's main thread:
+# process mode workers, the batch CLI and reparse, and inline mode under uvicorn.
+DOCUMENT_TIMEOUT_SECONDS = float(os.environ.get("DOCUMENT_TIMEOUT_SECONDS", "60"))
+
+# Result cache keyed on file content + rules version.
+# RESULT_CACHE_SIZE bounds the in-memory LRU (0 disables it); RESULT_CACHE_PATH
+# enables a persistent SQLite tier.
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", "1024"))
+RESULT_CACHE_PATH = os.environ.get("RESULT_CACHE_PATH") or None
+
+# With TEXT_STORE_DIR set, the text extracted from every document is kept there
+# (compressed, keyed by content hash) with its latest parse result, so
+# `python -m backend.extractor.reparse` can re-apply changed rules without
+# extracting the files again.
+TEXT_STORE_DIR = os.environ.get("TEXT_STORE_DIR") or None
+
+# Server-side copies of /parse results for GET /export/*?job_id=...
+# Kept for RESULT_STORE_TTL_SECONDS, and at most RESULT_STORE_MAX_FILES file results in total.
+RESULT_STORE_TTL_SECONDS = float(os.environ.get("RESULT_STORE_TTL_SECONDS", "3600"))
+RESULT_STORE_MAX_FILES = int(os.environ.get("RESULT_STORE_MAX_FILES", "10000"))
+
+# Background job API: number of job worker threads and how many submitted jobs
+# may wait for a worker before POST /jobs is rejected.
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "1"))
+JOB_QUEUE_SIZE = int(os.environ.get("JOB_QUEUE_SIZE", "8"))
+
+# Include per-stage timings (seconds) in every file_result by default.
+# /parse and /parse/stream can also ask for them with ?timings=true.
+INCLUDE_STAGE_TIMINGS = os.environ.get("INCLUDE_STAGE_TIMINGS", "0").lower() in ("1", "true", "yes")
+
+# Section anchors in the order they usually appear, mapped to the key they are
+# stored under in the sections dict. Text before the first anchor found is the
+# "header" section. All anchors are located in a single scan of the document, so
+# adding one does not add another pass.
+SECTION_HEADERS = {
+    "OFFER LETTER": "header",
+    "Compensation & Benefits": "compensation",
+    "Additional Terms and Conditions": "terms",
+    "BYOD": "byod",
+    "Schedule A": "scheduleA",
+    "SALARY COMPUTATION": "salary_table",
+    "ACCEPTANCE OF OFFER TERMS AND CONDITIONS": "acceptance"
+}
+
+# Lazy PDF extraction. With PDF_EARLY_STOP, reading stops once every section in
+# PDF_REQUIRED_SECTIONS has been seen, plus PDF_TRAILING_PAGES pages so the content
+# under the last header is kept. Sections living past that point (BYOD clauses,
+# bonus/ESOP paragraphs in annexures) are not seen, so it is opt-in.
+# PDF_MAX_PAGES caps the pages read from any PDF (0 = no cap).
+PDF_EARLY_STOP = os.environ.get("PDF_EARLY_STOP", "0").lower() in ("1", "true", "yes")
+PDF_REQUIRED_SECTIONS = ["compensation", "scheduleA", "salary_table", "acceptance"]
+PDF_TRAILING_PAGES = int(os.environ.get("PDF_TRAILING_PAGES", "1"))
+PDF_MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", "0"))
+
+# DOCX text extraction. "python-docx" builds the full document object model;
+# "stream" reads word/document.xml incrementally with the standard library and
+# produces the same text without building python-docx objects.
+DOCX_ENGINE = os.environ.get("EXTRACTOR_DOCX_ENGINE", "python-docx").lower()
 
 # More specific anchors first, then generic ones
 FIELD_CONFIG = {
@@ -73,6 +157,14 @@ FIELD_CONFIG = {
     ]
 }
 
+# FIELD_CONFIG fields that FieldParser reports from anchor hits (see extractor.anchors).
+# The others are already covered by its dedicated extractors.
+ANCHOR_FIELDS = ["candidate_name", "probation_period", "notice_period", "reporting_manager", "ctc"]
+# Result keys of anchor fields not reported under their FIELD_CONFIG name. The CTC read
+# after a "CTC"-style label, in INR via MULTIPLIERS, sits next to the compensation
+# extractor's comp_total_annual_inr.
+ANCHOR_FIELD_NAMES = {"ctc": "anchor_ctc_inr"}
+
 REGEX_PATTERNS = {
     "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
     "phone": r"(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",
@@ -83,8 +175,8 @@ REGEX_PATTERNS = {
         r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}"
     ],
     "currency": [
-         r"(?:Rs\.?|INR|₹)\s*[\d,]+(?:\.\d{2})?(?:\s*(?:Lakhs?|LPA|Cr|Crores?))?",
-         r"[\d,]+(?:\.\d{2})?\s*(?:Lakhs?|LPA)"
+         r"(?:Rs\.?|INR|₹)\s*[\d,]+(?:\.\d{1,2})?(?:\s*(?:Lakhs?|LPA|Crores?|Cr)\b)?",
+         r"(?<![\d,])[\d,]+(?:\.\d{1,2})?\s*(?:Lakhs?|LPA)\b"
     ]
 }
 
@@ -0,0 +1,91 @@
+from typing import Dict, Optional, Tuple
+
+
+def strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """The bounds of text[start:end].strip(), without copying the slice."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+class Document:
+    """
+    One file's extracted text and where its sections are, shared by every field
+    extractor. Built once per file by TextExtractor.split_document.
+
+    spans maps each section key, in output order, to its (start, end) offsets in
+    text, or None for a section that was not found (or not requested). Everything
+    the extractors read is derived from these on first use and kept: the section
+    texts, the whole-document view (all sections joined by newlines) and the
+    newline-flattened copies the proximity patterns run on. However many
+    extractors read a view, it is built at most once.
+    """
+
+    def __init__(self, text: str, spans: Dict[str, Optional[Tuple[int, int]]]):
+        self.text = text
+        self.spans = spans
+        self._sections: Dict[str, str] = {}
+        self._flat_sections: Dict[str, str] = {}
+        self._global_text: Optional[str] = None
+        self._flat_text: Optional[str] = None
+
+    @classmethod
+    def from_sections(cls, sections: Dict[str, str]) -> "Document":
+        """
+        Wraps an already split sections dict. Its text is the sections joined by
+        newlines, which is then also the document's global_text.
+        """
+        text = "\n".join(sections.values())
+        spans, start = {}, 0
+        for key, value in sections.items():
+            spans[key] = strip_span(text, start, start + len(value)) if value else None
+            start += len(value) + 1
+        document = cls(text, spans)
+        document._sections = dict(sections)
+        document._global_text = document.text
+        return document
+
+    def section(self, key: str) -> str:
+        """The text of one section ("" if it was not found)."""
+        value = self._sections.get(key)
+        if value is None:
+            span = self.spans.get(key)
+            value = self.text[span[0]:span[1]] if span else ""
+            self._sections[key] = value
+        return value
+
+    def has_text(self, key: str) -> bool:
+        """Whether a section has any non-whitespace text, without building it."""
+        span = self.spans.get(key)
+        return span is not None and span[1] > span[0]
+
+    @property
+    def sections(self) -> Dict[str, str]:
+        """{key: text} for every section, as TextExtractor.split_sections returns it."""
+        return {key: self.section(key) for key in self.spans}
+
+    def flat_section(self, key: str) -> str:
+        """A section with newlines replaced by spaces."""
+        value = self._flat_sections.get(key)
+        if value is None:
+            value = self._flat_sections[key] = self.section(key).replace("\n", " ")
+        return value
+
+    @property
+    def global_text(self) -> str:
+        """Every section joined by newlines: the whole-document fallback of the extractors."""
+        if self._global_text is None:
+            # Sections no extractor read on their own are sliced only for the join
+            text, sections = self.text, self._sections
+            self._global_text = "\n".join(sections[key] if key in sections else text[span[0]:span[1]] if span else ""
+                                           for key, span in self.spans.items())
+        return self._global_text
+
+    @property
+    def flat_text(self) -> str:
+        """global_text with newlines replaced by spaces, for the proximity patterns."""
+        if self._flat_text is None:
+            self._flat_text = self.global_text.replace("\n", " ")
+        return self._flat_text
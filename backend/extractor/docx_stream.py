@@ -0,0 +1,127 @@
+import io
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Tuple, Union
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+_P, _TBL, _TR, _TC, _R, _HYPERLINK = W + "p", W + "tbl", W + "tr", W + "tc", W + "r", W + "hyperlink"
+_VAL = W + "val"
+
+# Text equivalents of run content, as python-docx renders them
+_RUN_TEXT = {W + "tab": "\t", W + "ptab": "\t", W + "cr": "\n", W + "noBreakHyphen": "-"}
+
+
+def _main_part(archive: zipfile.ZipFile) -> str:
+    """Name of the main document part, from the package relationships."""
+    try:
+        rels = ET.fromstring(archive.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in rels.iter(RELS + "Relationship"):
+        if rel.get("Type") == OFFICE_DOCUMENT:
+            return posixpath.normpath(rel.get("Target", "").lstrip("/"))
+    return "word/document.xml"
+
+
+def _run_text(run: ET.Element) -> str:
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W + "t":
+            parts.append(child.text or "")
+        elif tag == W + "br":
+            if child.get(W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return "".join(parts)
+
+
+def paragraph_text(p: ET.Element) -> str:
+    """Text of the paragraph's runs, including those inside hyperlinks."""
+    parts = []
+    for child in p:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterfind(_R))
+    return "".join(parts)
+
+
+def _int_property(parent: ET.Element, props: str, name: str, default: int) -> int:
+    element = parent.find(f"{W}{props}/{W}{name}")
+    return default if element is None else int(element.get(_VAL, default))
+
+
+# Grid offset -> (cell text, grid columns) for each cell of a table row
+RowCells = Dict[int, Tuple[str, int]]
+
+
+def table_row(tr: ET.Element, above: RowCells) -> Tuple[str, RowCells]:
+    """
+    Returns the row's line, the stripped single-line text of each cell separated by
+    spaces, and its cells for resolving merges in the next row. Like python-docx's
+    row.cells, a cell spanning several grid columns is repeated once per column, and
+    a vertically merged cell repeats the text of the cell it continues (above holds
+    the previous row's cells).
+    """
+    offset = _int_property(tr, "trPr", "gridBefore", 0)
+    row: RowCells = {}
+    cells: List[str] = []
+    for tc in tr.iterfind(_TC):
+        span = _int_property(tc, "tcPr", "gridSpan", 1)
+        v_merge = tc.find(f"{W}tcPr/{W}vMerge")
+        if v_merge is not None and v_merge.get(_VAL, "continue") == "continue":
+            if offset not in above:
+                raise ValueError(f"no cell above the merged cell at grid offset {offset}")
+            cell = above[offset]
+        else:
+            text = "\n".join(paragraph_text(p) for p in tc.iterfind(_P))
+            cell = (text.strip().replace("\n", " "), span)
+        row[offset] = cell
+        cells.extend([cell[0]] * cell[1])
+        offset += span
+    return " ".join(cells), row
+
+
+def iter_docx_lines(content: Union[bytes, str]) -> Iterator[str]:
+    """
+    Yields the text lines of a DOCX (given its bytes or path) in the same layout as
+    the python-docx extractor: one line per body paragraph and one per table row.
+    word/document.xml is parsed incrementally, and each top-level paragraph or table
+    row is dropped once its line has been produced, so memory does not grow with
+    the document.
+    """
+    source = content if isinstance(content, str) else io.BytesIO(content)
+    with zipfile.ZipFile(source) as archive:
+        with archive.open(_main_part(archive)) as part:
+            # Depth 1 is w:document, 2 w:body, 3 the body's paragraphs and tables
+            depth = 0
+            body = table = None
+            above: RowCells = {}
+            for event, element in ET.iterparse(part, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and element.tag == W + "body":
+                        body = element
+                    elif depth == 3 and body is not None and element.tag == _TBL:
+                        table, above = element, {}
+                    continue
+                depth -= 1
+                if depth == 3 and table is not None and element.tag == _TR:
+                    line, above = table_row(element, above)
+                    yield line
+                    table.remove(element)
+                elif depth == 2 and body is not None:
+                    if element.tag == _P:
+                        yield paragraph_text(element)
+                    table = None
+                    body.remove(element)
+
+
+def extract_docx_text(content: Union[bytes, str]) -> str:
+    return "\n".join(iter_docx_lines(content))
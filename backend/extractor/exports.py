@@ -0,0 +1,349 @@
+import io
+import csv
+import json
+import tempfile
+from typing import Dict, Any, Callable, Iterable, Iterator, List
+
+# Rows buffered per chunk yielded by iter_csv
+CSV_CHUNK_ROWS = 256
+
+# XLSX and Parquet exports are written to a temp file that stays in memory up to this size
+XLSX_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+XLSX_CHUNK_BYTES = 256 * 1024
+
+# Parquet exports hold one table per file, written in row groups of this many rows
+PARQUET_TABLES = ("fields", "salary_rows")
+PARQUET_ROW_GROUP_ROWS = 4096
+
+XLSX_SHEET = "Extracted Data"
+XLSX_LONG_SHEET = "Salary Components"
+
+# Fixed columns of the XLSX export: (header, field key) or (header, (field key, totals key))
+XLSX_COLUMNS = [
+    ("File Name", None),
+    ("Name", "scheduleA_name"),
+    ("Entity", "scheduleA_entity"),
+    ("Designation", "designation"),
+    ("City", "location_city"),
+    ("State", "location_state"),
+    ("Joining Date", "date_of_joining_raw"),
+    ("Total CTC (INR)", "comp_total_annual_inr"),
+    ("Joining Bonus (INR)", "bonus_joining_inr"),
+    ("Retention Bonus (INR)", "bonus_retention_inr"),
+    ("ESOP Amount (INR)", "esop_amount_inr"),
+    ("Department", "scheduleA_department"),
+    ("Sub-Department", "scheduleA_sub_department"),
+    ("BYOD", "byod_clause"),
+    ("Band", "scheduleA_band"),
+    ("Grade", "scheduleA_grade"),
+    ("Table Gross Salary", ("salary_table_totals", "gross_salary")),
+    ("Table Long Term Benefits", ("salary_table_totals", "long_term_benefits")),
+    ("Table Fixed CTC", ("salary_table_totals", "fixed_ctc")),
+    ("Table Total CTC", ("salary_table_totals", "total_ctc")),
+]
+
+
+def csv_columns(results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Columns of the CSV export in first-seen order: File Name, every field key,
+    then the error columns if any file failed.
+    """
+    columns = {"File Name": None}
+    for item in results:
+        for key in item.get("fields", {}):
+            columns.setdefault(key, None)
+        if item.get("error_code"):
+            columns.setdefault("Error Code", None)
+            columns.setdefault("Error Message", None)
+    return list(columns)
+
+
+def _csv_value(value: Any) -> Any:
+    return "" if value is None else value
+
+
+def iter_csv(results: List[Dict[str, Any]], chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Yields the CSV export as UTF-8 chunks, header first, then chunk_rows rows at a time.
+    Only one chunk is held in memory. Nested values (salary rows and totals) are
+    written as their Python representation, as the pandas-based export did.
+    Unlike that export, amounts stay integers in columns with empty cells (pandas
+    turned them into floats: 450000.0).
+    """
+    columns = csv_columns(results)
+    # How each column after File Name is read from a file_result
+    readers = []
+    for key in columns[1:]:
+        if key == "Error Code":
+            readers.append(lambda item: item.get("error_code"))
+        elif key == "Error Message":
+            readers.append(lambda item: item.get("error_message"))
+        else:
+            readers.append(lambda item, key=key: item.get("fields", {}).get(key))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(columns)
+    yield flush()
+
+    rows = 0
+    for item in results:
+        row = [_csv_value(item.get("file_name"))]
+        row.extend(_csv_value(read(item)) for read in readers)
+        writer.writerow(row)
+        rows += 1
+        if rows % chunk_rows == 0:
+            yield flush()
+
+    if rows % chunk_rows:
+        yield flush()
+
+
+def salary_components(results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Every salary component found in the batch, sorted, for stable XLSX columns.
+    """
+    components = set()
+    for item in results:
+        for row in item.get("fields", {}).get("salary_table_rows", []):
+            if row.get("component") is not None:
+                components.add(row.get("component"))
+    return sorted(components)
+
+
+def xlsx_header(components: List[str], with_errors: bool) -> List[str]:
+    header = [name for name, _ in XLSX_COLUMNS]
+    for comp in components:
+        header += [f"{comp} (Per Annum)", f"{comp} (Per Month)"]
+    if with_errors:
+        header += ["Error Code", "Error Message"]
+    return header
+
+
+def xlsx_row(item: Dict[str, Any], components: List[str], with_errors: bool) -> List[Any]:
+    fields = item.get("fields", {})
+    row = [item.get("file_name")]
+    for _, key in XLSX_COLUMNS[1:]:
+        if isinstance(key, tuple):
+            row.append(fields.get(key[0], {}).get(key[1]))
+        else:
+            row.append(fields.get(key))
+
+    # Index this file's salary rows once (first row wins, as before), instead of
+    # scanning them for every component column
+    by_component = {}
+    for salary_row in fields.get("salary_table_rows", []):
+        by_component.setdefault(salary_row.get("component"), salary_row)
+    for comp in components:
+        match = by_component.get(comp)
+        row.append(match.get("per_annum") if match else None)
+        row.append(match.get("per_month") if match else None)
+
+    if with_errors:
+        row.append(item.get("error_code") or None)
+        row.append(item.get("error_message") if item.get("error_code") else None)
+    return row
+
+
+def warm_up() -> None:
+    """Imports openpyxl ahead of the first XLSX export."""
+    import openpyxl  # noqa: F401
+
+
+def write_xlsx(results: List[Dict[str, Any]], out, long_format: bool = False) -> None:
+    """
+    Writes the XLSX export to the binary file object out, one row at a time, using
+    openpyxl's write-only mode. The first sheet is the wide export with two columns
+    per salary component. With long_format, a second sheet lists the salary rows as
+    (File Name, Component, Per Annum, Per Month).
+    """
+    from openpyxl import Workbook
+
+    components = salary_components(results)
+    with_errors = any(item.get("error_code") for item in results)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(XLSX_SHEET)
+    sheet.append(xlsx_header(components, with_errors))
+    for item in results:
+        sheet.append(xlsx_row(item, components, with_errors))
+
+    if long_format:
+        long_sheet = workbook.create_sheet(XLSX_LONG_SHEET)
+        long_sheet.append(["File Name", "Component", "Per Annum", "Per Month"])
+        for item in results:
+            for salary_row in item.get("fields", {}).get("salary_table_rows", []):
+                long_sheet.append([item.get("file_name"), salary_row.get("component"),
+                                   salary_row.get("per_annum"), salary_row.get("per_month")])
+
+    workbook.save(out)
+
+
+def _iter_spooled(write: Callable[[Any], None]) -> Iterator[bytes]:
+    """
+    Runs write(file) into a spooled temp file when iteration starts, then yields
+    the file in chunks.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_MEMORY_BYTES) as spool:
+        write(spool)
+        spool.seek(0)
+        while True:
+            chunk = spool.read(XLSX_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_xlsx(results: List[Dict[str, Any]], long_format: bool = False) -> Iterator[bytes]:
+    return _iter_spooled(lambda out: write_xlsx(results, out, long_format))
+
+
+def _kind(value: Any) -> str:
+    # bool is checked first, as it is a subclass of int
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "string"
+
+
+def _declared_kind(column: str) -> str:
+    """
+    Kind of the columns whose type should not depend on the batch: amounts and
+    confidences are always float, so a batch where they are all null or all whole
+    numbers still produces the same schema.
+    """
+    if column.endswith("_inr") or column.startswith(("salary_table_totals_", "confidence_")) \
+            or column in ("per_annum", "per_month"):
+        return "float"
+    if column == "row_index":
+        return "int"
+    return ""
+
+
+def _column_type(column: str, kinds: set) -> str:
+    """Parquet column kind for a column and the kinds of the non-null values seen in it."""
+    declared = _declared_kind(column)
+    if declared and kinds <= {"int", "float"}:
+        return declared
+    if kinds <= {"int"}:
+        return "int" if kinds else "string"
+    if kinds <= {"int", "float"}:
+        return "float"
+    if kinds == {"bool"}:
+        return "bool"
+    return "string"
+
+
+def _cell(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "float":
+        return float(value)
+    if kind == "string" and not isinstance(value, str):
+        return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+    return value
+
+
+def parquet_fields_row(item: Dict[str, Any], include_confidence: bool = False) -> Dict[str, Any]:
+    """
+    One row of the fields table: file name, error columns, every field except the
+    salary rows, salary_table_totals flattened into salary_table_totals_<key>
+    columns and, with include_confidence, confidence_<field> and method_<field>.
+    """
+    row = {"file_name": item.get("file_name"), "error_code": item.get("error_code"),
+           "error_message": item.get("error_message")}
+    for key, value in item.get("fields", {}).items():
+        if key == "salary_table_rows":
+            continue
+        if key == "salary_table_totals" and isinstance(value, dict):
+            for total, amount in value.items():
+                row[f"salary_table_totals_{total}"] = amount
+        else:
+            row[key] = value
+    if include_confidence:
+        for key, value in item.get("confidence", {}).items():
+            row[f"confidence_{key}"] = value
+        for key, value in item.get("methods", {}).items():
+            row[f"method_{key}"] = value
+    return row
+
+
+def parquet_salary_rows(item: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Rows of the salary rows table: one per salary_table_rows entry, keyed by file name and position."""
+    for index, salary_row in enumerate(item.get("fields", {}).get("salary_table_rows", [])):
+        row = {"file_name": item.get("file_name"), "row_index": index}
+        row.update(salary_row)
+        yield row
+
+
+def _table_rows(results: Iterable[Dict[str, Any]], table: str, include_confidence: bool) -> Iterator[Dict[str, Any]]:
+    for item in results:
+        if table == "fields":
+            yield parquet_fields_row(item, include_confidence)
+        else:
+            yield from parquet_salary_rows(item)
+
+
+def write_parquet(results: Iterable[Dict[str, Any]], out, table: str = "fields", include_confidence: bool = False,
+                  row_group_rows: int = PARQUET_ROW_GROUP_ROWS) -> None:
+    """
+    Writes one table of the Parquet export to out (a path or binary file object):
+    "fields" (one row per file) or "salary_rows" (one row per salary component,
+    keyed by file_name). Amounts are float64; other column types are inferred in
+    a first pass over results, which must therefore be re-iterable; rows are then converted and written
+    row_group_rows at a time, so only one row group is held in memory.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if table not in PARQUET_TABLES:
+        raise ValueError(f"Unknown Parquet table {table!r}. Use one of: {', '.join(PARQUET_TABLES)}.")
+
+    # Columns in first-seen order, with the kinds of their non-null values
+    kinds: Dict[str, set] = {}
+    for row in _table_rows(results, table, include_confidence):
+        for key, value in row.items():
+            seen = kinds.setdefault(key, set())
+            if value is not None:
+                seen.add(_kind(value))
+    if table == "salary_rows":
+        for key in ("file_name", "row_index", "component", "per_annum", "per_month"):
+            kinds.setdefault(key, set())
+    column_kinds = {key: _column_type(key, seen) for key, seen in kinds.items()}
+    arrow_types = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "string": pa.string()}
+    schema = pa.schema([(key, arrow_types[kind]) for key, kind in column_kinds.items()])
+
+    with pq.ParquetWriter(out, schema) as writer:
+        def flush(rows: List[Dict[str, Any]]) -> None:
+            columns = {key: [_cell(row.get(key), kind) for row in rows] for key, kind in column_kinds.items()}
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema), row_group_size=row_group_rows)
+
+        rows = []
+        for row in _table_rows(results, table, include_confidence):
+            rows.append(row)
+            if len(rows) == row_group_rows:
+                flush(rows)
+                rows = []
+        if rows:
+            flush(rows)
+
+
+def iter_parquet(results: List[Dict[str, Any]], table: str = "fields", include_confidence: bool = False) -> Iterator[bytes]:
+    """
+    Like iter_xlsx, for one Parquet table. pyarrow is imported here, before the
+    first chunk is requested, so a missing install surfaces as an ImportError.
+    """
+    import pyarrow.parquet  # noqa: F401
+
+    if table not in PARQUET_TABLES:
+        raise ValueError(f"Unknown Parquet table {table!r}. Use one of: {', '.join(PARQUET_TABLES)}.")
+    return _iter_spooled(lambda out: write_parquet(results, out, table, include_confidence))
@@ -1,13 +1,145 @@
-import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-import dateparser
+from typing import Dict, Any, Iterable, List, Optional, Set, Union
+from datetime import datetime, date
+from functools import lru_cache
+from .patterns import PATTERNS, BONUS_PATTERNS, ESOP_PATTERNS
+from .metrics import timed
+from .anchors import AnchorEngine
+from .document import Document
+from . import config
+
+MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sep"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ], start=1)
+    for name in names
+}
+
+
+def fast_normalize_date(date_str: str) -> Optional[str]:
+    """
+    Normalises DD-MM-YYYY, DD/MM/YYYY and "D Month YYYY" (English month names or
+    three-letter abbreviations) to YYYY-MM-DD. Returns None for anything else,
+    including impossible dates, so the caller can fall back to dateparser.
+    """
+    match = PATTERNS["date.numeric"].fullmatch(date_str)
+    if match:
+        day, month, year = int(match.group(1)), int(match.group(3)), int(match.group(4))
+    else:
+        match = PATTERNS["date.day_month_year"].fullmatch(date_str)
+        if not match:
+            return None
+        month = MONTHS.get(match.group(2).lower())
+        if month is None:
+            return None
+        day, year = int(match.group(1)), int(match.group(3))
+    try:
+        return date(year, month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+@timed("parse.normalize_date.dateparser")
+@lru_cache(maxsize=1024)
+def dateparser_normalize_date(date_str: str) -> Optional[str]:
+    """
+    Memoised dateparser fallback for dates outside the fast-path shapes. Each call
+    is recorded as the parse.normalize_date.dateparser stage, so the stage's count
+    in /metrics shows how often the fallback is needed.
+    """
+    import dateparser  # deferred: slow to import and only needed for unusual dates
+    try:
+        dt = dateparser.parse(date_str, settings={'DATE_ORDER': 'DMY'})
+        if dt:
+            return dt.strftime("%Y-%m-%d")
+    except:
+        pass
+    return None
+
+
+# The ANCHOR_FIELDS anchors, compiled once per process
+_anchor_engine = AnchorEngine()
+
+# Result key -> FIELD_CONFIG field, for the fields read by _anchor_engine
+ANCHOR_RESULT_FIELDS = {config.ANCHOR_FIELD_NAMES.get(field, field): field for field in config.ANCHOR_FIELDS}
+
+# The fields each extractor in FieldParser.parse fills, in output order
+EXTRACTOR_FIELDS = {
+    "designation": ["designation"],
+    "location": ["location_city", "location_state"],
+    "date_of_joining": ["date_of_joining_raw", "date_of_joining_norm"],
+    "compensation": ["comp_total_annual_raw", "comp_total_annual_inr"],
+    "bonus_joining": ["bonus_joining_inr"],
+    "bonus_retention": ["bonus_retention_inr"],
+    "esop": ["esop_amount_inr"],
+    "byod": ["byod_clause"],
+    "schedule_a": ["scheduleA_name", "scheduleA_entity", "scheduleA_department",
+                   "scheduleA_sub_department", "scheduleA_band", "scheduleA_grade"],
+    "salary_table": ["salary_table_rows", "salary_table_totals"],
+    "anchors": list(ANCHOR_RESULT_FIELDS),
+}
+
+# The sections each extractor reads; None means it may fall back to the whole document
+EXTRACTOR_SECTIONS = {
+    "designation": ("scheduleA", "header"),
+    "location": ("header",),
+    "date_of_joining": ("acceptance", "header"),
+    "compensation": None,
+    "bonus_joining": None,
+    "bonus_retention": None,
+    "esop": None,
+    "byod": None,
+    "schedule_a": None,
+    "salary_table": ("salary_table",),
+    "anchors": None,
+}
+
+FIELD_EXTRACTORS = {field: name for name, fields in EXTRACTOR_FIELDS.items() for field in fields}
+
+
+def select_fields(fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    Validates a field selection for FieldParser.parse. None or an empty selection
+    means every field. Raises ValueError naming any unknown field.
+    """
+    if fields is None:
+        return None
+    selected = list(dict.fromkeys(f.strip() for f in fields if f.strip()))
+    unknown = [f for f in selected if f not in FIELD_EXTRACTORS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Known fields: {', '.join(FIELD_EXTRACTORS)}")
+    return selected or None
+
+
+def required_sections(fields: Optional[Iterable[str]]) -> Optional[Set[str]]:
+    """
+    Section keys the extractors for these fields read, or None if they need every
+    section (the default selection, or an extractor that scans the whole document).
+    """
+    fields = select_fields(fields)
+    if fields is None:
+        return None
+    sections = set()
+    for name in {FIELD_EXTRACTORS[f] for f in fields}:
+        if EXTRACTOR_SECTIONS[name] is None:
+            return None
+        sections.update(EXTRACTOR_SECTIONS[name])
+    return sections
 
 class FieldParser:
-    def parse(self, sections: dict) -> Dict[str, Any]:
+    def parse(self, sections: Union[Document, dict], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
-        Parses strictly defined fields using section bounds.
+        Parses strictly defined fields using section bounds, from a Document
+        (TextExtractor.split_document) or a split_sections dict.
+        With a fields selection (see select_fields) only the extractors for those
+        fields run, and only those fields are returned.
         """
+        document = sections if isinstance(sections, Document) else Document.from_sections(sections)
+        fields = select_fields(fields)
+        run = set(EXTRACTOR_FIELDS) if fields is None else {FIELD_EXTRACTORS[f] for f in fields}
+
         results = {
             "designation": None,
             "location_city": None,
@@ -29,129 +161,156 @@ class FieldParser:
             "salary_table_rows": [],
             "salary_table_totals": {}
         }
+        for field in ANCHOR_RESULT_FIELDS:
+            results[field] = None
         confidence_scores = {k: 0.0 for k in results.keys()}
         extraction_methods = {k: "missing" for k in results.keys()}
         
         # We need to extract from sections
-        header_text = sections.get("header", "")
-        compensation_text = sections.get("compensation", "")
-        scheduleA_text = sections.get("scheduleA", "")
-        byod_text = sections.get("byod", "")
-        table_text = sections.get("salary_table", "")
-        acceptance_text = sections.get("acceptance", "")
-        
-        # Globally combined fallback (if needed)
-        global_text = "\n".join(sections.values())
+        header_text = document.section("header")
+        compensation_text = document.section("compensation")
+        scheduleA_text = document.section("scheduleA")
+        table_text = document.section("salary_table")
+        acceptance_text = document.section("acceptance")
+
+        # The globally combined fallback (document.global_text) and its flattened
+        # copy (document.flat_text) are built on first use, once per document
         
         # 1. Designation
         # Priority 1: Schedule A
         # Priority 2: Intro sentence in header
-        designation_val, desig_conf, desig_meth = self._extract_designation(scheduleA_text, header_text)
-        results["designation"] = designation_val
-        confidence_scores["designation"] = desig_conf
-        extraction_methods["designation"] = desig_meth
+        if "designation" in run:
+            designation_val, desig_conf, desig_meth = self._extract_designation(scheduleA_text, header_text)
+            results["designation"] = designation_val
+            confidence_scores["designation"] = desig_conf
+            extraction_methods["designation"] = desig_meth
 
         # 2. Location (City + State)
         # Regex: at\s+(.*?),\s*(.*?),\s*India from intro sentence
-        loc_city, loc_state, loc_conf, loc_meth = self._extract_location(header_text)
-        results["location_city"] = loc_city
-        results["location_state"] = loc_state
-        confidence_scores["location_city"] = loc_conf
-        confidence_scores["location_state"] = loc_conf
-        extraction_methods["location_city"] = loc_meth
-        extraction_methods["location_state"] = loc_meth
+        if "location" in run:
+            loc_city, loc_state, loc_conf, loc_meth = self._extract_location(header_text)
+            results["location_city"] = loc_city
+            results["location_state"] = loc_state
+            confidence_scores["location_city"] = loc_conf
+            confidence_scores["location_state"] = loc_conf
+            extraction_methods["location_city"] = loc_meth
+            extraction_methods["location_state"] = loc_meth
         
         # 3. Date of Joining
         # Labeled in acceptance -> intro sentence fallback
-        doj_raw, doj_norm, doj_conf, doj_meth = self._extract_date_of_joining(acceptance_text, header_text)
-        results["date_of_joining_raw"] = doj_raw
-        results["date_of_joining_norm"] = doj_norm
-        confidence_scores["date_of_joining_raw"] = doj_conf
-        confidence_scores["date_of_joining_norm"] = doj_conf
-        extraction_methods["date_of_joining_raw"] = doj_meth
-        extraction_methods["date_of_joining_norm"] = doj_meth
+        if "date_of_joining" in run:
+            doj_raw, doj_norm, doj_conf, doj_meth = self._extract_date_of_joining(acceptance_text, header_text)
+            results["date_of_joining_raw"] = doj_raw
+            results["date_of_joining_norm"] = doj_norm
+            confidence_scores["date_of_joining_raw"] = doj_conf
+            confidence_scores["date_of_joining_norm"] = doj_conf
+            extraction_methods["date_of_joining_raw"] = doj_meth
+            extraction_methods["date_of_joining_norm"] = doj_meth
         
         # 4. Compensation Headline
-        comp_raw, comp_inr, comp_conf, comp_meth = self._extract_compensation(compensation_text, global_text)
-        results["comp_total_annual_raw"] = comp_raw
-        results["comp_total_annual_inr"] = comp_inr
-        confidence_scores["comp_total_annual_raw"] = comp_conf
-        confidence_scores["comp_total_annual_inr"] = comp_conf
-        extraction_methods["comp_total_annual_raw"] = comp_meth
-        extraction_methods["comp_total_annual_inr"] = comp_meth
+        if "compensation" in run:
+            comp_raw, comp_inr, comp_conf, comp_meth = self._extract_compensation(compensation_text, document)
+            results["comp_total_annual_raw"] = comp_raw
+            results["comp_total_annual_inr"] = comp_inr
+            confidence_scores["comp_total_annual_raw"] = comp_conf
+            confidence_scores["comp_total_annual_inr"] = comp_conf
+            extraction_methods["comp_total_annual_raw"] = comp_meth
+            extraction_methods["comp_total_annual_inr"] = comp_meth
         
         # 5. BYOD
-        if byod_text and byod_text.strip():
-            # If the section was found, it implies BYOD
-            results["byod_clause"] = "Yes"
-            confidence_scores["byod_clause"] = 1.0
-            extraction_methods["byod_clause"] = "binary_presence"
-        else:
-            # Check globally if the exact string exists just in case
-            if "BYOD" in global_text:
+        if "byod" in run:
+            if document.has_text("byod"):
+                # If the section was found, it implies BYOD
                 results["byod_clause"] = "Yes"
                 confidence_scores["byod_clause"] = 1.0
                 extraction_methods["byod_clause"] = "binary_presence"
             else:
-                results["byod_clause"] = "No"
-                confidence_scores["byod_clause"] = 1.0
-                extraction_methods["byod_clause"] = "binary_absence"
-            
+                # Check globally if the exact string exists just in case
+                if "BYOD" in document.global_text:
+                    results["byod_clause"] = "Yes"
+                    confidence_scores["byod_clause"] = 1.0
+                    extraction_methods["byod_clause"] = "binary_presence"
+                else:
+                    results["byod_clause"] = "No"
+                    confidence_scores["byod_clause"] = 1.0
+                    extraction_methods["byod_clause"] = "binary_absence"
+        
         # 6. Schedule A Name, Entity, Department, Sub-Department, Band, Grade
-        name, entity, dept, subdept, band, grade, sch_conf, sch_meth = self._extract_schedule_a_fields(scheduleA_text)
+        if "schedule_a" in run:
+            name, entity, dept, subdept, band, grade, sch_conf, sch_meth = self._extract_schedule_a_fields(document.flat_section("scheduleA"))
         
-        # Fallback to scanning the global document if the 'Schedule A' section was completely missed 
-        # by the text extractor's header-boundary engine
-        if not (name or entity or dept or subdept or band or grade):
-             name, entity, dept, subdept, band, grade, sch_conf, sch_meth = self._extract_schedule_a_fields(global_text)
-             sch_meth = "global_fallback" if sch_meth != "missing" else "missing"
+            # Fallback to scanning the global document if the 'Schedule A' section was completely missed 
+            # by the text extractor's header-boundary engine
+            if not (name or entity or dept or subdept or band or grade):
+                 name, entity, dept, subdept, band, grade, sch_conf, sch_meth = self._extract_schedule_a_fields(document.flat_text)
+                 sch_meth = "global_fallback" if sch_meth != "missing" else "missing"
              
-        results["scheduleA_name"] = name
-        results["scheduleA_entity"] = entity
-        results["scheduleA_department"] = dept
-        results["scheduleA_sub_department"] = subdept
-        results["scheduleA_band"] = band
-        results["scheduleA_grade"] = grade
+            results["scheduleA_name"] = name
+            results["scheduleA_entity"] = entity
+            results["scheduleA_department"] = dept
+            results["scheduleA_sub_department"] = subdept
+            results["scheduleA_band"] = band
+            results["scheduleA_grade"] = grade
         
-        confidence_scores["scheduleA_name"] = sch_conf
-        confidence_scores["scheduleA_entity"] = sch_conf
-        confidence_scores["scheduleA_department"] = sch_conf
-        confidence_scores["scheduleA_sub_department"] = sch_conf
-        confidence_scores["scheduleA_band"] = sch_conf
-        confidence_scores["scheduleA_grade"] = sch_conf
+            confidence_scores["scheduleA_name"] = sch_conf
+            confidence_scores["scheduleA_entity"] = sch_conf
+            confidence_scores["scheduleA_department"] = sch_conf
+            confidence_scores["scheduleA_sub_department"] = sch_conf
+            confidence_scores["scheduleA_band"] = sch_conf
+            confidence_scores["scheduleA_grade"] = sch_conf
         
-        extraction_methods["scheduleA_name"] = sch_meth
-        extraction_methods["scheduleA_entity"] = sch_meth
-        extraction_methods["scheduleA_department"] = sch_meth
-        extraction_methods["scheduleA_sub_department"] = sch_meth
-        extraction_methods["scheduleA_band"] = sch_meth
-        extraction_methods["scheduleA_grade"] = sch_meth
+            extraction_methods["scheduleA_name"] = sch_meth
+            extraction_methods["scheduleA_entity"] = sch_meth
+            extraction_methods["scheduleA_department"] = sch_meth
+            extraction_methods["scheduleA_sub_department"] = sch_meth
+            extraction_methods["scheduleA_band"] = sch_meth
+            extraction_methods["scheduleA_grade"] = sch_meth
         
         # 7. Salary Computation Table
-        rows, totals, tab_conf, tab_meth = self._extract_salary_table(table_text)
-        results["salary_table_rows"] = rows
-        results["salary_table_totals"] = totals
-        confidence_scores["salary_table_rows"] = tab_conf
-        confidence_scores["salary_table_totals"] = tab_conf
-        extraction_methods["salary_table_rows"] = tab_meth
-        extraction_methods["salary_table_totals"] = tab_meth
-
-        # 8. Bonuses (Joining and Retention)
-        jb_inr, jb_conf, jb_meth = self._extract_bonus(global_text, "Joining")
-        results["bonus_joining_inr"] = jb_inr
-        confidence_scores["bonus_joining_inr"] = jb_conf
-        extraction_methods["bonus_joining_inr"] = jb_meth
-
-        rb_inr, rb_conf, rb_meth = self._extract_bonus(global_text, "Retention")
-        results["bonus_retention_inr"] = rb_inr
-        confidence_scores["bonus_retention_inr"] = rb_conf
-        extraction_methods["bonus_retention_inr"] = rb_meth
-
-        # 9. ESOP Amount
-        esop_inr, esop_conf, esop_meth = self._extract_esop(global_text)
-        results["esop_amount_inr"] = esop_inr
-        confidence_scores["esop_amount_inr"] = esop_conf
-        extraction_methods["esop_amount_inr"] = esop_meth
+        if "salary_table" in run:
+            rows, totals, tab_conf, tab_meth = self._extract_salary_table(table_text)
+            results["salary_table_rows"] = rows
+            results["salary_table_totals"] = totals
+            confidence_scores["salary_table_rows"] = tab_conf
+            confidence_scores["salary_table_totals"] = tab_conf
+            extraction_methods["salary_table_rows"] = tab_meth
+            extraction_methods["salary_table_totals"] = tab_meth
+
+        # 8. Fields read after FIELD_CONFIG anchors (candidate name, notice period, CTC, ...)
+        # Run before the proximity scans build document.flat_text, so the anchor scan's
+        # lowercased copy of the document and the flattened one are never alive together
+        if "anchors" in run:
+            anchor_fields = [ANCHOR_RESULT_FIELDS[f] for f in fields or ANCHOR_RESULT_FIELDS if f in ANCHOR_RESULT_FIELDS]
+            for field, (value, conf, meth) in self._extract_anchor_fields(document.global_text, anchor_fields).items():
+                field = config.ANCHOR_FIELD_NAMES.get(field, field)
+                results[field] = value
+                confidence_scores[field] = conf
+                extraction_methods[field] = meth
+
+        # 9. Bonuses (Joining and Retention)
+        if "bonus_joining" in run:
+            jb_inr, jb_conf, jb_meth = self._extract_bonus(document.flat_text, "Joining")
+            results["bonus_joining_inr"] = jb_inr
+            confidence_scores["bonus_joining_inr"] = jb_conf
+            extraction_methods["bonus_joining_inr"] = jb_meth
+
+        if "bonus_retention" in run:
+            rb_inr, rb_conf, rb_meth = self._extract_bonus(document.flat_text, "Retention")
+            results["bonus_retention_inr"] = rb_inr
+            confidence_scores["bonus_retention_inr"] = rb_conf
+            extraction_methods["bonus_retention_inr"] = rb_meth
+
+        # 10. ESOP Amount
+        if "esop" in run:
+            esop_inr, esop_conf, esop_meth = self._extract_esop(document.flat_text)
+            results["esop_amount_inr"] = esop_inr
+            confidence_scores["esop_amount_inr"] = esop_conf
+            extraction_methods["esop_amount_inr"] = esop_meth
+
+        if fields is not None:
+            results = {k: v for k, v in results.items() if k in fields}
+            confidence_scores = {k: confidence_scores[k] for k in results}
+            extraction_methods = {k: extraction_methods[k] for k in results}
 
         return {
             "fields": results,
@@ -159,23 +318,29 @@ class FieldParser:
             "methods": extraction_methods
         }
 
+    @timed("parse.anchors")
+    def _extract_anchor_fields(self, global_text: str, fields: List[str]):
+        return _anchor_engine.extract(global_text, fields)
+
+    @timed("parse.designation")
     def _extract_designation(self, schedule_text: str, header_text: str):
         if schedule_text:
-            match = re.search(r'Designation\s*[:\-]?\s*([^\n]+)', schedule_text, re.IGNORECASE)
+            match = PATTERNS["designation.scheduleA"].search(schedule_text)
             if match:
                 return match.group(1).strip(), 1.0, "scheduleA"
         
         if header_text:
-            match = re.search(r'offer you the position of\s+([^,\.]+)', header_text, re.IGNORECASE)
+            match = PATTERNS["designation.intro_sentence"].search(header_text)
             if match:
                 return match.group(1).strip(), 0.9, "intro_sentence"
                 
         return None, 0.0, "missing"
 
+    @timed("parse.location")
     def _extract_location(self, header_text: str):
         if header_text:
              # Grab the last two comma-separated words right before 'India'
-            match = re.search(r'([^,]+),\s*([^,]+),\s*India', header_text, re.IGNORECASE)
+            match = PATTERNS["location.intro_sentence"].search(header_text)
             if match:
                 # The city block might contain street address stuff like "Sector 20, Gurugram"
                 # Splitting by space and taking the last word isolates the city cleanly
@@ -184,41 +349,38 @@ class FieldParser:
                 return city, state, 0.9, "intro_sentence"
         return None, None, 0.0, "missing"
 
+    @timed("parse.date_of_joining")
     def _extract_date_of_joining(self, acceptance_text: str, header_text: str):
         if acceptance_text:
-            match = re.search(r'Date of Joining\s*[:\-]?\s*([0-9]{2}[-/][0-9]{2}[-/][0-9]{4}|\d{1,2}\s+[a-zA-Z]+\s+\d{4})', acceptance_text, re.IGNORECASE)
+            match = PATTERNS["date_of_joining.labeled_acceptance"].search(acceptance_text)
             if match:
                 raw = match.group(1).strip()
                 return raw, self._normalize_date(raw), 1.0, "labeled_acceptance"
         
         if header_text:
-            match = re.search(r'effective from your\s*([0-9]{2}[-/][0-9]{2}[-/][0-9]{4}|\d{1,2}\s+[a-zA-Z]+\s+\d{4})', header_text, re.IGNORECASE)
+            match = PATTERNS["date_of_joining.intro_sentence"].search(header_text)
             if match:
                 raw = match.group(1).strip()
                 return raw, self._normalize_date(raw), 0.9, "intro_sentence"
                 
         return None, None, 0.0, "missing"
 
+    @timed("parse.normalize_date")
     def _normalize_date(self, date_str: str) -> str:
-        try:
-            dt = dateparser.parse(date_str, settings={'DATE_ORDER': 'DMY'})
-            if dt:
-                return dt.strftime("%Y-%m-%d")
-        except:
-            pass
-        return date_str
-
-    def _extract_compensation(self, compensation_text: str, global_text: str):
-        pattern = r'(?:total annual|aggregate)\s+compensation of\s*(?:INR|Rs\.?|₹|Rs)\s*([\d,]+)\s*per annum'
+        return fast_normalize_date(date_str) or dateparser_normalize_date(date_str) or date_str
+
+    @timed("parse.compensation")
+    def _extract_compensation(self, compensation_text: str, document: Document):
+        pattern = PATTERNS["compensation.headline"]
         if compensation_text:
-            match = re.search(pattern, compensation_text, re.IGNORECASE)
+            match = pattern.search(compensation_text)
             if match:
                 raw = match.group(0).strip()
                 num = int(match.group(1).replace(',', ''))
                 return raw, num, 1.0, "compensation_section"
                 
-        if global_text:
-            match = re.search(pattern, global_text, re.IGNORECASE)
+        if document.global_text:
+            match = pattern.search(document.global_text)
             if match:
                 raw = match.group(0).strip()
                 num = int(match.group(1).replace(',', ''))
@@ -226,43 +388,43 @@ class FieldParser:
             
         return None, None, 0.0, "missing"
 
-    def _extract_schedule_a_fields(self, schedule_text: str):
+    @timed("parse.schedule_a")
+    def _extract_schedule_a_fields(self, clean_text: str):
+        """
+        Schedule A labels, from newline-flattened text (Document.flat_section or
+        flat_text): flattened PDF tables are processed as a single block.
+        """
         name, entity, dept, subdept, band, grade = None, None, None, None, None, None
-        if not schedule_text:
+        if not clean_text:
             return None, None, None, None, None, None, 0.0, "missing"
-            
-        # Clean up chaotic spacing from flattened PDF tables and process as a single global block
-        clean_text = schedule_text.replace('\n', ' ')
         
         # Name
-        match_name = re.search(r'Name\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Designation|Entity|Business\s*Unit|Department|Sub\s*[-]*\s*Department|Competency|Band|Grade|$))', clean_text, re.IGNORECASE)
+        match_name = PATTERNS["scheduleA.name"].search(clean_text)
         if match_name:
             name = match_name.group(1).strip()
             
         # Entity
-        match_entity = re.search(r'Entity\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Business\s*Unit|Department|Sub\s*[-]*\s*Department|Competency|Band|Grade|$))', clean_text, re.IGNORECASE)
+        match_entity = PATTERNS["scheduleA.entity"].search(clean_text)
         if match_entity:
             entity = match_entity.group(1).strip()
 
         # Department
-        # Use (.{1,100}?) to prevent capturing runaway text if the lookahead keyword is too far away
-        match0 = re.search(r'Department\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Sub\s*[-]*\s*Department|Competency|Band|Grade|Name|$))', clean_text, re.IGNORECASE)
+        match0 = PATTERNS["scheduleA.department"].search(clean_text)
         if match0:
             dept = match0.group(1).strip()
 
         # 1. Sub-Department
-        match1 = re.search(r'Sub\s*[-]*\s*Department\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Competency|Band|Grade|Name|$))', clean_text, re.IGNORECASE)
+        match1 = PATTERNS["scheduleA.sub_department"].search(clean_text)
         if match1:
             subdept = match1.group(1).strip()
             
         # 2. Band
-        # Strictly enforce Uppercase or Numeric variables to reject lowercase global narrative strings (like "you")
-        match2 = re.search(r'\bBand\s*[:\-]?\s*([0-9A-Z\.\-]+)\b', clean_text)
+        match2 = PATTERNS["scheduleA.band"].search(clean_text)
         if match2:
             band = match2.group(1).strip()
             
         # 3. Grade
-        match3 = re.search(r'\bGrade\s*[:\-]?\s*([0-9A-Z\.\-]+)\b', clean_text)
+        match3 = PATTERNS["scheduleA.grade"].search(clean_text)
         if match3:
             grade = match3.group(1).strip()
                 
@@ -276,6 +438,7 @@ class FieldParser:
             
         return None, None, None, None, None, None, 0.0, "missing"
 
+    @timed("parse.salary_table")
     def _extract_salary_table(self, table_text: str):
         rows = []
         totals = {
@@ -288,10 +451,11 @@ class FieldParser:
         if not table_text:
             return [], {}, 0.0, "missing"
             
+        salary_row = PATTERNS["salary_table.row"]
         for line in table_text.split('\n'):
             line = line.strip()
             # Handle multiple spaces and numbers
-            match = re.search(r'^(.+?)\s+([\d,]+)(?:\.00)?\s+([\d,]+)(?:\.00)?$', line)
+            match = salary_row.search(line)
             if match:
                 component = match.group(1).strip()
                 try:
@@ -320,24 +484,16 @@ class FieldParser:
             return rows, totals, 1.0, "salary_table"
         return [], {}, 0.0, "missing"
 
-    def _extract_bonus(self, global_text: str, bonus_type: str):
+    @timed("parse.bonus")
+    def _extract_bonus(self, clean_text: str, bonus_type: str):
         """
-        Extracts Joining or Retention bonus amounts with highly permissive proximity scanning.
+        Extracts Joining or Retention bonus amounts with highly permissive proximity scanning
+        over the newline-flattened document (Document.flat_text).
         """
-        clean_text = global_text.replace('\n', ' ')
-        
-        # Pattern 1: [Type] Bonus ......... INR 100000
-        # We allow up to 150 characters of ANYTHING between the Bonus keyword and the Currency indicator
-        pattern1 = rf'{bonus_type}\s*Bonus(?:.{{0,150}}?)(?:INR|Rs\.?|₹|Rs)\s*([\d,]{{4,}})'
-        
-        # Pattern 2: INR 100000 ......... [Type] Bonus
-        pattern2 = rf'(?:INR|Rs\.?|₹|Rs)\s*([\d,]{{4,}})(?:.{{0,150}}?){bonus_type}\s*Bonus'
-        
-        # Pattern 3: Fallback without Currency just in case they wrote "100000 as a Retention Bonus"
-        pattern3 = rf'([\d,]{{4,}})(?:.{{0,150}}?){bonus_type}\s*Bonus'
-        
-        for pat in [pattern1, pattern2, pattern3]:
-            match = re.search(pat, clean_text, re.IGNORECASE)
+        # Patterns (see patterns.py): [Type] Bonus ... INR 100000, INR 100000 ... [Type] Bonus,
+        # then a currency-less fallback like "100000 as a Retention Bonus"
+        for pat in BONUS_PATTERNS[bonus_type]:
+            match = pat.search(clean_text)
             if match:
                 raw_val = match.group(1).replace(',', '').strip()
                 try:
@@ -347,18 +503,15 @@ class FieldParser:
                     
         return None, 0.0, "missing"
 
-    def _extract_esop(self, global_text: str):
+    @timed("parse.esop")
+    def _extract_esop(self, clean_text: str):
         """
-        Extracts ESOP program value with highly permissive proximity scanning.
+        Extracts ESOP program value with highly permissive proximity scanning
+        over the newline-flattened document (Document.flat_text).
         """
-        clean_text = global_text.replace('\n', ' ')
-        
-        # Allow up to 200 characters between ESOP and the currency value
-        pattern1 = r'ESOP(?:.{0,200}?)(?:INR|Rs\.?|₹|Rs)\s*([\d,]{4,})'
-        pattern2 = r'ESAR(?:.{0,200}?)(?:INR|Rs\.?|₹|Rs)\s*([\d,]{4,})'
-        
-        for pat in [pattern1, pattern2]:
-            match = re.search(pat, clean_text, re.IGNORECASE)
+        # ESOP first, then ESAR; up to 200 characters between the keyword and the amount
+        for pat in ESOP_PATTERNS:
+            match = pat.search(clean_text)
             if match:
                 raw_val = match.group(1).replace(',', '').strip()
                 try:
@@ -0,0 +1,234 @@
+import time
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import as_completed
+from typing import Dict, Any, List, Optional, Tuple, Union
+from . import metrics
+from .pipeline import DocumentRunner, new_summary, tally
+from .uploads import SpooledUpload
+
+# (file_name, content, file_result) as received by the API
+JobItem = Tuple[str, Optional[Union[bytes, SpooledUpload]], Optional[Dict[str, Any]]]
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+def discard_items(items: List[JobItem]) -> None:
+    """Releases the uploads of items that were never handed to the runner."""
+    for _, content, _ in items:
+        if content is not None and not isinstance(content, bytes):
+            content.discard()
+
+
+class Job:
+    def __init__(self, job_id: str, items: List[JobItem]):
+        self.job_id = job_id
+        self.status = "queued"
+        self.created_at = time.time()
+        self.finished_at = None
+        self.file_names = [name for name, _, _ in items]
+        self.results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        # Indexes of finished files in completion order; status(since=n) reports the ones after n
+        self.completed: List[int] = []
+        self.summary = new_summary()
+        self.error_message = None
+        # Uploaded bytes are only held until the job has been handed to the runner
+        self.items = items
+
+    @property
+    def done(self) -> int:
+        return len(self.completed)
+
+
+class JobManager:
+    """
+    Runs /jobs batches on background worker threads fed by a bounded queue.
+    Per-file work is dispatched through the shared DocumentRunner, so jobs use the
+    same process pool and result cache as /parse. With a time budget configured,
+    job documents always run in the pool, where the budget can be enforced.
+    Finished jobs expire ttl_seconds after they finished, and the oldest are dropped
+    once finished jobs hold more than max_files file results in total.
+    """
+
+    def __init__(self, runner: DocumentRunner, workers: int = 1, max_queued: int = 8,
+                 max_files: int = 10000, ttl_seconds: float = 3600):
+        self.runner = runner
+        self.workers = workers
+        self.max_files = max_files
+        self.ttl_seconds = ttl_seconds
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._jobs: Dict[str, Job] = {}
+        # job_id -> (expires_at, file count) of finished jobs, oldest first
+        self._finished = OrderedDict()
+        self._finished_files = 0
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        # Jobs still waiting for a worker never run; their uploads are released
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                continue
+            items, job.items = job.items, None
+            discard_items(items)
+            with self._lock:
+                job.status = "failed"
+                job.error_message = "The server shut down before the job started."
+                self._retire(job)
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, job_id: str, items: List[JobItem]) -> Job:
+        """
+        Queues a batch. Each item is (file_name, content, file_result), where content is
+        bytes or a SpooledUpload, and file_result is set instead of content for files
+        already rejected at upload time.
+        Raises JobQueueFull when the backlog is at capacity.
+        """
+        job = Job(job_id, items)
+        with self._lock:
+            self._jobs[job_id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job_id]
+            raise JobQueueFull("Job queue is full. Retry later.")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def status(self, job_id: str, since: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Progress counts, each file's name and status (queued, processing, done, or
+        failed with the job), plus the file results finished after the first `since`
+        ones, as {"index", "result"} records in completion order. Pass the returned
+        `next` as `since` on the following poll; the full payload is left to results().
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            pending_status = {"queued": "queued", "failed": "failed"}.get(job.status, "processing")
+            return {
+                "job_id": job.job_id,
+                "status": job.status,
+                "count": len(job.file_names),
+                "done": job.done,
+                "files": [{"file_name": name, "status": "done" if result is not None else pending_status}
+                          for name, result in zip(job.file_names, job.results)],
+                "results": [{"index": index, "result": job.results[index]} for index in job.completed[since:]],
+                "next": job.done,
+                "summary": dict(job.summary),
+                "error_message": job.error_message
+            }
+
+    def results(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Final payload in the same shape as /parse, or None while the job is unfinished.
+        """
+        job = self.get(job_id)
+        if job is None or job.status != "done":
+            return None
+        return {
+            "job_id": job.job_id,
+            "count": len(job.file_names),
+            "results": job.results,
+            "summary": job.summary
+        }
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                with metrics.BATCHES_IN_FLIGHT.track(endpoint="jobs"):
+                    self._run(job)
+            except Exception as e:
+                with self._lock:
+                    job.status = "failed"
+                    job.error_message = str(e)
+                    self._retire(job)
+
+    def _run(self, job: Job) -> None:
+        start_time = time.time()
+        with self._lock:
+            job.status = "running"
+
+        futures = {}
+        items, job.items = job.items, None
+        try:
+            for index, (filename, content, file_result) in enumerate(items):
+                # Handed over below, so the finally clause leaves it alone
+                items[index] = None
+                if file_result is not None:
+                    self._finish(job, index, file_result)
+                    continue
+                # Job threads cannot enforce the time budget themselves, so the runner may use the pool
+                future = self.runner.submit(content, filename, enforce_budget=True)
+                if future.done():
+                    # Inline mode and cache hits finish during submit; report them right away
+                    self._finish(job, index, future.result())
+                else:
+                    futures[future] = index
+        finally:
+            # Uploads not handed over when submission failed part-way
+            discard_items([item for item in items if item is not None])
+
+        for future in as_completed(futures):
+            self._finish(job, futures[future], future.result())
+
+        with self._lock:
+            job.summary["processing_seconds"] = round(time.time() - start_time, 2)
+            job.status = "done"
+            self._retire(job)
+
+    def _finish(self, job: Job, index: int, file_result: Dict[str, Any]) -> None:
+        with self._lock:
+            job.results[index] = file_result
+            job.completed.append(index)
+            tally(job.summary, file_result)
+
+    def _retire(self, job: Job) -> None:
+        # Called with the lock held once a job is done or failed
+        job.finished_at = time.time()
+        size = len(job.file_names)
+        self._finished[job.job_id] = (time.monotonic() + self.ttl_seconds, size)
+        self._finished_files += size
+        while self._finished and self._finished_files > self.max_files:
+            self._drop(next(iter(self._finished)))
+
+    def _expire(self) -> None:
+        # Finished jobs share one TTL and are kept in finishing order, so expired ones come first
+        now = time.monotonic()
+        while self._finished:
+            job_id, (expires_at, _) = next(iter(self._finished.items()))
+            if expires_at > now:
+                break
+            self._drop(job_id)
+
+    def _drop(self, job_id: str) -> None:
+        entry = self._finished.pop(job_id, None)
+        if entry:
+            self._finished_files -= entry[1]
+            self._jobs.pop(job_id, None)
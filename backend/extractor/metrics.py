@@ -0,0 +1,166 @@
+import time
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+# Per-document stage timings. process_document opens a collection around the
+# pipeline; stage() blocks and @timed helpers add their durations to it. The dict
+# travels back with the file_result, so timings measured in worker processes are
+# observed by the metrics of the API process.
+_current_timings = contextvars.ContextVar("stage_timings", default=None)
+
+
+@contextmanager
+def collect_timings():
+    timings: Dict[str, float] = {}
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def stage(name: str):
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def timed(name: str):
+    """Decorator form of stage(); repeated calls within one document accumulate."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            timings = _current_timings.get()
+            if timings is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+        return wrapper
+    return decorator
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[Tuple[str, str], ...], Any] = {}
+        REGISTRY.append(self)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.extend(self._render_value(labels, value))
+        return "\n".join(lines)
+
+    def _render_value(self, labels, value):
+        return [f"{self.name}{_format_labels(labels)} {value}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry["buckets"][i] += 1
+            entry["sum"] += value
+            entry["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _render_value(self, labels, entry):
+        lines = [
+            f"{self.name}_bucket{_format_labels(labels, ('le', str(bound)))} {count}"
+            for bound, count in zip(self.buckets, entry["buckets"])
+        ]
+        lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', '+Inf'))} {entry['count']}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {entry['sum']}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {entry['count']}")
+        return lines
+
+
+REGISTRY = []
+
+STAGE_SECONDS = Histogram("offer_extractor_stage_seconds", "Time spent per processing stage.")
+FILES_TOTAL = Counter("offer_extractor_files_total", "Files processed, by error_code (none on success).")
+BYTES_TOTAL = Counter("offer_extractor_bytes_processed_total", "Bytes of uploaded files read.")
+BATCHES_IN_FLIGHT = Gauge("offer_extractor_batches_in_flight", "Batches currently being processed, by endpoint.")
+
+
+def observe_file_result(file_result: Dict[str, Any]) -> None:
+    FILES_TOTAL.inc(error_code=file_result.get("error_code") or "none")
+    for name, seconds in (file_result.get("timings") or {}).items():
+        STAGE_SECONDS.observe(seconds, stage=name)
+
+
+def render() -> str:
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
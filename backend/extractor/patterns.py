@@ -0,0 +1,134 @@
+import re
+from typing import Dict, List
+from .config import ANCHOR_FIELDS, FIELD_CONFIG, REGEX_PATTERNS, SECTION_HEADERS
+
+# Every regex the section splitter and FieldParser run, compiled once at import time.
+# Names are "<field>.<variant>" so patterns can be listed and benchmarked individually.
+PATTERNS: Dict[str, "re.Pattern"] = {}
+
+CURRENCY = r'(?:INR|Rs\.?|₹|Rs)'
+DATE_VALUE = r'([0-9]{2}[-/][0-9]{2}[-/][0-9]{4}|\d{1,2}\s+[a-zA-Z]+\s+\d{4})'
+
+BONUS_TYPES = ("Joining", "Retention")
+EQUITY_TYPES = ("ESOP", "ESAR")
+
+
+def register(name: str, pattern: str, flags: int = 0) -> "re.Pattern":
+    if name in PATTERNS:
+        raise ValueError(f"Pattern '{name}' is already registered")
+    PATTERNS[name] = re.compile(pattern, flags)
+    return PATTERNS[name]
+
+
+def list_patterns() -> List[str]:
+    return sorted(PATTERNS)
+
+
+def compile_header_pattern(headers: List[str]) -> "re.Pattern":
+    """
+    One alternation over all section headers, allowing any whitespace between words.
+    It is case-sensitive over lowercased headers and meant to run on lowercased text:
+    without IGNORECASE and capture groups, sre can skip ahead using the set of first
+    characters, which keeps one scan for all headers about as cheap as one per header.
+    Longer headers are tried first so a header that prefixes another cannot shadow it.
+    """
+    alternatives = []
+    for header in sorted(headers, key=len, reverse=True):
+        alternatives.append(re.escape(header.lower()).replace(r'\ ', r'\s+'))
+    return re.compile("|".join(alternatives))
+
+
+def compile_anchor_pattern(anchors: List[str]) -> "re.Pattern":
+    """
+    One pattern for many field anchors, meant (like compile_header_pattern) to run
+    on lowercased text. The anchors are merged into a prefix tree, so "notice",
+    "notice period" and "notice pay" become notice(?:\\s+(?:pay|period))? and every
+    position in the text is tested against each shared prefix once, rather than
+    once per anchor. Longer anchors are preferred, and an anchor must start and end
+    on a word boundary ("to" does not match inside "total").
+    """
+    trie: dict = {}
+    for anchor in anchors:
+        node = trie
+        for token in " ".join(anchor.lower().split()):
+            node = node.setdefault(token, {})
+        # The end marker holds the trailing boundary check, if the anchor ends in a word character
+        node[""] = r'(?!\w)' if re.match(r'\w', anchor[-1]) else ""
+
+    def render(node: dict) -> str:
+        branches = [(r'\s+' if token == " " else re.escape(token)) + render(child)
+                    for token, child in sorted(node.items()) if token]
+        if "" in node:
+            branches.append(node[""])  # after the longer branches, so they are tried first
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return re.compile(r'(?<!\w)' + render(trie))
+
+
+# Section headers, located in a single pass by TextExtractor.split_sections
+PATTERNS["sections.headers"] = compile_header_pattern(list(SECTION_HEADERS))
+
+# The FIELD_CONFIG anchors of the ANCHOR_FIELDS, located in a single pass by extractor.anchors.AnchorEngine
+PATTERNS["anchors.fields"] = compile_anchor_pattern([a for field in ANCHOR_FIELDS for a in FIELD_CONFIG[field]])
+
+# Designation
+register("designation.scheduleA", r'Designation\s*[:\-]?\s*([^\n]+)', re.IGNORECASE)
+register("designation.intro_sentence", r'offer you the position of\s+([^,\.]+)', re.IGNORECASE)
+
+# Location: the last two comma-separated words right before 'India'
+# (matched from the start of a comma-separated part only, as the leftmost match is anyway)
+register("location.intro_sentence", r'(?<![^,])([^,]+),\s*([^,]+),\s*India', re.IGNORECASE)
+
+# Date of Joining
+register("date_of_joining.labeled_acceptance", rf'Date of Joining\s*[:\-]?\s*{DATE_VALUE}', re.IGNORECASE)
+register("date_of_joining.intro_sentence", rf'effective from your\s*{DATE_VALUE}', re.IGNORECASE)
+
+# Fast-path shapes for normalising the dates matched above (full-string matches)
+register("date.numeric", r'(\d{2})([-/])(\d{2})\2(\d{4})')
+register("date.day_month_year", r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})')
+
+# Compensation headline
+register("compensation.headline", rf'(?:total annual|aggregate)\s+compensation of\s*{CURRENCY}\s*([\d,]+)\s*per annum', re.IGNORECASE)
+
+# Schedule A (run on newline-flattened text)
+# (.{1,100}?) prevents capturing runaway text if the lookahead keyword is too far away
+register("scheduleA.name", r'Name\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Designation|Entity|Business\s*Unit|Department|Sub\s*[-]*\s*Department|Competency|Band|Grade|$))', re.IGNORECASE)
+register("scheduleA.entity", r'Entity\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Business\s*Unit|Department|Sub\s*[-]*\s*Department|Competency|Band|Grade|$))', re.IGNORECASE)
+register("scheduleA.department", r'Department\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Sub\s*[-]*\s*Department|Competency|Band|Grade|Name|$))', re.IGNORECASE)
+register("scheduleA.sub_department", r'Sub\s*[-]*\s*Department\s*[:\-]?\s*(.{1,100}?)(?=\s+(?:Competency|Band|Grade|Name|$))', re.IGNORECASE)
+# Strictly Uppercase or Numeric values to reject lowercase narrative strings (like "you")
+register("scheduleA.band", r'\bBand\s*[:\-]?\s*([0-9A-Z\.\-]+)\b')
+register("scheduleA.grade", r'\bGrade\s*[:\-]?\s*([0-9A-Z\.\-]+)\b')
+
+# Salary computation table rows: "<component> <per annum> <per month>"
+register("salary_table.row", r'^(.+?)\s+([\d,]+)(?:\.00)?\s+([\d,]+)(?:\.00)?$')
+
+# Bonuses, one set per type, tried in order:
+#   after:  [Type] Bonus ......... INR 100000 (up to 150 characters of anything in between)
+#   before: INR 100000 ......... [Type] Bonus
+#   bare:   "100000 as a Retention Bonus" without a currency marker
+# The bare amount may only start where a digit run starts: the leftmost match
+# always does, and retrying from every digit of a long run is quadratic.
+for _bonus_type in BONUS_TYPES:
+    register(f"bonus.{_bonus_type.lower()}.after", rf'{_bonus_type}\s*Bonus(?:.{{0,150}}?){CURRENCY}\s*([\d,]{{4,}})', re.IGNORECASE)
+    register(f"bonus.{_bonus_type.lower()}.before", rf'{CURRENCY}\s*([\d,]{{4,}})(?:.{{0,150}}?){_bonus_type}\s*Bonus', re.IGNORECASE)
+    register(f"bonus.{_bonus_type.lower()}.bare", rf'(?<![\d,])([\d,]{{4,}})(?:.{{0,150}}?){_bonus_type}\s*Bonus', re.IGNORECASE)
+
+# ESOP / ESAR value, up to 200 characters between the keyword and the amount
+for _equity_type in EQUITY_TYPES:
+    register(f"esop.{_equity_type.lower()}", rf'{_equity_type}(?:.{{0,200}}?){CURRENCY}\s*([\d,]{{4,}})', re.IGNORECASE)
+
+BONUS_PATTERNS = {
+    bonus_type: tuple(PATTERNS[f"bonus.{bonus_type.lower()}.{variant}"] for variant in ("after", "before", "bare"))
+    for bonus_type in BONUS_TYPES
+}
+ESOP_PATTERNS = tuple(PATTERNS[f"esop.{equity_type.lower()}"] for equity_type in EQUITY_TYPES)
+
+# Values read after a FIELD_CONFIG anchor by extractor.anchors
+register("anchors.currency", "|".join(f"(?:{p})" for p in REGEX_PATTERNS["currency"]), re.IGNORECASE)
+register("anchors.amount", r'([\d,]*\d(?:\.\d+)?)\s*(lakhs?|lpa|crores?|cr)?', re.IGNORECASE)
+register("anchors.duration", r'\b(\d{1,3}|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s*(?:\(\s*\d{1,3}\s*\)\s*)?(day|week|month|year)s?\b', re.IGNORECASE)
+# Separator after a label: "Notice Period: ...", "Department - ..."
+register("anchors.separator", r'[ \t]*[:\-–][ \t]*')
+register("anchors.text_value", r'[ \t]*[:\-–]?[ \t]*([A-Za-z][^\n,;]{0,79})')
+register("anchors.name_value", r"[ \t]*[:\-–]?[ \t]*(?:(?:Mr|Ms|Mrs|Dr)\.?[ \t]+)?([A-Z][a-zA-Z'\-]+(?:[ \t]+[A-Z][a-zA-Z'\-]+){1,3})\b")
@@ -0,0 +1,392 @@
+import asyncio
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from . import config
+from . import metrics
+from .cache import ResultCache
+from .uploads import SpooledUpload
+from .text_store import default_store
+from .budget import DocumentTimeout, can_enforce, time_budget
+from .archives import Archive, ArchiveMember, ArchiveMemberTooLarge, is_archive, is_supported
+from .text_extractor import TextExtractor
+from .field_parser import FieldParser, required_sections
+
+# One extractor/parser pair per process. Worker processes get their own copies
+# when they import this module, so nothing has to be pickled besides the file.
+_extractor = TextExtractor()
+_parser = FieldParser()
+
+
+def warm_up() -> None:
+    """
+    Loads what the extractors otherwise import on first use: PyMuPDF, NumPy,
+    python-docx and dateparser with its language data. Used by DocumentRunner.warm_up
+    and as the process pool's worker initializer when config.WARM_UP is set.
+    """
+    import fitz  # noqa: F401
+    import docx  # noqa: F401
+    from . import layout  # noqa: F401
+    from .field_parser import dateparser_normalize_date
+    dateparser_normalize_date("01 Janvier 2025")
+
+
+def new_file_result(filename: str) -> Dict[str, Any]:
+    return {
+        "file_name": filename,
+        "fields": {},
+        "confidence": {},
+        "methods": {},
+        "error_code": None,
+        "error_message": None,
+        "cache_hit": False
+    }
+
+
+def failed_result(filename: str, error_code: str, error_message: str) -> Dict[str, Any]:
+    file_result = new_file_result(filename)
+    file_result["error_code"] = error_code
+    file_result["error_message"] = error_message
+    return file_result
+
+
+def new_summary() -> Dict[str, Any]:
+    return {
+        "success": 0,
+        "failed": 0,
+        "scanned_pdf": 0,
+        "invalid_type": 0,
+        "processing_seconds": 0.0
+    }
+
+
+def tally(summary: Dict[str, Any], file_result: Dict[str, Any], include_timings: Optional[bool] = None) -> None:
+    """
+    Counts a finished file_result into the batch summary and the process-wide metrics.
+    Per-stage timings are dropped from the result unless include_timings
+    (default config.INCLUDE_STAGE_TIMINGS) asks for them.
+    """
+    metrics.observe_file_result(file_result)
+    if not (config.INCLUDE_STAGE_TIMINGS if include_timings is None else include_timings):
+        file_result.pop("timings", None)
+
+    error_code = file_result.get("error_code")
+    if error_code is None:
+        summary["success"] += 1
+    elif error_code in ("SCANNED_PDF", "SCANNED_OR_EMPTY"):
+        summary["scanned_pdf"] += 1
+    elif error_code == "INVALID_TYPE":
+        summary["invalid_type"] += 1
+    else:
+        summary["failed"] += 1
+
+
+def expand_archives(items: List[Tuple[str, Any, Optional[Dict[str, Any]]]]) -> List[Tuple[str, Any, Optional[Dict[str, Any]]]]:
+    """
+    Replaces every uploaded ZIP archive in a list of (file_name, content, file_result)
+    items with one item per member, named by the member's path inside the archive.
+    Only the archive directory is read here; members stay compressed until the
+    runner spools them. Unsupported members get INVALID_TYPE and members declaring
+    more than MAX_FILE_SIZE_BYTES get FILE_TOO_LARGE straight away.
+    """
+    expanded = []
+    for name, content, file_result in items:
+        if file_result is not None or not is_archive(name):
+            expanded.append((name, content, file_result))
+            continue
+
+        try:
+            archive = Archive(content)
+        except Exception as e:
+            # Damaged archives raise more than BadZipFile (NotImplementedError for a bogus
+            # version, OSError, ValueError); each is one failed file, not a failed request
+            content.discard()
+            expanded.append((name, None, failed_result(name, "PARSE_FAILED", f"Failed to read ZIP archive. {str(e)}")))
+            continue
+
+        members = list(archive.members())
+        if len(members) > config.MAX_ARCHIVE_MEMBERS:
+            archive.close()
+            expanded.append((name, None, failed_result(
+                name, "TOO_MANY_FILES", f"Archive holds more than {config.MAX_ARCHIVE_MEMBERS} files.")))
+            continue
+
+        for info in members:
+            if not is_supported(info.filename):
+                expanded.append((info.filename, None, failed_result(
+                    info.filename, "INVALID_TYPE", "INVALID_TYPE: Unsupported file format. Please upload DOCX or PDF.")))
+            elif info.file_size > config.MAX_FILE_SIZE_BYTES:
+                expanded.append((info.filename, None, failed_result(info.filename, "FILE_TOO_LARGE", "File exceeds 10MB limit.")))
+            else:
+                expanded.append((info.filename, archive.member(info), None))
+        archive.release()
+    return expanded
+
+
+def process_document(content: Union[bytes, str], filename: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Runs the extract -> split -> parse pipeline for a single file, given as bytes or a path.
+    Never raises: every failure is reported through error_code/error_message.
+    Module-level so it can be shipped to a ProcessPoolExecutor.
+    Seconds spent per stage are returned under "timings".
+    fields selects the fields to extract (see field_parser.select_fields; default all).
+    A document still running after config.DOCUMENT_TIMEOUT_SECONDS is interrupted
+    and reported as TIMEOUT.
+    """
+    with metrics.collect_timings() as timings:
+        with metrics.stage("pipeline"):
+            try:
+                with time_budget(config.DOCUMENT_TIMEOUT_SECONDS):
+                    file_result = _process_document(content, filename, fields)
+            except DocumentTimeout as e:
+                file_result = failed_result(filename, "TIMEOUT", f"Processing {str(e)}.")
+    file_result["timings"] = {name: round(seconds, 6) for name, seconds in timings.items()}
+    return file_result
+
+
+def _process_document(content: Union[bytes, str], filename: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    file_result = new_file_result(filename)
+    file_type = filename.lower().rsplit(".", 1)[-1] if "." in filename else "unknown"
+
+    try:
+        # Extract Text
+        try:
+            with metrics.stage(f"extract_text.{file_type}"):
+                text = _extractor.extract_text(content, filename)
+        except ValueError as ve:
+            err_str = str(ve)
+            if "SCANNED_PDF" in err_str:
+                file_result["error_code"] = "SCANNED_PDF"
+            elif "INVALID_TYPE" in err_str:
+                file_result["error_code"] = "INVALID_TYPE"
+            else:
+                file_result["error_code"] = "PARSE_FAILED"
+            file_result["error_message"] = err_str
+            return file_result
+
+        # Parse Fields
+        parse_text(text, file_result, fields)
+
+        # Only complete results are kept, since re-parsing diffs against them
+        store = default_store() if fields is None else None
+        if store is not None:
+            try:
+                with metrics.stage("text_store"):
+                    store.save(content, filename, text, file_result)
+            except OSError:
+                pass  # keeping the text is best-effort; the result is unaffected
+
+    except Exception as e:
+        file_result["error_code"] = "UNKNOWN_ERROR"
+        file_result["error_message"] = str(e)
+
+    return file_result
+
+
+def parse_text(text: str, file_result: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    The split -> parse half of the pipeline: fills file_result from extracted text.
+    Also used to re-parse stored text when the extraction rules change.
+    With fields, only the sections their extractors read are split out.
+    """
+    try:
+        with metrics.stage("split_sections"):
+            document = _extractor.split_document(text, required_sections(fields))
+        with metrics.stage("parse"):
+            parsed_data = _parser.parse(document, fields)
+        file_result.update(parsed_data) # fields, confidence, methods
+
+        # Check for empty document (heuristic)
+        if len(text) < 200:
+            file_result["error_code"] = "SCANNED_OR_EMPTY"
+            file_result["error_message"] = "Extracted text is too short. Might be an image/scanned PDF."
+    except Exception as e:
+        file_result["error_code"] = "UNKNOWN_ERROR"
+        file_result["error_message"] = f"Extraction login failed: {str(e)}"
+    return file_result
+
+
+class DocumentRunner:
+    """
+    Dispatches documents to process_document according to config.EXECUTION_MODE,
+    consulting the result cache first. Every submission returns a concurrent Future,
+    so async request handlers and background job threads consume results the same way.
+    A SpooledUpload is owned by the runner once submitted: workers receive its path
+    (or bytes, if it was small) and it is discarded when the document is done.
+    ZIP archive members are spooled at submission.
+
+    In process mode at most config.MAX_PENDING_DOCUMENTS documents are in flight,
+    so a 1,000-member archive is never spooled all at once. submit() blocks until a
+    worker frees a slot (for the /jobs threads); async handlers use submit_async(),
+    which waits for the slot without blocking the event loop.
+
+    The time budget needs the main thread, so submit(enforce_budget=True) from any
+    other thread (the /jobs threads) sends the document to the process pool even
+    in inline mode, unless config.DOCUMENT_TIMEOUT_SECONDS is 0.
+
+    A worker that dies (a crash inside MuPDF, say) breaks the whole pool. The files
+    it held are reported as UNKNOWN_ERROR and the pool is replaced, so later
+    documents are processed again.
+    """
+
+    def __init__(self, cache: ResultCache):
+        self.cache = cache
+        self._pool = None
+        self._slots = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._start_pool()
+            return self._pool
+
+    def _start_pool(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=config.WORKER_COUNT,
+                                         initializer=warm_up if config.WARM_UP else None)
+        self._slots = threading.BoundedSemaphore(config.MAX_PENDING_DOCUMENTS)
+
+    def _replace_broken_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            if self._pool is not pool:
+                return  # already replaced, or shut down
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._start_pool()
+
+    def warm_up(self) -> None:
+        """
+        Preloads heavy dependencies in this process and, in process mode, starts
+        the worker pool and waits for it, so the first request pays for neither.
+        """
+        warm_up()
+        if config.EXECUTION_MODE == "process":
+            self._get_pool().submit(warm_up).result()
+
+    def submit(self, content: Union[bytes, SpooledUpload, ArchiveMember], filename: str,
+               fields: Optional[List[str]] = None, enforce_budget: bool = False) -> Future:
+        pooled = config.EXECUTION_MODE == "process" or (
+            enforce_budget and config.DOCUMENT_TIMEOUT_SECONDS > 0 and not can_enforce())
+        if not pooled:
+            return self._submit(content, filename, fields)
+
+        self._get_pool()
+        slots = self._slots
+        slots.acquire()
+        return self._submit_with_slot(slots, content, filename, fields)
+
+    async def submit_async(self, content: Union[bytes, SpooledUpload, ArchiveMember], filename: str,
+                           fields: Optional[List[str]] = None) -> Future:
+        """
+        submit() for async request handlers: in process mode the wait for a free
+        pool slot happens in a thread, so the event loop keeps serving other
+        requests (and streaming finished results) meanwhile.
+        """
+        if config.EXECUTION_MODE != "process":
+            return self._submit(content, filename, fields)
+
+        self._get_pool()
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            acquire = asyncio.ensure_future(asyncio.to_thread(slots.acquire))
+            try:
+                await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # The thread still gets the slot eventually; hand it back
+                acquire.add_done_callback(lambda f: f.cancelled() or f.exception() or slots.release())
+                raise
+        return self._submit_with_slot(slots, content, filename, fields)
+
+    def _submit_with_slot(self, slots: threading.BoundedSemaphore, content: Union[bytes, SpooledUpload, ArchiveMember],
+                          filename: str, fields: Optional[List[str]]) -> Future:
+        """Submits to the pool holding an acquired slot, which is released once the document is done."""
+        try:
+            future = self._submit(content, filename, fields, pooled=True)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda f: slots.release())
+        return future
+
+    def _submit(self, content: Union[bytes, SpooledUpload, ArchiveMember], filename: str,
+                fields: Optional[List[str]] = None, pooled: bool = False) -> Future:
+        if isinstance(content, ArchiveMember):
+            try:
+                content = content.spool()
+            except ArchiveMemberTooLarge as e:
+                return self._done(failed_result(filename, "FILE_TOO_LARGE", str(e)))
+            except Exception as e:
+                return self._done(failed_result(filename, "PARSE_FAILED", f"Failed to read archive member. {str(e)}"))
+
+        upload = content if isinstance(content, SpooledUpload) else None
+        if upload is not None:
+            content = upload.source
+
+        key = None
+        if self.cache.enabled:
+            key = self.cache.key(content, filename, upload.sha256 if upload else None, fields)
+            cached = self.cache.get(key)
+            if cached is not None:
+                if upload is not None:
+                    upload.discard()
+                cached.update(file_name=filename, cache_hit=True)
+                return self._done(cached)
+
+        if pooled:
+            try:
+                pool = self._get_pool()
+                try:
+                    pool_future = pool.submit(process_document, content, filename, fields)
+                except BrokenProcessPool:
+                    # Broken by an earlier document; this one goes to a fresh pool
+                    self._replace_broken_pool(pool)
+                    pool = self._get_pool()
+                    pool_future = pool.submit(process_document, content, filename, fields)
+            except BaseException:
+                if upload is not None:
+                    upload.discard()
+                raise
+            future = Future()
+            pool_future.add_done_callback(lambda f: self._finish_pooled(f, future, pool, filename, key, upload))
+            return future
+
+        try:
+            file_result = process_document(content, filename, fields)
+        finally:
+            if upload is not None:
+                upload.discard()
+        if key:
+            self.cache.put(key, file_result)
+        return self._done(file_result)
+
+    def _finish_pooled(self, pool_future: Future, future: Future, pool: ProcessPoolExecutor, filename: str,
+                       key: Optional[str], upload: Optional[SpooledUpload]) -> None:
+        """Resolves the Future handed out by _submit once the pool is done with the document."""
+        if upload is not None:
+            upload.discard()
+        if pool_future.cancelled():
+            future.cancel()
+            return
+        error = pool_future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._replace_broken_pool(pool)
+            future.set_result(failed_result(filename, "UNKNOWN_ERROR",
+                                            "The worker process handling this file exited unexpectedly."))
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            if key:
+                self.cache.put(key, pool_future.result())
+            future.set_result(pool_future.result())
+
+    @staticmethod
+    def _done(file_result: Dict[str, Any]) -> Future:
+        future = Future()
+        future.set_result(file_result)
+        return future
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            pool, self._pool, self._slots = self._pool, None, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
@@ -0,0 +1,111 @@
+"""
+Re-applies the current split -> parse rules to every document in a text store,
+without extracting the files again, and reports what changed field by field.
+
+    python -m backend.extractor.reparse [STORE_DIR] [--diff diff.jsonl] [-o results.jsonl] [--dry-run]
+
+Each line of the diff is {"file_name", "key", "changes": {field: {"old", "new"}}}
+for a document whose fields or error_code differ from its stored result. The
+stored results are then replaced by the new ones, so the next run diffs against
+this one, unless --dry-run is given.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+from . import config
+from .cli import run_all
+from .budget import DocumentTimeout, time_budget
+from .pipeline import failed_result, new_file_result, parse_text
+from .text_store import TextStore
+
+
+def reparse_document(root: str, key: str, file_name: str) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Parses a stored document's text within config.DOCUMENT_TIMEOUT_SECONDS;
+    module-level so it can run in a worker process.
+    """
+    file_result = new_file_result(file_name)
+    text = TextStore(root).load_text(key)
+    try:
+        with time_budget(config.DOCUMENT_TIMEOUT_SECONDS):
+            parse_text(text, file_result)
+    except DocumentTimeout as e:
+        file_result = failed_result(file_name, "TIMEOUT", f"Processing {str(e)}.")
+    return file_name, key, file_result
+
+
+def diff_fields(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{field: {"old": ..., "new": ...}} for every field (and error_code) whose value changed."""
+    old = old or {}
+    changes = {}
+    if old.get("error_code") != new.get("error_code"):
+        changes["error_code"] = {"old": old.get("error_code"), "new": new.get("error_code")}
+    old_fields, new_fields = old.get("fields", {}), new.get("fields", {})
+    for name in {**new_fields, **old_fields}:
+        if old_fields.get(name) != new_fields.get(name):
+            changes[name] = {"old": old_fields.get(name), "new": new_fields.get(name)}
+    return changes
+
+
+def reparse(root: str, diff_path: str, workers: int, output: Optional[str] = None, dry_run: bool = False,
+            stream: TextIO = sys.stderr) -> Counter:
+    """
+    Re-parses the store's documents, writes the diff (and, with output, every new
+    result as JSONL) and returns how many documents changed per field.
+    """
+    store = TextStore(root)
+    documents = list(store.documents())
+    changed_fields = Counter()
+    changed_files = 0
+    start = time.perf_counter()
+
+    out = open(output, "w", encoding="utf-8") if output else None
+    try:
+        with open(diff_path, "w", encoding="utf-8") as diff:
+            for file_name, key, file_result in run_all(reparse_document, [(root, key, name) for name, key in documents], workers):
+                changes = diff_fields(store.load_result(key), file_result)
+                if changes:
+                    changed_files += 1
+                    changed_fields.update(changes.keys())
+                    diff.write(json.dumps({"file_name": file_name, "key": key, "changes": changes}, ensure_ascii=False) + "\n")
+                if out is not None:
+                    out.write(json.dumps(file_result, ensure_ascii=False) + "\n")
+                # A timeout says nothing about the rules; keep diffing against the last real result
+                if changes and not dry_run and file_result["error_code"] != "TIMEOUT":
+                    store.save_result(key, file_result)
+    finally:
+        if out is not None:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    rate = len(documents) / elapsed if elapsed else 0.0
+    print(f"reparsed {len(documents)} documents in {elapsed:.1f}s ({rate:.1f} docs/s), {changed_files} changed",
+          file=stream, flush=True)
+    for name, count in changed_fields.most_common():
+        print(f"  {name}: {count}", file=stream)
+    return changed_fields
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m backend.extractor.reparse",
+                                 description="Re-parse stored document text with the current rules and diff the results.")
+    ap.add_argument("store", nargs="?", default=config.TEXT_STORE_DIR, help="text store directory (default: TEXT_STORE_DIR)")
+    ap.add_argument("--diff", help="JSONL file for the per-field changes (default: STORE/diff.jsonl)")
+    ap.add_argument("-o", "--output", help="also write every new result to this JSONL file")
+    ap.add_argument("--workers", type=int, default=config.WORKER_COUNT,
+                    help="worker processes (default: EXTRACTOR_WORKERS or CPU count; 0 = no pool)")
+    ap.add_argument("--dry-run", action="store_true", help="report changes without replacing the stored results")
+    args = ap.parse_args(argv)
+    if not args.store:
+        ap.error("no text store given and TEXT_STORE_DIR is not set")
+
+    reparse(args.store, args.diff or os.path.join(args.store, "diff.jsonl"), args.workers, args.output, args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class ResultStore:
+    """
+    Recent /parse payloads keyed by job_id, so exports can be built server-side.
+    Entries expire ttl_seconds after they were stored, and the oldest are evicted
+    once more than max_files file results are held in total.
+    """
+
+    def __init__(self, max_files: int = 10000, ttl_seconds: float = 3600):
+        self.max_files = max_files
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._files = 0
+        self._lock = threading.Lock()
+
+    def put(self, job_id: str, payload: Dict[str, Any]) -> None:
+        size = len(payload["results"])
+        if self.max_files <= 0 or size > self.max_files:
+            return
+        with self._lock:
+            self._drop(job_id)
+            self._entries[job_id] = (time.monotonic() + self.ttl_seconds, size, payload)
+            self._files += size
+            while self._files > self.max_files:
+                self._drop(next(iter(self._entries)))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(job_id)
+            return entry[2] if entry else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def _expire(self) -> None:
+        # Entries are in insertion order and share one TTL, so expired ones come first
+        now = time.monotonic()
+        while self._entries:
+            job_id, (expires_at, _, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._drop(job_id)
+
+    def _drop(self, job_id: str) -> None:
+        entry = self._entries.pop(job_id, None)
+        if entry:
+            self._files -= entry[1]
@@ -1,66 +1,101 @@
 import io
-import docx
-import fitz  # PyMuPDF
 import re
+from typing import Dict, Iterator, Optional, Set, Tuple, Union
+from . import config
+from .docx_stream import extract_docx_text
+from .document import Document, strip_span
 from .config import SECTION_HEADERS
+from .patterns import PATTERNS, compile_header_pattern
 
 class TextExtractor:
-    def split_sections(self, full_text: str) -> dict:
+    def __init__(self, section_headers: Optional[Dict[str, str]] = None):
         """
-        Splits document into sections using case-insensitive anchors.
+        section_headers maps header text -> section key (defaults to config.SECTION_HEADERS).
+        """
+        if section_headers is None:
+            self.section_headers = SECTION_HEADERS
+            self._header_pattern = PATTERNS["sections.headers"]
+        else:
+            self.section_headers = section_headers
+            self._header_pattern = compile_header_pattern(list(section_headers))
+        # Matched header text (lowercased, single-spaced) -> section key
+        self._header_keys = {" ".join(h.lower().split()): key for h, key in self.section_headers.items()}
+        self._section_count = len(set(self._header_keys.values()))
+        self._header_pattern_ci = None
+
+    def _iter_headers(self, full_text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yields (position, key) for every header occurrence, in document order, in one scan.
+        """
+        search_text = full_text.lower()
+        pattern = self._header_pattern
+        if len(search_text) != len(full_text):
+            # A few characters change length when lowercased, which would shift offsets
+            if self._header_pattern_ci is None:
+                self._header_pattern_ci = re.compile(pattern.pattern, re.IGNORECASE)
+            search_text, pattern = full_text, self._header_pattern_ci
+
+        for match in pattern.finditer(search_text):
+            yield match.start(), self._header_keys[" ".join(match.group().lower().split())]
+
+    def _find_headers(self, full_text: str) -> list:
+        """
+        Returns (position, key) for the first occurrence of every section, in document order.
         """
-        sections = {
-            "header": "",
-            "compensation": "",
-            "terms": "",
-            "byod": "",
-            "scheduleA": "",
-            "salary_table": "",
-            "acceptance": ""
-        }
-        
-        header_mapping = {
-            "OFFER LETTER": "header",
-            "Compensation & Benefits": "compensation",
-            "Additional Terms and Conditions": "terms",
-            "BYOD": "byod",
-            "Schedule A": "scheduleA",
-            "SALARY COMPUTATION": "salary_table",
-            "ACCEPTANCE OF OFFER TERMS AND CONDITIONS": "acceptance"
-        }
-        
         found_sections = []
-        for header, key in header_mapping.items():
-            # Find the header case-insensitively, allowing varied whitespace and newlines between words
-            pattern = re.escape(header).replace(r'\ ', r'\s+')
-            for match in re.finditer(pattern, full_text, re.IGNORECASE):
-                found_sections.append((match.start(), key))
-                break  # Take the first occurrence
-                
-        # Sort sections by their physical position in the document
-        found_sections.sort(key=lambda x: x[0])
-        
+        seen = set()
+        for position, key in self._iter_headers(full_text):
+            if key not in seen:
+                seen.add(key)
+                found_sections.append((position, key))
+                if len(seen) == self._section_count:
+                    break
+        return found_sections
+
+    def split_sections(self, full_text: str, keys: Optional[Set[str]] = None) -> dict:
+        """
+        Splits document into sections using case-insensitive anchors.
+        All anchors are located in a single scan of the text.
+        With keys, only those sections are filled in; the others stay empty.
+        """
+        return self.split_document(full_text, keys).sections
+
+    def split_document(self, full_text: str, keys: Optional[Set[str]] = None) -> Document:
+        """
+        Like split_sections, but returns a Document holding the text and the section
+        offsets; section texts and other views are only built when an extractor reads them.
+        """
+        spans = {"header": None}
+        for key in self.section_headers.values():
+            spans[key] = None
+
+        # Sections in order of their physical position in the document
+        found_sections = self._find_headers(full_text)
+
         if not found_sections:
-            sections["header"] = full_text
-            return sections
-            
+            if keys is None or "header" in keys:
+                spans["header"] = (0, len(full_text))
+            return Document(full_text, spans)
+
         # The text before the first detected header is considered the 'header' or 'intro'
         first_section_start = found_sections[0][0]
-        if first_section_start > 0:
-            sections["header"] = full_text[:first_section_start].strip()
-            
-        # Extract content for each section
+        if first_section_start > 0 and (keys is None or "header" in keys):
+            spans["header"] = strip_span(full_text, 0, first_section_start)
+
+        # Offsets of each section's content
         for i in range(len(found_sections)):
             start_idx = found_sections[i][0]
             key = found_sections[i][1]
+            if keys is not None and key not in keys:
+                continue
             end_idx = found_sections[i+1][0] if i + 1 < len(found_sections) else len(full_text)
-            sections[key] = full_text[start_idx:end_idx].strip()
-            
-        return sections
+            spans[key] = strip_span(full_text, start_idx, end_idx)
+
+        return Document(full_text, spans)
 
-    def extract_text(self, file_content: bytes, filename: str) -> str:
+    def extract_text(self, file_content: Union[bytes, str], filename: str) -> str:
         """
-        Extracts raw text from a file (DOCX or PDF).
+        Extracts raw text from a file (DOCX or PDF), given its bytes or a path to it.
         Returns the extracted text string.
         Raises ValueError for unsupported types or empty content.
         """
@@ -73,9 +108,18 @@ class TextExtractor:
         else:
             raise ValueError("INVALID_TYPE: Unsupported file format. Please upload DOCX or PDF.")
 
-    def _extract_docx(self, content: bytes) -> str:
+    def _extract_docx(self, content: Union[bytes, str], engine: Optional[str] = None) -> str:
+        """
+        engine: "python-docx" or "stream" (see docx_stream), defaulting to config.DOCX_ENGINE.
+        """
+        if (engine or config.DOCX_ENGINE) == "stream":
+            try:
+                return extract_docx_text(content)
+            except Exception as e:
+                raise ValueError(f"PARSE_FAILED: Failed to parse DOCX. {str(e)}")
         try:
-            doc = docx.Document(io.BytesIO(content))
+            import docx  # deferred: only DOCX uploads pay for python-docx
+            doc = docx.Document(content if isinstance(content, str) else io.BytesIO(content))
             from docx.oxml.text.paragraph import CT_P
             from docx.oxml.table import CT_Tbl
             from docx.text.paragraph import Paragraph
@@ -98,38 +142,71 @@ class TextExtractor:
         except Exception as e:
             raise ValueError(f"PARSE_FAILED: Failed to parse DOCX. {str(e)}")
 
-    def _extract_pdf(self, content: bytes) -> str:
-        try:
-            doc = fitz.open(stream=content, filetype="pdf")
-            full_text = []
-            
+    def iter_pdf_pages(self, content: Union[bytes, str]) -> Iterator[str]:
+        """
+        Lazily yields the text of each PDF page ("" for pages without text).
+        Only one page's words are held at a time, and the document is closed
+        as soon as the caller stops iterating. content is the PDF's bytes or its
+        path; a path lets PyMuPDF read pages from disk on demand.
+        """
+        # Deferred: PyMuPDF and NumPy are only loaded once a PDF arrives
+        import fitz  # PyMuPDF
+        from .layout import words_to_text
+
+        if isinstance(content, str):
+            document = fitz.open(content, filetype="pdf")
+        else:
+            document = fitz.open(stream=content, filetype="pdf")
+        with document as doc:
             for page in doc:
                 words = page.get_text("words")
                 if words:
                     # Sort words spatially to preserve table layouts
-                    # words are (x0, y0, x1, y1, "word", block_no, line_no, word_no)
-                    lines = {}
-                    for w in words:
-                        # Group by y0, using a tolerance of e.g. 5 pixels to handle slight misalignments
-                        y = round(w[1] / 5) * 5
-                        if y not in lines:
-                            lines[y] = []
-                        lines[y].append(w)
-                    
-                    for y in sorted(lines.keys()):
-                        # Sort left to right
-                        line_words = sorted(lines[y], key=lambda x: x[0])
-                        full_text.append(" ".join(w[4] for w in line_words))
+                    yield words_to_text(words)
                 else:
                     # Fallback if words extraction fails (unlikely for text PDFs)
                     text = page.get_text("text")
-                    if text.strip():
-                        full_text.append(text)
+                    yield text if text.strip() else ""
+
+    def _extract_pdf(self, content: Union[bytes, str], early_stop: Optional[bool] = None, max_pages: Optional[int] = None) -> str:
+        """
+        early_stop: stop once every section in config.PDF_REQUIRED_SECTIONS has been seen
+        (plus config.PDF_TRAILING_PAGES more pages). max_pages caps the pages read.
+        Both default to their config values.
+        """
+        if early_stop is None:
+            early_stop = config.PDF_EARLY_STOP
+        if max_pages is None:
+            max_pages = config.PDF_MAX_PAGES
+        required = set(config.PDF_REQUIRED_SECTIONS)
+
+        try:
+            full_text = []
+            pages_read = 0
+            seen = set()
+            trailing_pages = None
+            
+            for page_text in self.iter_pdf_pages(content):
+                pages_read += 1
+                if page_text:
+                    full_text.append(page_text)
+
+                if max_pages and pages_read >= max_pages:
+                    break
+                if early_stop:
+                    if trailing_pages is None:
+                        seen.update(key for _, key in self._iter_headers(page_text))
+                        if required <= seen:
+                            trailing_pages = config.PDF_TRAILING_PAGES
+                    else:
+                        trailing_pages -= 1
+                    if trailing_pages == 0:
+                        break
             
             extracted_text = "\n".join(full_text)
             
             # Heuristic for scanned PDF
-            if len(extracted_text.strip()) < 50 and len(doc) > 0:
+            if len(extracted_text.strip()) < 50 and pages_read > 0:
                  raise ValueError("SCANNED_PDF: Text extraction yielded minimal results. File might be a scanned image.")
 
             return extracted_text
@@ -0,0 +1,109 @@
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from . import config
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def content_sha256(content: Union[bytes, str]) -> str:
+    """SHA-256 hex digest of a file's bytes, or of the file at a path."""
+    if not isinstance(content, str):
+        return hashlib.sha256(content).hexdigest()
+    digest = hashlib.sha256()
+    with open(content, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Several worker processes may store the same document at once
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class TextStore:
+    """
+    Extracted document text on disk, keyed by content hash and file extension, so
+    extraction rules can be re-applied without extracting the files again.
+
+    Each document has a gzip-compressed text file and a JSON copy of its latest
+    parse result under texts/<hash prefix>/, and index.jsonl records which file
+    names were stored under which key. Writes go through a temp file and a rename,
+    and index lines are appended, so pipeline worker processes can share a store.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._texts = os.path.join(root, "texts")
+        self._index = os.path.join(root, "index.jsonl")
+
+    @staticmethod
+    def key(digest: str, filename: str) -> str:
+        # The extension decides which extractor produced the text
+        return digest + os.path.splitext(filename.lower())[1]
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._texts, key[:2], key + suffix)
+
+    def save(self, content: Union[bytes, str], filename: str, text: str, file_result: Dict[str, Any]) -> str:
+        """
+        Stores the text extracted from content (bytes or a path) and the result it
+        parsed to. Returns the document's key.
+        """
+        key = self.key(content_sha256(content), filename)
+        os.makedirs(os.path.dirname(self._path(key, "")), exist_ok=True)
+        text_path = self._path(key, ".txt.gz")
+        if not os.path.exists(text_path):
+            _write_atomic(text_path, gzip.compress(text.encode("utf-8"), compresslevel=6))
+        self.save_result(key, file_result)
+        with open(self._index, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "file_name": filename}, ensure_ascii=False) + "\n")
+        return key
+
+    def save_result(self, key: str, file_result: Dict[str, Any]) -> None:
+        entry = {k: v for k, v in file_result.items() if k not in ("file_name", "cache_hit", "timings")}
+        _write_atomic(self._path(key, ".json"), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+    def load_text(self, key: str) -> str:
+        with gzip.open(self._path(key, ".txt.gz"), "rt", encoding="utf-8") as f:
+            return f.read()
+
+    def load_result(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def documents(self) -> Iterator[Tuple[str, str]]:
+        """
+        (file_name, key) for every stored file name, in the order first stored. A file
+        name stored again with different content refers to the latest content.
+        """
+        if not os.path.exists(self._index):
+            return
+        latest: Dict[str, str] = {}
+        with open(self._index, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interrupted write
+                latest[entry["file_name"]] = entry["key"]
+        yield from latest.items()
+
+
+def default_store() -> Optional[TextStore]:
+    """The store configured by TEXT_STORE_DIR, or None when text is not kept."""
+    return TextStore(config.TEXT_STORE_DIR) if config.TEXT_STORE_DIR else None
@@ -0,0 +1,177 @@
+import os
+import hashlib
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from . import config
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:
+    # python-multipart before 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+
+class SpooledUpload:
+    """
+    File bytes received in chunks. Small files stay in memory; once more than
+    max_memory bytes have arrived the data moves to a temporary file, which the
+    extractors then open by path instead of receiving another in-memory copy.
+    The SHA-256 used as the result cache key is computed as the bytes arrive.
+    """
+
+    def __init__(self, max_memory: Optional[int] = None, spool_dir: Optional[str] = None):
+        self.max_memory = config.UPLOAD_SPOOL_MEMORY_BYTES if max_memory is None else max_memory
+        self.spool_dir = spool_dir or config.UPLOAD_SPOOL_DIR
+        self.size = 0
+        self.path: Optional[str] = None
+        self._chunks: List[bytes] = []
+        self._data: Optional[bytes] = None
+        self._file = None
+        self._hash = hashlib.sha256()
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        if self._file is None and self.size > self.max_memory:
+            fd, self.path = tempfile.mkstemp(prefix="upload-", dir=self.spool_dir)
+            self._file = os.fdopen(fd, "wb")
+            for buffered in self._chunks:
+                self._file.write(buffered)
+            self._chunks = []
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def finish(self) -> "SpooledUpload":
+        if self._file is not None:
+            self._file.close()
+        elif self._data is None:
+            self._data = b"".join(self._chunks)
+            self._chunks = []
+        return self
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        """What TextExtractor.extract_text receives: the bytes, or the spooled file's path."""
+        return self.path if self.path is not None else self._data
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        self._chunks = []
+        self._data = None
+
+
+class UploadFormError(ValueError):
+    """A request body that cannot be read as multipart/form-data uploads."""
+
+
+class TooManyUploads(UploadFormError):
+    pass
+
+
+class MultipartUploads:
+    """
+    Reads the file parts of one form field from a multipart/form-data body as it
+    arrives. Each file goes straight into its own SpooledUpload, so it is held once:
+    in memory, or in the single temporary file that workers open by path. A file
+    stops being stored as soon as it passes limit_for(file_name) bytes; the rest of
+    it is only read off the connection. Other fields are skipped.
+    """
+
+    def __init__(self, content_type: str, limit_for: Callable[[str], int], field: str = "files",
+                 max_files: Optional[int] = None):
+        media_type, params = parse_options_header(content_type)
+        if media_type != b"multipart/form-data" or not params.get(b"boundary"):
+            raise UploadFormError("Expected a multipart/form-data body.")
+        self.limit_for = limit_for
+        self.field = field.encode()
+        self.max_files = max_files
+        # (file_name, upload); upload is None once the file passed its limit
+        self.files: List[Tuple[str, Optional[SpooledUpload]]] = []
+        # File bytes received so far, including those of files over their limit
+        self.received = 0
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._current: Optional[int] = None
+        self._limit = 0
+        self._parser = MultipartParser(params[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def write(self, chunk: bytes) -> None:
+        self._parser.write(chunk)
+
+    def finish(self) -> List[Tuple[str, Optional[SpooledUpload]]]:
+        self._parser.finalize()
+        if self._current is not None:
+            raise UploadFormError("The multipart body ended in the middle of a file.")
+        return self.files
+
+    def discard(self) -> None:
+        for _, upload in self.files:
+            if upload is not None:
+                upload.discard()
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._current = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if options.get(b"name") != self.field or b"filename" not in options:
+            return
+        if self.max_files is not None and len(self.files) >= self.max_files:
+            raise TooManyUploads(f"Too many files. Max {self.max_files}.")
+        file_name = options[b"filename"].decode("utf-8", "replace")
+        self._limit = self.limit_for(file_name)
+        self.files.append((file_name, SpooledUpload()))
+        self._current = len(self.files) - 1
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._current is None:
+            return
+        self.received += end - start
+        file_name, upload = self.files[self._current]
+        if upload is None:
+            return
+        if upload.size + end - start > self._limit:
+            upload.discard()
+            self.files[self._current] = (file_name, None)
+            return
+        upload.write(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._current is not None:
+            upload = self.files[self._current][1]
+            if upload is not None:
+                upload.finish()
+            self._current = None
@@ -1,28 +1,77 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from typing import List, Dict, Any
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
+from typing import List, Dict, Any, Optional
 import uvicorn
+import asyncio
 import shutil
 import os
 import uuid
 import time
-import pandas as pd
 import io
 import json
+import logging
 from datetime import datetime
+from contextlib import asynccontextmanager
 
 # Local imports
 try:
-    from extractor.text_extractor import TextExtractor
-    from extractor.field_parser import FieldParser
+    from extractor import config
+    from extractor import metrics
+    from extractor import budget
+    from extractor.pipeline import DocumentRunner, expand_archives, failed_result, new_summary, tally
+    from extractor.archives import is_archive
+    from extractor.field_parser import select_fields
+    from extractor.cache import ResultCache
+    from extractor.uploads import MultipartUploads, TooManyUploads, UploadFormError
+    from extractor.jobs import JobManager, JobQueueFull
+    from extractor.store import ResultStore
+    from extractor import exports
+    from extractor.exports import iter_csv, iter_parquet, iter_xlsx
 except ImportError:
     # For local running without package install
-    from .extractor.text_extractor import TextExtractor
-    from .extractor.field_parser import FieldParser
+    from .extractor import config
+    from .extractor import metrics
+    from .extractor import budget
+    from .extractor.pipeline import DocumentRunner, expand_archives, failed_result, new_summary, tally
+    from .extractor.archives import is_archive
+    from .extractor.field_parser import select_fields
+    from .extractor.cache import ResultCache
+    from .extractor.uploads import MultipartUploads, TooManyUploads, UploadFormError
+    from .extractor.jobs import JobManager, JobQueueFull
+    from .extractor.store import ResultStore
+    from .extractor import exports
+    from .extractor.exports import iter_csv, iter_parquet, iter_xlsx
 
 
-app = FastAPI(title="Offer Letter Data Extractor", version="1.0.0")
+# Per-file dispatch (inline or process pool) behind a content-addressed result cache
+runner = DocumentRunner(ResultCache(config.RESULT_CACHE_SIZE, config.RESULT_CACHE_PATH))
+
+# Background batches for the /jobs API
+jobs = JobManager(runner, workers=config.JOB_WORKERS, max_queued=config.JOB_QUEUE_SIZE,
+                  max_files=config.RESULT_STORE_MAX_FILES, ttl_seconds=config.RESULT_STORE_TTL_SECONDS)
+
+# Recent /parse payloads, so exports can be requested by job_id
+results_store = ResultStore(max_files=config.RESULT_STORE_MAX_FILES, ttl_seconds=config.RESULT_STORE_TTL_SECONDS)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config.DOCUMENT_TIMEOUT_SECONDS > 0 and not budget.supported():
+        logger.warning("DOCUMENT_TIMEOUT_SECONDS is set, but this platform has no SIGALRM interval timer: "
+                       "documents run without a time budget.")
+    if config.WARM_UP:
+        runner.warm_up()
+        exports.warm_up()
+    jobs.start()
+    yield
+    jobs.stop()
+    runner.shutdown()
+
+
+app = FastAPI(title="Offer Letter Data Extractor", version="1.0.0", lifespan=lifespan)
 
 # CORS Configuration
 origins = ["*"]
@@ -35,213 +84,314 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Services
-extractor = TextExtractor()
-parser = FieldParser()
-
 @app.get("/health")
 def health_check():
     return {"status": "ok", "version": "1.0.0"}
 
-@app.post("/parse")
-async def parse_files(files: List[UploadFile] = File(...)):
+@app.get("/cache/stats")
+def cache_stats():
+    return runner.cache.stats()
+
+@app.get("/metrics")
+def get_metrics():
+    """
+    Prometheus text exposition: per-stage latency histograms, files per error_code,
+    bytes processed and batches in flight.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+def _size_limit(filename: str) -> int:
+    return config.MAX_ARCHIVE_SIZE_BYTES if is_archive(filename) else config.MAX_FILE_SIZE_BYTES
+
+def _too_large(filename: str) -> Dict[str, Any]:
+    if is_archive(filename):
+        return failed_result(filename, "FILE_TOO_LARGE", f"Archive exceeds {config.MAX_ARCHIVE_SIZE_BYTES // (1024 * 1024)}MB limit.")
+    return failed_result(filename, "FILE_TOO_LARGE", "File exceeds 10MB limit.")
+
+# The upload endpoints parse their multipart body themselves (see _read_uploads),
+# so the `files` form field is described to OpenAPI here
+UPLOAD_FORM = {"requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {
+    "type": "object",
+    "required": ["files"],
+    "properties": {"files": {"type": "array", "items": {"type": "string", "format": "binary"}}}
+}}}}}
+
+async def _read_uploads(request: Request) -> list:
+    """
+    Reads the `files` parts of the request body into (file_name, content, file_result)
+    items as the bytes arrive, with ZIP archives expanded into one item per member
+    (members are not decompressed yet). Each file is spooled once, by its
+    SpooledUpload; one that passes its size limit is no longer stored and is
+    reported as FILE_TOO_LARGE, while the rest of the body is still read.
+    """
+    try:
+        form = MultipartUploads(request.headers.get("content-type", ""), _size_limit,
+                                max_files=config.MAX_FILES_PER_REQUEST)
+    except UploadFormError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        with metrics.STAGE_SECONDS.time(stage="upload_read"):
+            async for chunk in request.stream():
+                received = form.received
+                form.write(chunk)
+                metrics.BYTES_TOTAL.inc(form.received - received)
+            files = form.finish()
+    except TooManyUploads as e:
+        form.discard()
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        form.discard()
+        raise HTTPException(status_code=400, detail=f"Could not read the uploaded files. {str(e)}")
+    if not files:
+        form.discard()
+        raise HTTPException(status_code=422, detail="No files uploaded in the `files` field.")
+
+    return expand_archives([(filename, upload, None if upload else _too_large(filename)) for filename, upload in files])
+
+def _select_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parses a comma-separated ?fields= selection; unknown fields are a 400."""
+    if fields is None:
+        return None
+    try:
+        return select_fields(fields.split(","))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/parse", openapi_extra=UPLOAD_FORM)
+async def parse_files(request: Request, timings: bool = False, fields: Optional[str] = None):
+    """
+    ?fields=designation,comp_total_annual_inr,... runs only the extractors those
+    fields need and returns only them; by default every field is extracted.
+    """
+    # Clients asking for NDJSON get the streaming variant
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return await parse_files_stream(request, timings, fields)
+
+    with metrics.BATCHES_IN_FLIGHT.track(endpoint="parse"):
+        return await _parse_batch(request, timings, _select_fields(fields))
+
+async def _parse_batch(request: Request, timings: bool, fields: Optional[List[str]] = None):
     job_id = str(uuid.uuid4())
     start_time = time.time()
+    summary = new_summary()
     
-    # Limits
-    if len(files) > 120:
-        raise HTTPException(status_code=413, detail="Too many files. Max 120.")
-        
+    # Submit everything first so process mode can work on all files at once,
+    # then collect in upload order.
+    pending = []
+    for filename, content, file_result in await _read_uploads(request):
+        if file_result is None:
+            file_result = await runner.submit_async(content, filename, fields)
+        pending.append(file_result)
+
     results = []
-    summary = {
-        "success": 0,
-        "failed": 0,
-        "scanned_pdf": 0,
-        "invalid_type": 0,
-        "processing_seconds": 0.0
-    }
-    
-    for file in files:
-        file_result = {
-            "file_name": file.filename,
-            "fields": {},
-            "confidence": {},
-            "methods": {},
-            "error_code": None,
-            "error_message": None
-        }
-        
-        # Size Limit (10MB) - Approximate check based on spooled file
-        # Note: UploadFile size might not be available immediately if spooled
-        # We'll read it into memory (safe for <10MB)
-        
-        try:
-            content = await file.read()
-            if len(content) > 10 * 1024 * 1024:
-                file_result["error_code"] = "FILE_TOO_LARGE"
-                file_result["error_message"] = "File exceeds 10MB limit."
-                summary["failed"] += 1
-                results.append(file_result)
-                continue
-
-            # Extract Text
-            try:
-                text = extractor.extract_text(content, file.filename)
-            except ValueError as ve:
-                err_str = str(ve)
-                if "SCANNED_PDF" in err_str:
-                     file_result["error_code"] = "SCANNED_PDF"
-                     summary["scanned_pdf"] += 1
-                elif "INVALID_TYPE" in err_str:
-                     file_result["error_code"] = "INVALID_TYPE"
-                     summary["invalid_type"] += 1
-                else:
-                     file_result["error_code"] = "PARSE_FAILED"
-                     summary["failed"] += 1
-                
-                file_result["error_message"] = err_str
-                results.append(file_result)
-                continue
-
-            # Parse Fields
-            try:
-                sections = extractor.split_sections(text)
-                parsed_data = parser.parse(sections)
-                file_result.update(parsed_data) # fields, confidence, methods
-                
-                # Check for empty document (heuristic)
-                if len(text) < 200:
-                    file_result["error_code"] = "SCANNED_OR_EMPTY"
-                    file_result["error_message"] = "Extracted text is too short. Might be an image/scanned PDF."
-                    summary["scanned_pdf"] += 1
-                else:
-                    summary["success"] += 1
-                    
-            except Exception as e:
-                file_result["error_code"] = "UNKNOWN_ERROR"
-                file_result["error_message"] = f"Extraction login failed: {str(e)}"
-                summary["failed"] += 1
-            
-            results.append(file_result)
-            
-        except Exception as e:
-            file_result["error_code"] = "UNKNOWN_ERROR"
-            file_result["error_message"] = str(e)
-            summary["failed"] += 1
-            results.append(file_result)
+    for item in pending:
+        file_result = item if isinstance(item, dict) else await asyncio.wrap_future(item)
+        tally(summary, file_result, timings or None)
+        results.append(file_result)
 
     summary["processing_seconds"] = round(time.time() - start_time, 2)
     
-    return {
+    payload = {
         "job_id": job_id,
-        "count": len(files),
+        "count": len(results),
         "results": results,
         "summary": summary
     }
+    results_store.put(job_id, payload)
+    return payload
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+def _format_record(record: Dict[str, Any], sse: bool) -> str:
+    if sse:
+        return f"event: {record['type']}\ndata: {json.dumps(record)}\n\n"
+    return json.dumps(record) + "\n"
+
+async def _stream_results(job_id: str, uploads: list, sse: bool, timings: bool = False,
+                         fields: Optional[List[str]] = None):
+    """
+    Yields one record per file as soon as it is finished, then a final summary record.
+    Results are counted into the summary and dropped, never collected.
+    """
+    try:
+        with metrics.BATCHES_IN_FLIGHT.track(endpoint="parse_stream"):
+            async for record in _stream_batch(job_id, uploads, sse, timings, fields):
+                yield record
+    finally:
+        # Uploads not yet handed to the runner when a client disconnects
+        for item in uploads:
+            if item is not None and item[1] is not None:
+                item[1].discard()
+
+async def _stream_batch(job_id: str, uploads: list, sse: bool, timings: bool, fields: Optional[List[str]] = None):
+    start_time = time.time()
+    summary = new_summary()
+    count = len(uploads)
+
+    def file_record(index, file_result):
+        tally(summary, file_result, timings or None)
+        return _format_record({"type": "file_result", "index": index, "result": file_result}, sse)
+
+    # Submission runs as a producer task, so results are streamed in completion
+    # order while later files still wait for a process pool slot. Queue items are
+    # (index, file_result or finished asyncio future), or (None, exception).
+    finished = asyncio.Queue()
+
+    async def submit_all():
+        try:
+            for index, (filename, content, file_result) in enumerate(uploads):
+                if file_result is None:
+                    future = await runner.submit_async(content, filename, fields)
+                    uploads[index] = None
+                    if not future.done():
+                        asyncio.wrap_future(future).add_done_callback(lambda f, index=index: finished.put_nowait((index, f)))
+                        continue
+                    file_result = future.result()
+                uploads[index] = None
+                finished.put_nowait((index, file_result))
+                # Inline submissions finish without suspending; let the record go out
+                # before the next document blocks the loop
+                await asyncio.sleep(0)
+        except Exception as e:
+            finished.put_nowait((None, e))
+
+    producer = asyncio.create_task(submit_all())
+    try:
+        for _ in range(count):
+            index, item = await finished.get()
+            if index is None:
+                raise item
+            yield file_record(index, item.result() if isinstance(item, asyncio.Future) else item)
+    finally:
+        producer.cancel()
+
+    summary["processing_seconds"] = round(time.time() - start_time, 2)
+    yield _format_record({"type": "summary", "job_id": job_id, "count": count, "summary": summary}, sse)
+
+@app.post("/parse/stream", openapi_extra=UPLOAD_FORM)
+async def parse_files_stream(request: Request, timings: bool = False, fields: Optional[str] = None):
+    """
+    Streaming variant of /parse. Emits NDJSON by default, or Server-Sent Events
+    when the client accepts text/event-stream. Each file_result record carries the
+    file's upload index, since results arrive in completion order.
+    """
+    job_id = str(uuid.uuid4())
+    selected = _select_fields(fields)
+
+    # The request body is read before streaming starts
+    uploads = await _read_uploads(request)
+
+    sse = SSE_MEDIA_TYPE in request.headers.get("accept", "")
+    return StreamingResponse(_stream_results(job_id, uploads, sse, timings, selected),
+                             media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE)
+
+@app.post("/jobs", status_code=202, openapi_extra=UPLOAD_FORM)
+async def create_job(request: Request):
+    job_id = str(uuid.uuid4())
+    items = await _read_uploads(request)
+    try:
+        jobs.submit(job_id, items)
+    except JobQueueFull as e:
+        for _, content, _ in items:
+            if content is not None:
+                content.discard()
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return {"job_id": job_id, "status": "queued", "count": len(items)}
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, since: int = Query(0, ge=0)):
+    status = jobs.status(job_id, since)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status
+
+@app.get("/jobs/{job_id}/results")
+def get_job_results(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"Job failed: {job.error_message}")
+    payload = jobs.results(job_id)
+    if payload is None:
+        raise HTTPException(status_code=409, detail=f"Job is still {job.status}")
+    return payload
+
+def _stored_results(job_id: str) -> List[Dict[str, Any]]:
+    """
+    Results of a /parse call or a finished job, for exports requested by job_id.
+    """
+    payload = results_store.get(job_id) or jobs.results(job_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="No stored results for this job_id. They may have expired.")
+    return payload["results"]
+
+@app.get("/export/csv")
+def export_csv_by_job(job_id: str):
+    return _export_csv(_stored_results(job_id))
 
 @app.post("/export/csv")
 async def export_csv(data: Dict[str, Any] = Body(...)):
     results = data.get("results", [])
     if not results:
         raise HTTPException(status_code=400, detail="No data provided to export")
-    
-    # Flatten the data for CSV
-    flat_data = []
-    for item in results:
-        row = {"File Name": item.get("file_name")}
-        
-        # Add fields
-        fields = item.get("fields", {})
-        for k, v in fields.items():
-            row[k] = v
-            
-        # Add Error info
-        if item.get("error_code"):
-            row["Error Code"] = item.get("error_code")
-            row["Error Message"] = item.get("error_message")
-            
-        flat_data.append(row)
-
-    df = pd.DataFrame(flat_data)
-    stream = io.StringIO()
-    df.to_csv(stream, index=False)
-    
-    response = StreamingResponse(iter([stream.getvalue()]),
-                                 media_type="text/csv")
+    return _export_csv(results)
+
+def _observed(chunks, stage: str):
+    # Streamed exports are timed until their last chunk has been produced
+    with metrics.STAGE_SECONDS.time(stage=stage):
+        yield from chunks
+
+def _export_csv(results: List[Dict[str, Any]]):
+    response = StreamingResponse(_observed(iter_csv(results), "export.csv"), media_type="text/csv")
     response.headers["Content-Disposition"] = "attachment; filename=export.csv"
     return response
 
+@app.get("/export/xlsx")
+def export_xlsx_by_job(job_id: str, long_format: bool = False):
+    return _export_xlsx(_stored_results(job_id), long_format)
+
 @app.post("/export/xlsx")
-async def export_xlsx(data: Dict[str, Any] = Body(...)):
+async def export_xlsx(data: Dict[str, Any] = Body(...), long_format: bool = False):
     results = data.get("results", [])
     if not results:
         raise HTTPException(status_code=400, detail="No data provided to export")
-        
-    flat_data = []
-    
-    # Pre-collect all unique salary components to create stable columns
-    all_components = set()
-    for item in results:
-        rows = item.get("fields", {}).get("salary_table_rows", [])
-        for r in rows:
-            all_components.add(r.get("component"))
-            
-    # Sort them alphabetically for consistent ordering
-    sorted_components = sorted(list(all_components))
-            
-    for item in results:
-        fname = item.get("file_name")
-        fields = item.get("fields", {})
-        
-        row = {
-            "File Name": fname,
-            "Name": fields.get("scheduleA_name"),
-            "Entity": fields.get("scheduleA_entity"),
-            "Designation": fields.get("designation"),
-            "City": fields.get("location_city"),
-            "State": fields.get("location_state"),
-            "Joining Date": fields.get("date_of_joining_raw"),
-            "Total CTC (INR)": fields.get("comp_total_annual_inr"),
-            "Joining Bonus (INR)": fields.get("bonus_joining_inr"),
-            "Retention Bonus (INR)": fields.get("bonus_retention_inr"),
-            "ESOP Amount (INR)": fields.get("esop_amount_inr"),
-            "Department": fields.get("scheduleA_department"),
-            "Sub-Department": fields.get("scheduleA_sub_department"),
-            "BYOD": fields.get("byod_clause"),
-            "Band": fields.get("scheduleA_band"),
-            "Grade": fields.get("scheduleA_grade"),
-            "Table Gross Salary": fields.get("salary_table_totals", {}).get("gross_salary"),
-            "Table Long Term Benefits": fields.get("salary_table_totals", {}).get("long_term_benefits"),
-            "Table Fixed CTC": fields.get("salary_table_totals", {}).get("fixed_ctc"),
-            "Table Total CTC": fields.get("salary_table_totals", {}).get("total_ctc")
-        }
-        
-        # Denormalize dynamic salary components as columns
-        salary_rows = fields.get("salary_table_rows", [])
-        for comp in sorted_components:
-            # Find if this file has this specific component
-            match = next((r for r in salary_rows if r.get("component") == comp), None)
-            row[f"{comp} (Per Annum)"] = match.get("per_annum") if match else None
-            row[f"{comp} (Per Month)"] = match.get("per_month") if match else None
-
-        if item.get("error_code"):
-            row["Error Code"] = item.get("error_code")
-            row["Error Message"] = item.get("error_message")
-            
-        flat_data.append(row)
-
-    # Create Excel file in memory
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df = pd.DataFrame(flat_data)
-        df.to_excel(writer, index=False, sheet_name='Extracted Data')
-        
-    output.seek(0)
-    
-    response = StreamingResponse(output, 
+    return _export_xlsx(results, long_format)
+
+def _export_xlsx(results: List[Dict[str, Any]], long_format: bool):
+    response = StreamingResponse(_observed(iter_xlsx(results, long_format), "export.xlsx"),
                                  media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
     response.headers["Content-Disposition"] = "attachment; filename=export.xlsx"
     return response
 
+@app.get("/export/parquet")
+def export_parquet_by_job(job_id: str, table: str = "fields", include_confidence: bool = False):
+    return _export_parquet(_stored_results(job_id), table, include_confidence)
+
+@app.post("/export/parquet")
+async def export_parquet(data: Dict[str, Any] = Body(...), table: str = "fields", include_confidence: bool = False):
+    results = data.get("results", [])
+    if not results:
+        raise HTTPException(status_code=400, detail="No data provided to export")
+    return _export_parquet(results, table, include_confidence)
+
+def _export_parquet(results: List[Dict[str, Any]], table: str, include_confidence: bool):
+    """
+    table="fields" is one row per file; table="salary_rows" is one row per salary
+    component, keyed by file_name.
+    """
+    try:
+        chunks = iter_parquet(results, table, include_confidence)
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow to be installed")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response = StreamingResponse(_observed(chunks, "export.parquet"), media_type="application/vnd.apache.parquet")
+    response.headers["Content-Disposition"] = f"attachment; filename=export_{table}.parquet"
+    return response
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
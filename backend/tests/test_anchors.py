@@ -0,0 +1,76 @@
+import pytest
+from extractor.anchors import AnchorEngine, normalize_amount
+from extractor.config import ANCHOR_FIELDS, FIELD_CONFIG
+from extractor.field_parser import FieldParser
+from extractor.patterns import PATTERNS, compile_anchor_pattern
+from extractor.text_extractor import TextExtractor
+
+
+def test_anchor_pattern_matches_every_anchor_of_the_anchor_fields():
+    pattern = PATTERNS["anchors.fields"]
+    for field in ANCHOR_FIELDS:
+        for anchor in FIELD_CONFIG[field]:
+            assert pattern.fullmatch(anchor.lower()), anchor
+    # Anchors of fields left to the dedicated extractors are not scanned for
+    assert pattern.search("department") is None
+
+
+def test_anchor_pattern_prefers_longest_and_respects_word_boundaries():
+    pattern = compile_anchor_pattern(["Name", "Name of the Candidate", "Dept"])
+    assert pattern.search("name of  the\ncandidate: x").group() == "name of  the\ncandidate"
+    assert pattern.search("rename") is None
+    assert pattern.search("depth") is None
+
+
+def test_short_anchors_are_case_sensitive():
+    engine = AnchorEngine({"candidate_name": ["To"], "department": ["Dept"]})
+    anchors = [anchor for _, _, anchor in engine.hits("Welcome to the team. To: Jane Smith. DEPT: Sales")]
+    assert anchors == ["to", "dept"]
+
+
+@pytest.mark.parametrize("text, value", [
+    ("Rs. 1.2 Cr", 12000000),
+    ("INR 7,29,600", 729600),
+    ("12 LPA", 1200000),
+    ("₹ 7.5 Lakhs", 750000),
+    ("no amount", None),
+])
+def test_normalize_amount(text, value):
+    assert normalize_amount(text) == value
+
+
+def test_extract_reads_values_after_anchors():
+    text = ("Dear Vikram Iyer,\n"
+            "Reporting To: Priya Nair, Head of Engineering.\n"
+            "Probation Period: 6 months from the date of joining.\n"
+            "Either party may end this employment with two months' notice.\n"
+            "Annual CTC: INR 12,50,000\n")
+    results = AnchorEngine().extract(text)
+    assert results["candidate_name"] == ("Vikram Iyer", 0.7, "anchor")
+    assert results["reporting_manager"] == ("Priya Nair", 0.9, "anchor")
+    assert results["probation_period"] == ("6 months", 0.9, "anchor")
+    assert results["notice_period"][0] == "2 months"
+    assert results["ctc"] == (1250000, 0.9, "anchor")
+    assert set(results) == set(ANCHOR_FIELDS)
+
+    only = AnchorEngine().extract("Notice Period: 60 days", ["notice_period", "reporting_manager"])
+    assert only == {"notice_period": ("60 days", 0.9, "anchor"), "reporting_manager": (None, 0.0, "missing")}
+
+
+def test_field_parser_reports_anchor_fields():
+    sections = TextExtractor().split_sections("Dear Vikram Iyer,\nYour probation period will be six months.\n"
+                                              "Your Annual CTC will be Rs. 7.5 Lakhs.\n")
+    parsed = FieldParser().parse(sections)
+    assert {"candidate_name", "probation_period", "notice_period", "reporting_manager", "anchor_ctc_inr"} <= set(parsed["fields"])
+    assert "ctc" not in parsed["fields"]
+    assert parsed["fields"]["anchor_ctc_inr"] == 750000 and parsed["methods"]["anchor_ctc_inr"] == "anchor"
+    assert parsed["fields"]["candidate_name"] == "Vikram Iyer"
+    assert parsed["fields"]["probation_period"] == "6 months"
+    assert parsed["methods"]["probation_period"] == "anchor"
+    assert parsed["fields"]["notice_period"] is None and parsed["methods"]["notice_period"] == "missing"
+
+
+def test_anchor_ctc_can_be_selected_on_its_own():
+    sections = TextExtractor().split_sections("Total CTC: INR 1.2 Cr per annum\n")
+    parsed = FieldParser().parse(sections, fields=["anchor_ctc_inr"])
+    assert parsed["fields"] == {"anchor_ctc_inr": 12000000}
@@ -0,0 +1,269 @@
+import os
+import io
+import json
+import asyncio
+import time
+import pytest
+import docx
+from fastapi.testclient import TestClient
+
+import main
+from extractor import config
+from extractor.cache import ResultCache
+from extractor import pipeline
+from extractor.pipeline import DocumentRunner, process_document
+from test_parser import SUPPORT_TEMPLATE_TEXT, SALES_FIELD_TEMPLATE_TEXT
+
+
+def make_docx(text: str) -> bytes:
+    document = docx.Document()
+    for line in text.strip().split("\n"):
+        document.add_paragraph(line)
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
+
+
+SUPPORT_DOCX = make_docx(SUPPORT_TEMPLATE_TEXT)
+SALES_DOCX = make_docx(SALES_FIELD_TEMPLATE_TEXT)
+
+
+def upload_batch():
+    return [
+        ("files", ("support.docx", SUPPORT_DOCX, "application/octet-stream")),
+        ("files", ("notes.txt", b"not an offer letter", "text/plain")),
+        ("files", ("sales.docx", SALES_DOCX, "application/octet-stream")),
+    ]
+
+
+@pytest.mark.parametrize("mode", ["inline", "process"])
+def test_parse_execution_modes(monkeypatch, mode):
+    monkeypatch.setattr(config, "EXECUTION_MODE", mode)
+    monkeypatch.setattr(config, "WORKER_COUNT", 2)
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        response = client.post("/parse", files=upload_batch())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [r["file_name"] for r in data["results"]] == ["support.docx", "notes.txt", "sales.docx"]
+    assert data["results"][0]["fields"]["designation"] == "Customer Support Executive"
+    assert data["results"][1]["error_code"] == "INVALID_TYPE"
+    assert data["results"][2]["fields"]["byod_clause"] == "Yes"
+
+    summary = data["summary"]
+    assert (summary["success"], summary["failed"], summary["scanned_pdf"], summary["invalid_type"]) == (2, 0, 0, 1)
+
+
+def test_parse_too_many_files(monkeypatch):
+    monkeypatch.setattr(config, "MAX_FILES_PER_REQUEST", 1)
+    with TestClient(main.app) as client:
+        response = client.post("/parse", files=upload_batch())
+    assert response.status_code == 413
+
+
+def test_parse_marks_cache_hits(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=16))
+
+    with TestClient(main.app) as client:
+        first = client.post("/parse", files=upload_batch()).json()
+        second = client.post("/parse", files=upload_batch()).json()
+        stats = client.get("/cache/stats").json()
+
+    assert [r["cache_hit"] for r in first["results"]] == [False, False, False]
+    assert [r["cache_hit"] for r in second["results"]] == [True, True, True]
+    assert second["results"][0]["fields"] == first["results"][0]["fields"]
+    assert second["summary"]["success"] == first["summary"]["success"] == 2
+    assert stats["hits"] == 3 and stats["misses"] == 3
+
+
+def test_parse_field_selection(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=16))
+
+    with TestClient(main.app) as client:
+        full = client.post("/parse", files=upload_batch()).json()
+        narrow = client.post("/parse?fields=designation,comp_total_annual_inr", files=upload_batch()).json()
+        streamed = client.post("/parse/stream?fields=designation", files=upload_batch())
+        bad = client.post("/parse?fields=designation,salary", files=upload_batch())
+
+    assert [r["cache_hit"] for r in narrow["results"]] == [False, False, False]
+    for full_result, result in zip(full["results"], narrow["results"]):
+        if result["error_code"] is None:
+            assert result["fields"] == {k: full_result["fields"][k] for k in ("designation", "comp_total_annual_inr")}
+    records = [json.loads(line) for line in streamed.text.splitlines()]
+    assert {record["index"]: record["result"]["fields"] for record in records if record["type"] == "file_result"}[0] == \
+        {"designation": "Customer Support Executive"}
+    assert bad.status_code == 400 and "salary" in bad.json()["detail"]
+
+
+def wait_for_job(client, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f"/jobs/{job_id}").json()
+        if status["status"] in ("done", "failed"):
+            return status
+        time.sleep(0.05)
+    raise AssertionError("job did not finish")
+
+
+def test_job_api(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        created = client.post("/jobs", files=upload_batch())
+        assert created.status_code == 202
+        job_id = created.json()["job_id"]
+
+        status = wait_for_job(client, job_id)
+        results = client.get(f"/jobs/{job_id}/results").json()
+        caught_up = client.get(f"/jobs/{job_id}", params={"since": status["next"]}).json()
+        parsed = client.post("/parse", files=upload_batch()).json()
+
+        assert client.get("/jobs/unknown").status_code == 404
+
+    assert status["done"] == status["count"] == 3
+    assert sorted(record["index"] for record in status["results"]) == [0, 1, 2]
+    assert status["next"] == 3 and caught_up["results"] == [] and caught_up["done"] == 3
+    assert [f["status"] for f in caught_up["files"]] == ["done", "done", "done"]
+    assert results["job_id"] == job_id
+    assert [r["fields"] for r in results["results"]] == [r["fields"] for r in parsed["results"]]
+    assert {k: v for k, v in results["summary"].items() if k != "processing_seconds"} == \
+        {k: v for k, v in parsed["summary"].items() if k != "processing_seconds"}
+
+
+@pytest.mark.parametrize("mode", ["inline", "process"])
+def test_parse_stream_ndjson(monkeypatch, mode):
+    monkeypatch.setattr(config, "EXECUTION_MODE", mode)
+    monkeypatch.setattr(config, "WORKER_COUNT", 2)
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        response = client.post("/parse", files=upload_batch(), headers={"Accept": "application/x-ndjson"})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["type"] for r in records] == ["file_result"] * 3 + ["summary"]
+
+    by_index = {r["index"]: r["result"] for r in records[:-1]}
+    assert by_index[0]["fields"]["designation"] == "Customer Support Executive"
+    assert by_index[1]["error_code"] == "INVALID_TYPE"
+    assert records[-1]["count"] == 3
+    assert records[-1]["summary"]["success"] == 2
+
+
+def test_parse_stream_sse(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        response = client.post("/parse/stream", files=upload_batch(), headers={"Accept": "text/event-stream"})
+
+    events = [block for block in response.text.split("\n\n") if block]
+    assert len(events) == 4
+    assert events[0].startswith("event: file_result\ndata: ")
+    assert events[-1].startswith("event: summary\ndata: ")
+
+
+def slow_process_document(content, filename, fields=None):
+    time.sleep(0.4)
+    return process_document(content, filename, fields)
+
+
+def crashing_process_document(content, filename, fields=None):
+    if filename == "crash.pdf":
+        os._exit(1)
+    return process_document(content, filename, fields)
+
+
+def test_runner_replaces_a_pool_broken_by_a_crashed_worker(monkeypatch):
+    monkeypatch.setattr(pipeline, "process_document", crashing_process_document)
+    monkeypatch.setattr(config, "EXECUTION_MODE", "process")
+    monkeypatch.setattr(config, "WORKER_COUNT", 1)
+    runner = DocumentRunner(ResultCache(max_entries=0))
+
+    try:
+        crashed = runner.submit(b"x", "crash.pdf").result(timeout=30)
+        assert crashed["error_code"] == "UNKNOWN_ERROR"
+        assert runner.submit(SUPPORT_DOCX, "after.docx").result(timeout=30)["error_code"] is None
+    finally:
+        runner.shutdown()
+
+
+def test_submit_async_waits_for_a_slot_without_blocking_the_loop(monkeypatch):
+    monkeypatch.setattr(pipeline, "process_document", slow_process_document)
+    monkeypatch.setattr(config, "EXECUTION_MODE", "process")
+    monkeypatch.setattr(config, "WORKER_COUNT", 1)
+    monkeypatch.setattr(config, "MAX_PENDING_DOCUMENTS", 1)
+    runner = DocumentRunner(ResultCache(max_entries=0))
+
+    async def scenario():
+        async def submit_all():
+            futures = [await runner.submit_async(SUPPORT_DOCX, f"{i}.docx") for i in range(3)]
+            return [await asyncio.wrap_future(f) for f in futures]
+
+        task = asyncio.create_task(submit_all())
+        # The loop keeps ticking while later submissions wait for the single slot
+        longest_tick = 0.0
+        while not task.done():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            longest_tick = max(longest_tick, time.perf_counter() - start)
+        return await task, longest_tick
+
+    try:
+        results, longest_tick = asyncio.run(scenario())
+    finally:
+        runner.shutdown()
+    assert [r["error_code"] for r in results] == [None, None, None]
+    assert longest_tick < 0.2
+
+
+def test_stream_yields_results_while_later_files_wait_for_submission(monkeypatch):
+    release = asyncio.Event()
+
+    class SlowRunner:
+        async def submit_async(self, content, filename, fields=None):
+            if filename != "first.docx":
+                await release.wait()
+            return DocumentRunner._done({"file_name": filename, "error_code": None})
+
+    monkeypatch.setattr(main, "runner", SlowRunner())
+    uploads = [(name, object(), None) for name in ("first.docx", "second.docx", "third.docx")]
+
+    async def scenario():
+        stream = main._stream_batch("job", uploads, sse=False, timings=False)
+        first = json.loads(await stream.__anext__())
+        assert not release.is_set() and uploads[1] is not None
+        release.set()
+        rest = [json.loads(record) async for record in stream]
+        return first, rest
+
+    first, rest = asyncio.run(scenario())
+    assert first["result"]["file_name"] == "first.docx"
+    assert [r["type"] for r in rest] == ["file_result", "file_result", "summary"]
+    assert rest[-1]["summary"]["success"] == 3
+
+
+def test_inline_stream_yields_the_first_result_before_later_files_are_processed(monkeypatch):
+    monkeypatch.setattr(config, "EXECUTION_MODE", "inline")
+    processed = []
+
+    def counting_process_document(content, filename, fields=None):
+        processed.append(filename)
+        return process_document(content, filename, fields)
+
+    monkeypatch.setattr(pipeline, "process_document", counting_process_document)
+    monkeypatch.setattr(main, "runner", DocumentRunner(ResultCache(max_entries=0)))
+    uploads = [(f"{i}.docx", SUPPORT_DOCX, None) for i in range(3)]
+
+    async def scenario():
+        stream = main._stream_batch("job", uploads, sse=False, timings=False)
+        first = json.loads(await stream.__anext__())
+        processed_at_first = len(processed)
+        rest = [json.loads(record) async for record in stream]
+        return first, processed_at_first, rest
+
+    first, processed_at_first, rest = asyncio.run(scenario())
+    assert first["index"] == 0 and processed_at_first < 3
+    assert rest[-1]["summary"]["success"] == 3
@@ -0,0 +1,110 @@
+import io
+import os
+import zipfile
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from extractor import config
+from extractor.cache import ResultCache
+from extractor.pipeline import DocumentRunner, expand_archives
+from extractor.uploads import SpooledUpload
+from test_api import SUPPORT_DOCX, SALES_DOCX, wait_for_job
+
+
+def make_zip(members) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in members:
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+ARCHIVE = make_zip([
+    ("q1/support.docx", SUPPORT_DOCX),
+    ("q1/notes.txt", b"not an offer letter"),
+    ("__MACOSX/q1/._support.docx", b"resource fork"),
+    ("q1/sales/sales.docx", SALES_DOCX),
+])
+
+
+def spooled(content: bytes, **kwargs) -> SpooledUpload:
+    upload = SpooledUpload(**kwargs)
+    upload.write(content)
+    return upload.finish()
+
+
+@pytest.mark.parametrize("mode", ["inline", "process"])
+def test_parse_zip_archive(monkeypatch, tmp_path, mode):
+    monkeypatch.setattr(config, "EXECUTION_MODE", mode)
+    monkeypatch.setattr(config, "WORKER_COUNT", 2)
+    monkeypatch.setattr(config, "MAX_FILES_PER_REQUEST", 2)
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_MEMORY_BYTES", 0)
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    files = [
+        ("files", ("batch.zip", ARCHIVE, "application/zip")),
+        ("files", ("single.docx", SUPPORT_DOCX, "application/octet-stream")),
+    ]
+    with TestClient(main.app) as client:
+        data = client.post("/parse", files=files).json()
+
+    assert data["count"] == 4
+    assert [r["file_name"] for r in data["results"]] == \
+        ["q1/support.docx", "q1/notes.txt", "q1/sales/sales.docx", "single.docx"]
+    assert data["results"][0]["fields"]["designation"] == "Customer Support Executive"
+    assert data["results"][1]["error_code"] == "INVALID_TYPE"
+    assert data["results"][2]["fields"]["byod_clause"] == "Yes"
+    assert data["summary"]["success"] == 3
+    assert os.listdir(tmp_path) == []
+
+
+def test_job_zip_archive(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        created = client.post("/jobs", files=[("files", ("batch.zip", ARCHIVE, "application/zip"))]).json()
+        status = wait_for_job(client, created["job_id"])
+        results = client.get(f"/jobs/{created['job_id']}/results").json()
+
+    assert created["count"] == status["count"] == 3
+    assert [r["file_name"] for r in results["results"]] == ["q1/support.docx", "q1/notes.txt", "q1/sales/sales.docx"]
+    assert status["summary"]["success"] == 2 and status["summary"]["invalid_type"] == 1
+
+
+def test_archive_member_size_limit(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "EXECUTION_MODE", "inline")
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    archive = spooled(ARCHIVE, max_memory=0)
+    items = expand_archives([("batch.zip", archive, None)])
+
+    # The limit is enforced on decompressed bytes, not only on the declared size
+    monkeypatch.setattr(config, "MAX_FILE_SIZE_BYTES", 1000)
+    runner = DocumentRunner(ResultCache(max_entries=0))
+    results = [runner.submit(content, name).result() if result is None else result for name, content, result in items]
+
+    assert [r["error_code"] for r in results] == ["FILE_TOO_LARGE", "INVALID_TYPE", "FILE_TOO_LARGE"]
+    assert os.listdir(tmp_path) == []
+
+    items = expand_archives([("batch.zip", spooled(ARCHIVE), None)])
+    assert [r["error_code"] for _, _, r in items] == ["FILE_TOO_LARGE", "INVALID_TYPE", "FILE_TOO_LARGE"]
+
+
+def test_bad_archive():
+    items = expand_archives([("broken.zip", spooled(b"not a zip"), None)])
+    assert items[0][2]["error_code"] == "PARSE_FAILED"
+
+
+def test_corrupted_archive_is_one_failed_file(tmp_path):
+    # A central directory entry claiming an unsupported ZIP version makes zipfile raise NotImplementedError
+    data = bytearray(make_zip([("letter.docx", SUPPORT_DOCX)]))
+    header = data.index(b"PK\x01\x02")
+    data[header + 6:header + 8] = (84).to_bytes(2, "little")
+    damaged = spooled(bytes(data), max_memory=0, spool_dir=str(tmp_path))
+
+    items = expand_archives([("damaged.zip", damaged, None), ("letter.docx", b"x", None)])
+    assert items[0][2]["error_code"] == "PARSE_FAILED"
+    assert "version" in items[0][2]["error_message"]
+    assert items[1] == ("letter.docx", b"x", None)
+    assert os.listdir(tmp_path) == []
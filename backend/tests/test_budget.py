@@ -0,0 +1,79 @@
+import re
+import time
+import threading
+import pytest
+
+from extractor import config, pipeline
+from extractor.budget import DocumentTimeout, can_enforce, time_budget
+from extractor.cache import ResultCache
+from extractor.pipeline import process_document
+from test_api import SUPPORT_DOCX
+
+CATASTROPHIC = re.compile(r'(a+)+b')
+
+
+def test_time_budget_interrupts_a_regex_search():
+    start = time.perf_counter()
+    with pytest.raises(DocumentTimeout):
+        with time_budget(0.1):
+            CATASTROPHIC.search("a" * 40)
+    assert time.perf_counter() - start < 2
+
+    # Finishing in time leaves no timer behind
+    with time_budget(0.1):
+        pass
+    time.sleep(0.2)
+
+
+def test_time_budget_is_not_enforced_off_the_main_thread():
+    outcome = []
+
+    def run():
+        outcome.append(can_enforce())
+        with time_budget(0.01):
+            time.sleep(0.05)
+        outcome.append("finished")
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert outcome == [False, "finished"]
+
+
+def test_process_document_reports_timeout(monkeypatch):
+    monkeypatch.setattr(config, "DOCUMENT_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(pipeline._parser, "parse", lambda sections, fields=None: CATASTROPHIC.search("a" * 40))
+
+    result = process_document(SUPPORT_DOCX, "support.docx")
+    assert result["error_code"] == "TIMEOUT"
+    assert "0.2s" in result["error_message"]
+    assert result["timings"]["pipeline"] < 2
+
+    cache = ResultCache(max_entries=4)
+    cache.put("key", result)
+    assert cache.get("key") is None
+
+    monkeypatch.undo()
+    assert process_document(SUPPORT_DOCX, "support.docx")["error_code"] is None
+
+
+def test_job_threads_send_documents_to_the_pool_to_enforce_the_budget(monkeypatch):
+    monkeypatch.setattr(config, "EXECUTION_MODE", "inline")
+    monkeypatch.setattr(config, "WORKER_COUNT", 1)
+    monkeypatch.setattr(config, "DOCUMENT_TIMEOUT_SECONDS", 0.2)
+    # Forked pool workers inherit the patched parser
+    monkeypatch.setattr(pipeline._parser, "parse", lambda sections, fields=None: CATASTROPHIC.search("a" * 40))
+    runner = pipeline.DocumentRunner(ResultCache(max_entries=0))
+    results = []
+
+    def job_thread():
+        results.append(runner.submit(SUPPORT_DOCX, "support.docx", enforce_budget=True).result(timeout=10))
+
+    try:
+        thread = threading.Thread(target=job_thread)
+        thread.start()
+        thread.join()
+        assert results[0]["error_code"] == "TIMEOUT"
+        assert runner._pool is not None
+    finally:
+        runner.shutdown()
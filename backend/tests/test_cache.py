@@ -0,0 +1,68 @@
+import pytest
+from extractor import config
+from extractor.cache import ResultCache
+
+
+def make_result(name):
+    return {
+        "file_name": name,
+        "fields": {"designation": name},
+        "confidence": {},
+        "methods": {},
+        "error_code": None,
+        "error_message": None,
+        "cache_hit": False
+    }
+
+
+def test_key_depends_on_content_and_extension():
+    key = ResultCache.key(b"abc", "a.pdf")
+    assert key == ResultCache.key(b"abc", "renamed.PDF")
+    assert key != ResultCache.key(b"abd", "a.pdf")
+    assert key != ResultCache.key(b"abc", "a.docx")
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("PDF_EARLY_STOP", True),
+    ("PDF_MAX_PAGES", 3),
+    ("PDF_TRAILING_PAGES", 0),
+    ("DOCX_ENGINE", "stream"),
+])
+def test_extraction_settings_change_the_key(tmp_path, monkeypatch, setting, value):
+    cache = ResultCache(max_entries=4, db_path=str(tmp_path / "cache.db"))
+    cache.put(ResultCache.key(b"abc", "a.pdf"), make_result("a"))
+
+    monkeypatch.setattr(config, setting, value)
+    assert cache.get(ResultCache.key(b"abc", "a.pdf")) is None
+    monkeypatch.undo()
+    assert cache.get(ResultCache.key(b"abc", "a.pdf"))["fields"]["designation"] == "a"
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.put(name, make_result(name))
+
+    assert cache.get("a") is None
+    assert cache.get("c")["fields"]["designation"] == "c"
+    assert "file_name" not in cache.get("b")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (2, 1, 1, 2)
+
+
+def test_transient_errors_are_not_cached():
+    cache = ResultCache(max_entries=2)
+    result = make_result("a")
+    result["error_code"] = "UNKNOWN_ERROR"
+    cache.put("a", result)
+    assert cache.get("a") is None
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    db_path = str(tmp_path / "results.db")
+    ResultCache(max_entries=1, db_path=db_path).put("a", make_result("a"))
+
+    cache = ResultCache(max_entries=1, db_path=db_path)
+    assert cache.get("a")["fields"]["designation"] == "a"
+    assert cache.stats()["disk_hits"] == 1
@@ -0,0 +1,66 @@
+import io
+import os
+import sys
+import json
+import subprocess
+import pyarrow.parquet as pq
+
+from benchmarks.corpus import generate_corpus
+from extractor.cli import find_files, run
+
+
+def records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_run_writes_one_record_per_file_and_resumes(tmp_path):
+    corpus = tmp_path / "letters"
+    generate_corpus(str(corpus), count=2, seed=7)
+    (corpus / "notes.txt").write_text("not a letter")
+    out = tmp_path / "results.jsonl"
+
+    summary = run([str(corpus)], str(out), workers=0, stream=io.StringIO())
+    first = records(out)
+    assert summary["success"] == 4
+    assert sorted(os.path.basename(r["file_name"]) for r in first) == [
+        "offer_00000_support.docx", "offer_00000_support.pdf",
+        "offer_00001_sales.docx", "offer_00001_sales.pdf",
+    ]
+    assert set(first[0]) == {"file_name", "fields", "confidence", "methods", "error_code", "error_message", "cache_hit"}
+
+    # Simulate a run killed while writing: one record lost, one half written
+    lines = out.read_text().splitlines(keepends=True)
+    out.write_text("".join(lines[:2]) + lines[2][:40])
+    stream = io.StringIO()
+    summary = run([str(corpus / "*.*")], str(out), workers=2, stream=stream)
+    assert summary["success"] == 2
+    assert "2 skipped" in stream.getvalue()
+    resumed = records(out)
+    assert sorted(r["file_name"] for r in resumed) == sorted(r["file_name"] for r in first)
+    assert [r["fields"] for r in resumed[:2]] == [r["fields"] for r in first[:2]]
+
+
+def test_find_files_walks_directories_and_globs(tmp_path):
+    for name in ["b.pdf", "a.docx", "sub/c.PDF", "sub/skip.txt"]:
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_bytes(b"")
+    found = list(find_files([str(tmp_path), str(tmp_path / "**" / "*.pdf")]))
+    assert [os.path.relpath(p, tmp_path) for p in found] == ["a.docx", "b.pdf", os.path.join("sub", "c.PDF")]
+
+
+def test_module_entry_point(tmp_path):
+    generate_corpus(str(tmp_path), count=1, seed=7, formats=("docx",))
+    out = tmp_path / "results.jsonl"
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    proc = subprocess.run([sys.executable, "-m", "backend.extractor", str(tmp_path), "-o", str(out), "--workers", "0",
+                           "--parquet", str(tmp_path / "tables"), "--include-confidence"],
+                          cwd=repo_root, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "done: 1/1 files" in proc.stderr
+    assert records(out)[0]["error_code"] is None
+
+    fields = pq.read_table(tmp_path / "tables" / "fields.parquet")
+    assert fields.num_rows == 1 and "confidence_designation" in fields.column_names
+    salary_rows = pq.read_table(tmp_path / "tables" / "salary_rows.parquet").to_pylist()
+    assert len(salary_rows) == len(records(out)[0]["fields"]["salary_table_rows"])
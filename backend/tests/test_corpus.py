@@ -0,0 +1,23 @@
+from benchmarks.corpus import generate_corpus
+from benchmarks.run import load_corpus, check_fields
+from extractor.pipeline import process_document
+
+
+def test_generated_letters_parse_to_manifest_values(tmp_path):
+    generate_corpus(str(tmp_path), count=2, seed=7, salary_rows=8, annex_paragraphs=3, min_pages=3)
+    docs = load_corpus(str(tmp_path))
+
+    assert sorted(d["file_name"] for d in docs) == [
+        "offer_00000_support.docx", "offer_00000_support.pdf",
+        "offer_00001_sales.docx", "offer_00001_sales.pdf",
+    ]
+    for doc in docs:
+        result = process_document(doc["content"], doc["file_name"])
+        assert result["error_code"] is None
+        assert check_fields(result["fields"], doc["expected"]) == 0, doc["file_name"]
+
+
+def test_corpus_is_reproducible(tmp_path):
+    first = generate_corpus(str(tmp_path / "a"), count=3, seed=11, formats=("pdf",))
+    second = generate_corpus(str(tmp_path / "b"), count=3, seed=11, formats=("pdf",))
+    assert first == second
@@ -0,0 +1,47 @@
+import datetime
+import dateparser
+import pytest
+
+from extractor import metrics
+from extractor.field_parser import FieldParser, dateparser_normalize_date, fast_normalize_date
+
+
+def reference(date_str: str):
+    dt = dateparser.parse(date_str, settings={'DATE_ORDER': 'DMY'})
+    return dt.strftime("%Y-%m-%d") if dt else None
+
+
+def sample_dates():
+    day = datetime.date(2024, 1, 1)
+    while day.year == 2024:
+        yield day.strftime("%d-%m-%Y")
+        yield day.strftime("%d/%m/%Y")
+        yield f"{day.day} {day.strftime('%B')} {day.year}"
+        yield f"{day.day:02d} {day.strftime('%b').upper()} {day.year}"
+        day += datetime.timedelta(days=23)
+
+
+def test_fast_path_matches_dateparser():
+    for date_str in sample_dates():
+        assert fast_normalize_date(date_str) == reference(date_str), date_str
+
+
+@pytest.mark.parametrize("date_str", ["31-02-2025", "02-13-2025", "01-02/2025", "1 Sept 2025", "5 Janvier 2025"])
+def test_unusual_dates_fall_back(date_str):
+    assert fast_normalize_date(date_str) is None
+    assert FieldParser()._normalize_date(date_str) == (reference(date_str) or date_str)
+
+
+def test_fallback_is_memoised_and_counted():
+    parser = FieldParser()
+    with metrics.collect_timings() as timings:
+        assert parser._normalize_date("15-08-2025") == "2025-08-15"
+    assert "parse.normalize_date.dateparser" not in timings
+
+    cache = dateparser_normalize_date.__wrapped__
+    before = cache.cache_info()
+    with metrics.collect_timings() as timings:
+        for _ in range(3):
+            assert parser._normalize_date("7 Juillet 2025") == "2025-07-07"
+    assert "parse.normalize_date.dateparser" in timings
+    assert cache.cache_info().hits - before.hits >= 2
@@ -0,0 +1,42 @@
+from extractor.document import Document
+from extractor.field_parser import FieldParser
+from extractor.text_extractor import TextExtractor
+from test_parser import BONUS_TEMPLATE_TEXT, NEW_LAYOUT_TEXT, SUPPORT_TEMPLATE_TEXT
+
+
+def test_split_document_offsets_and_views():
+    extractor = TextExtractor()
+    for text in (SUPPORT_TEMPLATE_TEXT, BONUS_TEMPLATE_TEXT, NEW_LAYOUT_TEXT, "no headers\n"):
+        document = extractor.split_document(text)
+        sections = extractor.split_sections(text)
+        assert list(document.spans) == list(sections)
+        for key, span in document.spans.items():
+            assert (text[span[0]:span[1]] if span else "") == sections[key]
+            assert document.has_text(key) == bool(sections[key].strip())
+
+        assert document.global_text == "\n".join(sections.values())
+        assert document.flat_text == document.global_text.replace("\n", " ")
+        # Built once, then shared
+        assert document.flat_text is document.flat_text
+        assert document.section("header") is document.section("header")
+
+
+def test_from_sections_wraps_a_sections_dict():
+    sections = {"header": "Intro", "byod": "  \n", "scheduleA": "Schedule A\nName: X"}
+    document = Document.from_sections(sections)
+    assert document.sections == sections
+    assert document.global_text is document.text == "Intro\n  \n\nSchedule A\nName: X"
+    assert not document.has_text("byod") and document.has_text("scheduleA")
+    assert document.flat_section("scheduleA") == "Schedule A Name: X"
+
+
+def test_parse_builds_only_the_views_it_needs():
+    extractor, parser = TextExtractor(), FieldParser()
+    document = extractor.split_document(BONUS_TEMPLATE_TEXT)
+    assert parser.parse(document) == parser.parse(extractor.split_sections(BONUS_TEMPLATE_TEXT))
+    # The BYOD check only needs the section's offsets, however long the section is
+    assert "byod" not in document._sections
+
+    narrow = extractor.split_document(BONUS_TEMPLATE_TEXT)
+    parser.parse(narrow, ["designation"])
+    assert narrow._global_text is None and narrow._flat_text is None
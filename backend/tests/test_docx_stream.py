@@ -0,0 +1,71 @@
+import io
+import docx
+import pytest
+from docx.enum.text import WD_BREAK
+
+from extractor import config
+from extractor.text_extractor import TextExtractor
+from benchmarks.bench_docx import merged_table_docx
+from test_api import SUPPORT_DOCX, SALES_DOCX
+
+
+def both_engines(content):
+    extractor = TextExtractor()
+    return extractor._extract_docx(content, engine="python-docx"), extractor._extract_docx(content, engine="stream")
+
+
+def save(document) -> bytes:
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("content", [SUPPORT_DOCX, SALES_DOCX], ids=["support", "sales"])
+def test_stream_matches_python_docx_on_letters(content):
+    reference, streamed = both_engines(content)
+    assert streamed == reference
+
+
+def test_stream_matches_python_docx_on_merged_cells():
+    reference, streamed = both_engines(merged_table_docx(35))
+    assert streamed == reference
+    # Merged cells repeat per grid column and row, as python-docx reports them
+    assert "Group 0 Component 1 (taxable)" in streamed
+    assert "Group 0 Component 2 (taxable)" in streamed
+    assert "Sub Total Sub Total" in streamed
+
+
+def test_stream_matches_python_docx_on_runs_and_ragged_rows():
+    document = docx.Document()
+    paragraph = document.add_paragraph("Tab")
+    paragraph.add_run().add_tab()
+    run = paragraph.add_run("line")
+    run.add_break()
+    run.add_text("next")
+    run.add_break(WD_BREAK.PAGE)
+    document.add_paragraph("")
+    table = document.add_table(rows=3, cols=3)
+    table.cell(0, 0).text = "  spaced \n cell  "
+    table.cell(0, 1).add_paragraph("second paragraph")
+    nested = table.cell(1, 1).add_table(rows=1, cols=1)
+    nested.cell(0, 0).text = "nested text is not part of the cell"
+    table.cell(1, 0).merge(table.cell(2, 1)).text = "block"
+    document.add_paragraph("After table")
+
+    reference, streamed = both_engines(save(document))
+    assert streamed == reference
+    assert "Tab\tline\nnext" in streamed
+
+
+def test_stream_reads_from_path(tmp_path):
+    path = tmp_path / "letter.docx"
+    path.write_bytes(SUPPORT_DOCX)
+    reference, streamed = both_engines(str(path))
+    assert streamed == reference
+
+
+def test_engine_selected_by_config(monkeypatch):
+    monkeypatch.setattr(config, "DOCX_ENGINE", "stream")
+    with pytest.raises(ValueError, match="^PARSE_FAILED: Failed to parse DOCX"):
+        TextExtractor().extract_text(b"not a zip", "broken.docx")
+    assert TextExtractor().extract_text(SALES_DOCX, "sales.docx") == both_engines(SALES_DOCX)[0]
@@ -0,0 +1,154 @@
+import io
+import csv
+import openpyxl
+import pandas as pd
+import pyarrow.parquet as pq
+
+from extractor.exports import XLSX_COLUMNS, XLSX_LONG_SHEET, XLSX_SHEET, csv_columns, iter_csv, iter_parquet, iter_xlsx, write_parquet
+
+RESULTS = [
+    {"file_name": "a.docx", "fields": {"designation": "Sales, North", "byod_clause": "Yes",
+                                       "salary_table_rows": [{"component": "Basic", "per_annum": 1, "per_month": 2}]},
+     "error_code": None},
+    {"file_name": "b.pdf", "fields": {}, "error_code": "SCANNED_PDF", "error_message": 'Says "scanned"'},
+    {"file_name": "c.docx", "fields": {"designation": "Analyst", "scheduleA_grade": "2.1"}, "error_code": None},
+]
+
+
+def pandas_csv(results) -> str:
+    # The export as the previous pandas implementation produced it
+    flat_data = []
+    for item in results:
+        row = {"File Name": item.get("file_name")}
+        row.update(item.get("fields", {}))
+        if item.get("error_code"):
+            row["Error Code"] = item.get("error_code")
+            row["Error Message"] = item.get("error_message")
+        flat_data.append(row)
+    stream = io.StringIO()
+    pd.DataFrame(flat_data).to_csv(stream, index=False)
+    return stream.getvalue()
+
+
+def test_csv_columns():
+    assert csv_columns(RESULTS) == ["File Name", "designation", "byod_clause", "salary_table_rows",
+                                    "Error Code", "Error Message", "scheduleA_grade"]
+
+
+def test_iter_csv_matches_pandas_export_without_integer_gaps():
+    assert b"".join(iter_csv(RESULTS)).decode() == pandas_csv(RESULTS)
+
+
+def test_iter_csv_keeps_integers_in_columns_with_gaps():
+    # A failed file leaves comp_total_annual_inr empty; pandas wrote the column as floats
+    results = [
+        {"file_name": "a.docx", "fields": {"comp_total_annual_inr": 450000}, "error_code": None},
+        {"file_name": "b.pdf", "fields": {"comp_total_annual_inr": None}, "error_code": "SCANNED_PDF",
+         "error_message": "Scanned"},
+    ]
+    exported = b"".join(iter_csv(results)).decode()
+    assert exported.splitlines()[1:] == ["a.docx,450000,,", "b.pdf,,SCANNED_PDF,Scanned"]
+    assert pandas_csv(results).splitlines()[1] == "a.docx,450000.0,,"
+    assert exported.replace("450000,", "450000.0,") == pandas_csv(results)
+
+
+def test_iter_csv_chunks():
+    results = [{"file_name": f"{i}.pdf", "fields": {"comp_total_annual_inr": i}} for i in range(10)]
+    chunks = list(iter_csv(results, chunk_rows=4))
+    assert len(chunks) == 4  # header, 4 + 4 + 2 rows
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == ["File Name", "comp_total_annual_inr"]
+    assert rows[10] == ["9.pdf", "9"]
+
+
+def pandas_xlsx(results) -> bytes:
+    # The wide sheet as the previous pandas implementation built it
+    components = sorted({r["component"] for item in results for r in item.get("fields", {}).get("salary_table_rows", [])})
+    flat_data = []
+    for item in results:
+        fields = item.get("fields", {})
+        row = {header: (fields.get(key[0], {}).get(key[1]) if isinstance(key, tuple) else fields.get(key))
+               for header, key in XLSX_COLUMNS[1:]}
+        row = {"File Name": item.get("file_name"), **row}
+        for comp in components:
+            match = next((r for r in fields.get("salary_table_rows", []) if r.get("component") == comp), None)
+            row[f"{comp} (Per Annum)"] = match.get("per_annum") if match else None
+            row[f"{comp} (Per Month)"] = match.get("per_month") if match else None
+        if item.get("error_code"):
+            row["Error Code"] = item.get("error_code")
+            row["Error Message"] = item.get("error_message")
+        flat_data.append(row)
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        pd.DataFrame(flat_data).to_excel(writer, index=False, sheet_name="Extracted Data")
+    return output.getvalue()
+
+
+def sheet_values(content: bytes, sheet: str):
+    workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
+    rows = [list(row) for row in workbook[sheet].iter_rows(values_only=True)]
+    # Trailing empty cells are not written in write-only mode
+    width = max(len(row) for row in rows)
+    return [row + [None] * (width - len(row)) for row in rows]
+
+
+SALARY_RESULTS = [
+    {"file_name": "a.docx", "error_code": None, "fields": {
+        "designation": "Sales", "comp_total_annual_inr": 900000,
+        "salary_table_totals": {"gross_salary": 800000, "total_ctc": 900000},
+        "salary_table_rows": [{"component": "Basic", "per_annum": 400000, "per_month": 33333},
+                              {"component": "HRA", "per_annum": 200000, "per_month": 16667},
+                              {"component": "Basic", "per_annum": 1, "per_month": 1}]}},
+    {"file_name": "b.pdf", "fields": {}, "error_code": "SCANNED_PDF", "error_message": "scanned"},
+    {"file_name": "c.docx", "error_code": None, "fields": {
+        "designation": "Analyst",
+        "salary_table_rows": [{"component": "Special Allowance", "per_annum": 60000, "per_month": 5000}]}},
+]
+
+
+def test_xlsx_matches_pandas_export():
+    streamed = b"".join(iter_xlsx(SALARY_RESULTS))
+    assert sheet_values(streamed, XLSX_SHEET) == sheet_values(pandas_xlsx(SALARY_RESULTS), XLSX_SHEET)
+
+
+def test_xlsx_long_format_sheet():
+    streamed = b"".join(iter_xlsx(SALARY_RESULTS, long_format=True))
+    assert sheet_values(streamed, XLSX_LONG_SHEET) == [
+        ["File Name", "Component", "Per Annum", "Per Month"],
+        ["a.docx", "Basic", 400000, 33333],
+        ["a.docx", "HRA", 200000, 16667],
+        ["a.docx", "Basic", 1, 1],
+        ["c.docx", "Special Allowance", 60000, 5000],
+    ]
+
+
+def test_parquet_fields_table():
+    results = SALARY_RESULTS + [{"file_name": "d.pdf", "error_code": None, "fields": {"esop_amount_inr": 1.5, "byod_clause": "Yes"},
+                                 "confidence": {"esop_amount_inr": 0.5}, "methods": {"esop_amount_inr": "esop_section"}}]
+    table = pq.read_table(io.BytesIO(b"".join(iter_parquet(results, "fields", include_confidence=True))))
+    assert table.column_names == [
+        "file_name", "error_code", "error_message", "designation", "comp_total_annual_inr",
+        "salary_table_totals_gross_salary", "salary_table_totals_total_ctc", "esop_amount_inr", "byod_clause",
+        "confidence_esop_amount_inr", "method_esop_amount_inr",
+    ]
+    types = {field.name: str(field.type) for field in table.schema}
+    assert types["comp_total_annual_inr"] == types["confidence_esop_amount_inr"] == "double"
+    assert types["designation"] == types["error_code"] == "string"
+    rows = table.to_pylist()
+    assert rows[0]["comp_total_annual_inr"] == 900000.0 and rows[0]["salary_table_totals_total_ctc"] == 900000.0
+    assert rows[1]["error_code"] == "SCANNED_PDF" and rows[1]["designation"] is None
+    assert rows[3]["method_esop_amount_inr"] == "esop_section"
+    assert "confidence_esop_amount_inr" not in pq.read_table(io.BytesIO(b"".join(iter_parquet(results)))).column_names
+
+
+def test_parquet_salary_rows_table_in_row_groups():
+    out = io.BytesIO()
+    write_parquet(SALARY_RESULTS * 3, out, table="salary_rows", row_group_rows=5)
+    parquet = pq.ParquetFile(io.BytesIO(out.getvalue()))
+    assert parquet.metadata.num_rows == 12 and parquet.metadata.num_row_groups == 3
+    assert parquet.read().to_pylist()[:4] == [
+        {"file_name": "a.docx", "row_index": 0, "component": "Basic", "per_annum": 400000.0, "per_month": 33333.0},
+        {"file_name": "a.docx", "row_index": 1, "component": "HRA", "per_annum": 200000.0, "per_month": 16667.0},
+        {"file_name": "a.docx", "row_index": 2, "component": "Basic", "per_annum": 1.0, "per_month": 1.0},
+        {"file_name": "c.docx", "row_index": 0, "component": "Special Allowance", "per_annum": 60000.0, "per_month": 5000.0},
+    ]
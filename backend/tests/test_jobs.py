@@ -0,0 +1,140 @@
+import os
+import threading
+import pytest
+from concurrent.futures import Future
+
+from extractor.jobs import JobManager, JobQueueFull
+from extractor.pipeline import new_file_result
+from extractor.uploads import SpooledUpload
+
+
+class BlockingRunner:
+    """Runner stub whose futures only resolve once the test releases them."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def submit(self, content, filename, enforce_budget=False):
+        future = Future()
+
+        def finish():
+            self.release.wait()
+            future.set_result(new_file_result(filename))
+
+        threading.Thread(target=finish, daemon=True).start()
+        return future
+
+
+def test_queue_is_bounded():
+    manager = JobManager(BlockingRunner(), workers=1, max_queued=1)
+    manager.submit("a", [("a.pdf", b"x", None)])
+    with pytest.raises(JobQueueFull):
+        manager.submit("b", [("b.pdf", b"x", None)])
+    assert manager.get("b") is None
+
+
+def test_partial_progress_is_visible():
+    runner = BlockingRunner()
+    manager = JobManager(runner, workers=1, max_queued=2)
+    manager.start()
+    try:
+        rejected = new_file_result("big.pdf")
+        rejected["error_code"] = "FILE_TOO_LARGE"
+        manager.submit("job", [("big.pdf", None, rejected), ("a.pdf", b"x", None)])
+
+        for _ in range(200):
+            status = manager.status("job")
+            if status["done"] == 1:
+                break
+            threading.Event().wait(0.01)
+        assert status["status"] == "running"
+        assert [f["status"] for f in status["files"]] == ["done", "processing"]
+        assert status["results"] == [{"index": 0, "result": rejected}] and status["next"] == 1
+        assert manager.status("job", since=1)["results"] == []
+        assert manager.results("job") is None
+
+        runner.release.set()
+        for _ in range(200):
+            if manager.status("job")["status"] == "done":
+                break
+            threading.Event().wait(0.01)
+        final = manager.results("job")
+        assert final["summary"]["failed"] == 1 and final["summary"]["success"] == 1
+    finally:
+        runner.release.set()
+        manager.stop()
+
+
+def wait_until_done(manager, job_id):
+    for _ in range(200):
+        if manager.status(job_id)["status"] == "done":
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_finished_jobs_expire():
+    runner = BlockingRunner()
+    runner.release.set()
+    manager = JobManager(runner, workers=1, max_queued=2, ttl_seconds=0.05)
+    manager.start()
+    try:
+        manager.submit("job", [("a.pdf", b"x", None)])
+        wait_until_done(manager, "job")
+        threading.Event().wait(0.1)
+        assert manager.get("job") is None
+        assert manager.status("job") is None and manager.results("job") is None
+    finally:
+        manager.stop()
+
+
+def test_oldest_finished_jobs_are_dropped_past_max_files():
+    runner = BlockingRunner()
+    runner.release.set()
+    manager = JobManager(runner, workers=1, max_queued=4, max_files=3)
+    manager.start()
+    try:
+        for job_id in ("a", "b"):
+            manager.submit(job_id, [("a.pdf", b"x", None), ("b.pdf", b"x", None)])
+            wait_until_done(manager, job_id)
+        assert manager.get("a") is None
+        assert manager.results("b")["count"] == 2
+    finally:
+        manager.stop()
+
+
+def spooled(tmp_path) -> SpooledUpload:
+    upload = SpooledUpload(max_memory=0, spool_dir=str(tmp_path))
+    upload.write(b"x")
+    return upload.finish()
+
+
+def test_queued_jobs_release_their_uploads_on_stop(tmp_path):
+    manager = JobManager(BlockingRunner(), workers=1, max_queued=2)
+    manager.submit("job", [("a.pdf", spooled(tmp_path), None)])
+    assert manager.status("job")["files"] == [{"file_name": "a.pdf", "status": "queued"}]
+
+    manager.stop()
+    assert os.listdir(tmp_path) == []
+    assert manager.status("job")["status"] == "failed"
+
+
+def test_failed_submission_releases_the_remaining_uploads(tmp_path):
+    class FailingRunner:
+        def submit(self, content, filename, enforce_budget=False):
+            raise RuntimeError("pool unavailable")
+
+    manager = JobManager(FailingRunner(), workers=1, max_queued=2)
+    manager.start()
+    try:
+        manager.submit("job", [("a.pdf", b"x", None), ("b.pdf", spooled(tmp_path), None)])
+        for _ in range(200):
+            if manager.status("job")["status"] == "failed":
+                break
+            threading.Event().wait(0.01)
+        status = manager.status("job")
+        assert status["error_message"] == "pool unavailable"
+        assert [f["status"] for f in status["files"]] == ["failed", "failed"]
+        assert os.listdir(tmp_path) == []
+    finally:
+        manager.stop()
@@ -0,0 +1,24 @@
+import random
+from extractor.layout import words_to_text, words_to_text_reference
+
+
+def make_words(count, seed):
+    rng = random.Random(seed)
+    words = []
+    for i in range(count):
+        # Half-way y values exercise round-half-to-even, repeated x values the stable ordering
+        y0 = rng.choice([2.5, 7.5, 12.5, -2.5, 0.0, 99.99]) + rng.choice([0, 0, 10, 25.3])
+        x0 = rng.choice([10.0, 10.0, 55.5, 120.25, rng.uniform(0, 500)])
+        words.append((x0, y0, x0 + 20, y0 + 8, f"w{i}", 0, 0, i))
+    return words
+
+
+def test_matches_reference_layout():
+    for seed in range(20):
+        words = make_words(200, seed)
+        assert words_to_text(words) == words_to_text_reference(words)
+
+
+def test_single_word_and_empty_page():
+    assert words_to_text([(1.0, 2.0, 3.0, 4.0, "only", 0, 0, 0)]) == "only"
+    assert words_to_text([]) == words_to_text_reference([]) == ""
@@ -0,0 +1,71 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from extractor import metrics
+from extractor.cache import ResultCache
+from extractor.pipeline import process_document
+from test_api import SUPPORT_DOCX, upload_batch
+
+
+def sample_value(text: str, line_prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_histogram_render():
+    hist = metrics.Histogram("test_latency_seconds", "Test histogram.", buckets=(0.1, 1.0))
+    metrics.REGISTRY.remove(hist)
+    hist.observe(0.05, stage="a")
+    hist.observe(0.5, stage="a")
+    text = hist.render()
+    assert "# TYPE test_latency_seconds histogram" in text
+    assert 'test_latency_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{stage="a",le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{stage="a",le="+Inf"} 2' in text
+    assert 'test_latency_seconds_count{stage="a"} 2' in text
+
+
+def test_process_document_stage_timings():
+    file_result = process_document(SUPPORT_DOCX, "support.docx")
+    timings = file_result["timings"]
+    for stage in ("pipeline", "extract_text.docx", "split_sections", "parse",
+                  "parse.designation", "parse.normalize_date", "parse.salary_table", "parse.bonus"):
+        assert timings[stage] >= 0
+    assert timings["pipeline"] >= timings["parse"] >= timings["parse.salary_table"]
+
+
+@pytest.mark.parametrize("include", [False, True])
+def test_parse_timings_and_metrics(monkeypatch, include):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+    with TestClient(main.app) as client:
+        before = client.get("/metrics").text
+        response = client.post("/parse", params={"timings": include}, files=upload_batch())
+        after = client.get("/metrics")
+
+    results = response.json()["results"]
+    assert ("timings" in results[0]) is include
+    assert after.headers["content-type"].startswith("text/plain")
+
+    text = after.text
+    success = 'offer_extractor_files_total{error_code="none"}'
+    invalid = 'offer_extractor_files_total{error_code="INVALID_TYPE"}'
+    assert sample_value(text, success) - sample_value(before, success) == 2
+    assert sample_value(text, invalid) - sample_value(before, invalid) == 1
+    parsed = 'offer_extractor_stage_seconds_count{stage="extract_text.docx"}'
+    assert sample_value(text, parsed) - sample_value(before, parsed) == 2
+    uploaded = sum(len(content) for _, (_, content, _) in upload_batch())
+    read = "offer_extractor_bytes_processed_total"
+    assert sample_value(text, read) - sample_value(before, read) == uploaded
+    assert sample_value(text, 'offer_extractor_batches_in_flight{endpoint="parse"}') == 0
+
+
+def test_export_observed():
+    with TestClient(main.app) as client:
+        before = client.get("/metrics").text
+        client.post("/export/csv", json={"results": [{"file_name": "a.docx", "fields": {"designation": "X"}}]})
+        text = client.get("/metrics").text
+    key = 'offer_extractor_stage_seconds_count{stage="export.csv"}'
+    assert sample_value(text, key) - sample_value(before, key) == 1
@@ -1,6 +1,6 @@
 import pytest
 from extractor.text_extractor import TextExtractor
-from extractor.field_parser import FieldParser
+from extractor.field_parser import EXTRACTOR_FIELDS, FieldParser, required_sections, select_fields
 
 # Fixtures
 SUPPORT_TEMPLATE_TEXT = """
@@ -169,3 +169,31 @@ def test_new_layout_extraction():
     assert fields["scheduleA_band"] == "2"
     assert fields["scheduleA_grade"] == "2.2"
 
+
+
+@pytest.mark.parametrize("text", [SUPPORT_TEMPLATE_TEXT, SALES_FIELD_TEMPLATE_TEXT, BONUS_TEMPLATE_TEXT, NEW_LAYOUT_TEXT])
+def test_field_selection_matches_full_parse(text):
+    extractor = TextExtractor()
+    parser = FieldParser()
+    full = parser.parse(extractor.split_sections(text))
+
+    for extractor_name, fields in EXTRACTOR_FIELDS.items():
+        selected = [fields[-1], "designation"]
+        parsed = parser.parse(extractor.split_sections(text, required_sections(selected)), selected)
+        assert list(parsed["fields"]) == [f for f in full["fields"] if f in selected]
+        for key in ("fields", "confidence", "methods"):
+            assert parsed[key] == {f: full[key][f] for f in parsed[key]}, extractor_name
+
+
+def test_field_selection_limits_sections():
+    assert required_sections(None) is None
+    assert required_sections(["designation", "date_of_joining_norm"]) == {"scheduleA", "header", "acceptance"}
+    assert required_sections(["designation", "bonus_joining_inr"]) is None
+
+    sections = TextExtractor().split_sections(SUPPORT_TEMPLATE_TEXT, {"header"})
+    assert sections["header"] and not any(v for k, v in sections.items() if k != "header")
+
+    with pytest.raises(ValueError, match="salary"):
+        select_fields(["designation", "salary"])
+    assert select_fields([" designation", "designation", ""]) == ["designation"]
+    assert select_fields([]) is None
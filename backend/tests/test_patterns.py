@@ -0,0 +1,31 @@
+import re
+import pytest
+from extractor.budget import time_budget
+from extractor.patterns import PATTERNS, BONUS_PATTERNS, ESOP_PATTERNS, list_patterns, register
+
+
+def test_registry_is_compiled_and_listable():
+    names = list_patterns()
+    assert names == sorted(PATTERNS)
+    assert all(isinstance(PATTERNS[name], re.Pattern) for name in names)
+    assert {"bonus.joining.after", "bonus.retention.bare", "esop.esop", "esop.esar"} <= set(names)
+
+
+def test_bonus_and_esop_patterns_are_per_type():
+    assert set(BONUS_PATTERNS) == {"Joining", "Retention"}
+    assert BONUS_PATTERNS["Joining"][0].search("Joining Bonus of INR 50,000").group(1) == "50,000"
+    assert BONUS_PATTERNS["Joining"][0].search("Retention Bonus of INR 50,000") is None
+    assert ESOP_PATTERNS[1].search("ESARs worth INR 500000").group(1) == "500000"
+
+
+def test_duplicate_registration_is_rejected():
+    with pytest.raises(ValueError):
+        register("salary_table.row", r".*")
+
+
+def test_proximity_patterns_stay_linear_on_long_digit_runs():
+    digits = "1,0" * 20000
+    with time_budget(2.0):
+        for name in ("bonus.joining.bare", "bonus.retention.bare", "anchors.currency", "location.intro_sentence"):
+            assert PATTERNS[name].search(digits) is None
+    assert PATTERNS["bonus.joining.bare"].search("x 1,00,000 as a Joining Bonus").group(1) == "1,00,000"
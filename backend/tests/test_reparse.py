@@ -0,0 +1,64 @@
+import io
+import json
+
+from benchmarks.corpus import generate_corpus
+from extractor import config, pipeline
+from extractor.cli import run
+from extractor.pipeline import process_document
+from extractor.reparse import diff_fields, reparse
+from extractor.text_store import TextStore
+
+
+def test_process_document_keeps_text_when_configured(tmp_path, monkeypatch):
+    generate_corpus(str(tmp_path / "letters"), count=1, seed=7, formats=("docx",))
+    path = str(tmp_path / "letters" / "offer_00000_support.docx")
+    monkeypatch.setattr(config, "TEXT_STORE_DIR", str(tmp_path / "store"))
+
+    result = process_document(path, "renamed.docx")
+    with open(path, "rb") as f:
+        process_document(f.read(), "offer_00000_support.docx")
+
+    store = TextStore(str(tmp_path / "store"))
+    documents = list(store.documents())
+    assert [name for name, _ in documents] == ["renamed.docx", "offer_00000_support.docx"]
+    key = documents[0][1]
+    assert documents[1][1] == key and key.endswith(".docx")
+    assert "Schedule A" in store.load_text(key)
+    assert store.load_result(key)["fields"] == result["fields"]
+    assert "file_name" not in store.load_result(key)
+
+
+def test_reparse_diffs_changed_rules(tmp_path, monkeypatch):
+    generate_corpus(str(tmp_path / "letters"), count=2, seed=7)
+    store_dir = str(tmp_path / "store")
+    run([str(tmp_path / "letters")], str(tmp_path / "results.jsonl"), workers=0, stream=io.StringIO(), text_store=store_dir)
+    assert config.TEXT_STORE_DIR is None
+
+    unchanged = reparse(store_dir, str(tmp_path / "diff.jsonl"), workers=2, stream=io.StringIO())
+    assert not unchanged and (tmp_path / "diff.jsonl").read_text() == ""
+
+    # A rule change: designations now come out upper-cased
+    extract = pipeline._parser._extract_designation
+    monkeypatch.setattr(pipeline._parser, "_extract_designation",
+                        lambda *args: (lambda value, conf, method: (value and value.upper(), conf, method))(*extract(*args)))
+    changed = reparse(store_dir, str(tmp_path / "diff.jsonl"), workers=0, output=str(tmp_path / "new.jsonl"),
+                      stream=io.StringIO())
+    assert changed == {"designation": 4}
+    diff = [json.loads(line) for line in (tmp_path / "diff.jsonl").read_text().splitlines()]
+    assert len(diff) == 4
+    assert diff[0]["changes"]["designation"]["new"] == diff[0]["changes"]["designation"]["old"].upper()
+    assert len((tmp_path / "new.jsonl").read_text().splitlines()) == 4
+
+    # Stored results were replaced, so the same rules report nothing new
+    assert not reparse(store_dir, str(tmp_path / "diff.jsonl"), workers=0, stream=io.StringIO())
+
+
+def test_diff_fields():
+    old = {"error_code": None, "fields": {"a": 1, "b": [1], "gone": "x"}}
+    new = {"error_code": "SCANNED_OR_EMPTY", "fields": {"a": 1, "b": [2], "added": 3}}
+    assert diff_fields(old, new) == {
+        "error_code": {"old": None, "new": "SCANNED_OR_EMPTY"},
+        "b": {"old": [1], "new": [2]},
+        "added": {"old": None, "new": 3},
+        "gone": {"old": "x", "new": None},
+    }
@@ -0,0 +1,23 @@
+import os
+import sys
+import subprocess
+
+HEAVY = ("fitz", "docx", "dateparser", "numpy", "pandas", "openpyxl")
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(code: str) -> set:
+    script = f"import sys\n{code}\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", script], cwd=BACKEND_DIR,
+                         capture_output=True, text=True, check=True)
+    # PyMuPDF may print a deprecation notice for the fitz name; the module list is the last line
+    return set(out.stdout.splitlines()[-1].split()) if out.stdout.strip() else set()
+
+
+def test_api_import_defers_heavy_dependencies():
+    assert loaded_after("import main") == set()
+
+
+def test_warm_up_loads_dependencies():
+    code = "import main\nmain.runner.warm_up()\nmain.exports.warm_up()"
+    assert loaded_after(code) == {"fitz", "docx", "dateparser", "numpy", "openpyxl"}
@@ -0,0 +1,56 @@
+import time
+from fastapi.testclient import TestClient
+
+import main
+from extractor.cache import ResultCache
+from extractor.store import ResultStore
+from test_api import upload_batch, wait_for_job
+
+
+def payload(job_id: str, files: int):
+    return {"job_id": job_id, "results": [{"file_name": f"{i}.pdf"} for i in range(files)]}
+
+
+def test_store_bounded_by_file_count():
+    store = ResultStore(max_files=5, ttl_seconds=60)
+    store.put("a", payload("a", 2))
+    store.put("b", payload("b", 2))
+    store.put("c", payload("c", 2))
+    assert store.get("a") is None
+    assert store.get("b") and store.get("c")
+    store.put("huge", payload("huge", 6))
+    assert store.get("huge") is None and len(store) == 2
+
+
+def test_store_ttl():
+    store = ResultStore(max_files=10, ttl_seconds=0.05)
+    store.put("a", payload("a", 1))
+    assert store.get("a") is not None
+    time.sleep(0.06)
+    assert store.get("a") is None and len(store) == 0
+
+
+def test_export_by_job_id(monkeypatch):
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=0))
+
+    with TestClient(main.app) as client:
+        parsed = client.post("/parse", files=upload_batch()).json()
+        posted_csv = client.post("/export/csv", json={"results": parsed["results"]})
+        stored_csv = client.get("/export/csv", params={"job_id": parsed["job_id"]})
+        stored_xlsx = client.get("/export/xlsx", params={"job_id": parsed["job_id"]})
+        stored_parquet = client.get("/export/parquet", params={"job_id": parsed["job_id"], "table": "salary_rows"})
+        bad_table = client.get("/export/parquet", params={"job_id": parsed["job_id"], "table": "sheets"})
+
+        job_id = client.post("/jobs", files=upload_batch()).json()["job_id"]
+        wait_for_job(client, job_id)
+        job_csv = client.get("/export/csv", params={"job_id": job_id})
+
+        missing = client.get("/export/csv", params={"job_id": "unknown"})
+
+    assert stored_csv.status_code == 200
+    assert stored_csv.text == posted_csv.text
+    assert stored_xlsx.status_code == 200 and stored_xlsx.content[:2] == b"PK"
+    assert stored_parquet.status_code == 200 and stored_parquet.content[:4] == b"PAR1"
+    assert bad_table.status_code == 400
+    assert job_csv.text == posted_csv.text
+    assert missing.status_code == 404
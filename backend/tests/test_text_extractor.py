@@ -0,0 +1,89 @@
+import re
+from extractor.config import SECTION_HEADERS
+from extractor.text_extractor import TextExtractor
+from test_parser import SUPPORT_TEMPLATE_TEXT, SALES_FIELD_TEMPLATE_TEXT, BONUS_TEMPLATE_TEXT, NEW_LAYOUT_TEXT
+
+
+def split_sections_per_header(full_text):
+    """The original splitter: one finditer scan per header."""
+    sections = {"header": ""}
+    sections.update({key: "" for key in SECTION_HEADERS.values()})
+    found = []
+    for header, key in SECTION_HEADERS.items():
+        pattern = re.escape(header).replace(r'\ ', r'\s+')
+        for match in re.finditer(pattern, full_text, re.IGNORECASE):
+            found.append((match.start(), key))
+            break
+    found.sort(key=lambda x: x[0])
+    if not found:
+        sections["header"] = full_text
+        return sections
+    if found[0][0] > 0:
+        sections["header"] = full_text[:found[0][0]].strip()
+    for i, (start, key) in enumerate(found):
+        end = found[i + 1][0] if i + 1 < len(found) else len(full_text)
+        sections[key] = full_text[start:end].strip()
+    return sections
+
+
+def test_single_pass_matches_per_header_scan():
+    shuffled = "Intro\nschedule\n  a\nName X\nSALARY COMPUTATION\nBasic 1 2\nbyod\nOffer Letter\nSchedule A again"
+    # 'İ' grows when lowercased, which exercises the IGNORECASE fallback
+    dotted = "İstanbul office\n" + SALES_FIELD_TEMPLATE_TEXT
+    extractor = TextExtractor()
+    for text in (SUPPORT_TEMPLATE_TEXT, SALES_FIELD_TEMPLATE_TEXT, BONUS_TEMPLATE_TEXT, NEW_LAYOUT_TEXT, shuffled, dotted, "no headers"):
+        assert extractor.split_sections(text) == split_sections_per_header(text)
+
+
+def test_custom_section_headers():
+    extractor = TextExtractor({"Schedule A": "scheduleA", "Annexure A": "scheduleA", "Notice Period": "notice"})
+    sections = extractor.split_sections("Intro\nAnnexure A\nBand 2\nNotice Period\n30 days\nSchedule A\nlater")
+
+    assert list(sections) == ["header", "scheduleA", "notice"]
+    assert sections["header"] == "Intro"
+    assert sections["scheduleA"] == "Annexure A\nBand 2"
+    assert sections["notice"] == "Notice Period\n30 days\nSchedule A\nlater"
+
+
+def make_pdf(pages):
+    import fitz
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+PAGED_LETTER = [
+    "OFFER LETTER\nWe are pleased to offer you the position of Analyst at Gurugram, Haryana, India.\n"
+    "Compensation & Benefits\nYour total annual compensation of INR 4,50,000 per annum.",
+    "Schedule A\nDesignation: Analyst\nBand: 2\nGrade: 2.1",
+    "SALARY COMPUTATION\nBasic 150000 12500\nTotal CTC 450000 37500\nACCEPTANCE OF OFFER TERMS AND CONDITIONS",
+    "Date of Joining: 15/05/2025",
+    "Annexure\nBYOD policy applies to all employees.",
+    "Annexure\nLeave policy.",
+]
+
+
+def test_pdf_pages_are_streamed_lazily():
+    extractor = TextExtractor()
+    pages = extractor.iter_pdf_pages(make_pdf(PAGED_LETTER))
+    assert next(pages).startswith("OFFER LETTER")
+    pages.close()
+
+    full = extractor._extract_pdf(make_pdf(PAGED_LETTER), early_stop=False)
+    assert full == "\n".join(extractor.iter_pdf_pages(make_pdf(PAGED_LETTER)))
+    assert "Leave policy." in full
+
+
+def test_pdf_early_stop_and_page_cap():
+    extractor = TextExtractor()
+    content = make_pdf(PAGED_LETTER)
+
+    # All required sections are seen on page 3; one trailing page keeps the joining date
+    early = extractor._extract_pdf(content, early_stop=True)
+    assert early.endswith("Date of Joining: 15/05/2025")
+    assert "BYOD" not in early
+
+    capped = extractor._extract_pdf(content, early_stop=False, max_pages=2)
+    assert capped.endswith("Grade: 2.1")
@@ -0,0 +1,100 @@
+import os
+import hashlib
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from extractor import config
+from extractor.cache import ResultCache
+from extractor.text_extractor import TextExtractor
+from extractor.uploads import MultipartUploads, SpooledUpload
+from test_api import SUPPORT_DOCX, upload_batch
+from test_text_extractor import make_pdf, PAGED_LETTER
+
+
+def test_spooled_upload_memory_and_disk(tmp_path):
+    small = SpooledUpload(max_memory=1024, spool_dir=str(tmp_path))
+    small.write(b"abc")
+    assert small.finish().source == b"abc"
+    assert small.path is None
+
+    large = SpooledUpload(max_memory=4, spool_dir=str(tmp_path))
+    for chunk in (b"abc", b"def", b"ghi"):
+        large.write(chunk)
+    large.finish()
+    assert large.size == 9
+    with open(large.source, "rb") as f:
+        assert f.read() == b"abcdefghi"
+    assert large.sha256 == hashlib.sha256(b"abcdefghi").hexdigest()
+    large.discard()
+    assert os.listdir(tmp_path) == []
+
+
+def test_extract_text_from_path(tmp_path):
+    extractor = TextExtractor()
+    pdf = make_pdf(PAGED_LETTER)
+    for name, content in (("letter.docx", SUPPORT_DOCX), ("letter.pdf", pdf)):
+        path = tmp_path / name
+        path.write_bytes(content)
+        assert extractor.extract_text(str(path), name) == extractor.extract_text(content, name)
+
+
+def multipart_body(files, boundary="b0undary"):
+    body = b""
+    for name, content in files:
+        body += (f"--{boundary}\r\nContent-Disposition: form-data; name=\"files\"; filename=\"{name}\"\r\n"
+                 f"Content-Type: application/octet-stream\r\n\r\n").encode() + content + b"\r\n"
+    return f"multipart/form-data; boundary={boundary}", body + f"--{boundary}--\r\n".encode()
+
+
+def test_oversized_upload_stops_being_stored_at_the_limit(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_MEMORY_BYTES", 0)
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    content_type, body = multipart_body([("big.pdf", b"x" * 1_000_000), ("letter.docx", SUPPORT_DOCX)])
+    form = MultipartUploads(content_type, lambda filename: 10_000 if filename == "big.pdf" else 1_000_000)
+
+    for start in range(0, len(body), 1_000):
+        form.write(body[start:start + 1_000])
+        # Uploads are spooled once, straight from the body, and never past their limit
+        assert len(os.listdir(tmp_path)) <= 1
+        spooled_big = form.files[0][1] if form.files and form.files[0][0] == "big.pdf" else None
+        if spooled_big is not None and spooled_big.path is not None:
+            assert os.path.getsize(spooled_big.path) <= 10_000
+    (big, rejected), (name, upload) = form.finish()
+
+    assert big == "big.pdf" and rejected is None
+    assert name == "letter.docx" and upload.sha256 == hashlib.sha256(SUPPORT_DOCX).hexdigest()
+    assert os.listdir(tmp_path) == [os.path.basename(upload.path)]
+    assert form.received == 1_000_000 + len(SUPPORT_DOCX)
+    upload.discard()
+
+
+def test_upload_form_errors(monkeypatch):
+    monkeypatch.setattr(config, "MAX_FILES_PER_REQUEST", 2)
+
+    with TestClient(main.app) as client:
+        too_many = client.post("/parse", files=[("files", (f"{i}.docx", SUPPORT_DOCX)) for i in range(3)])
+        not_multipart = client.post("/parse", json={"files": []})
+        no_files = client.post("/parse", files={"other": ("a.docx", SUPPORT_DOCX)})
+
+    assert too_many.status_code == 413
+    assert not_multipart.status_code == 400
+    assert no_files.status_code == 422
+
+
+@pytest.mark.parametrize("mode", ["inline", "process"])
+def test_spooled_uploads_parsed_and_removed(monkeypatch, tmp_path, mode):
+    monkeypatch.setattr(config, "EXECUTION_MODE", mode)
+    monkeypatch.setattr(config, "WORKER_COUNT", 2)
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_MEMORY_BYTES", 0)
+    monkeypatch.setattr(config, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    monkeypatch.setattr(main.runner, "cache", ResultCache(max_entries=16))
+
+    with TestClient(main.app) as client:
+        first = client.post("/parse", files=upload_batch()).json()
+        second = client.post("/parse", files=upload_batch()).json()
+
+    assert first["results"][0]["fields"]["designation"] == "Customer Support Executive"
+    assert first["results"][1]["error_code"] == "INVALID_TYPE"
+    assert second["results"][0]["cache_hit"]
+    assert os.listdir(tmp_path) == []
@@ -8,6 +8,8 @@ import { Activity, CheckCircle, AlertTriangle, FileText } from 'lucide-react';
 function App() {
   const [files, setFiles] = useState([]);
   const [results, setResults] = useState([]);
+  // Set while results match the server's stored copy, cleared once they are edited
+  const [jobId, setJobId] = useState(null);
   const [isProcessing, setIsProcessing] = useState(false);
   const [uploadProgress, setUploadProgress] = useState(0);
   const [summary, setSummary] = useState(null);
@@ -35,6 +37,7 @@ function App() {
   const handleClearAll = () => {
     setFiles([]);
     setResults([]);
+    setJobId(null);
     setSummary(null);
     setUploadProgress(0);
   };
@@ -56,6 +59,7 @@ function App() {
       setUploadProgress(100);
 
       setResults(response.results);
+      setJobId(response.job_id);
       setSummary(response.summary);
 
     } catch (error) {
@@ -67,6 +71,7 @@ function App() {
   };
 
   const handleUpdateResult = (rowIndex, fieldKey, newValue) => {
+    setJobId(null);
     setResults(prev => {
       const newResults = [...prev];
       // Update the specific field
@@ -223,7 +228,7 @@ function App() {
             {/* Export Actions */}
             <div className="bg-white/80 backdrop-blur-md rounded-2xl p-6 shadow-xl border border-white/50">
               <h3 className="font-semibold text-gray-700 mb-3">Export Data</h3>
-              <DownloadButtons results={results} disabled={isProcessing} />
+              <DownloadButtons results={results} jobId={jobId} disabled={isProcessing} />
             </div>
           </div>
 
@@ -2,11 +2,11 @@ import React from 'react';
 import { Download, FileSpreadsheet } from 'lucide-react';
 import { exportCSV, exportXLSX } from '../services/api';
 
-export const DownloadButtons = ({ results, disabled }) => {
+export const DownloadButtons = ({ results, jobId, disabled }) => {
     const handleDownloadCSV = async () => {
         if (disabled || results.length === 0) return;
         try {
-            await exportCSV({ results });
+            await exportCSV({ results }, jobId);
         } catch (e) {
             alert("Export failed");
         }
@@ -15,7 +15,7 @@ export const DownloadButtons = ({ results, disabled }) => {
     const handleDownloadXLSX = async () => {
         if (disabled || results.length === 0) return;
         try {
-            await exportXLSX({ results });
+            await exportXLSX({ results }, jobId);
         } catch (e) {
             alert("Export failed");
         }
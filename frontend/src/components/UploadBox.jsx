@@ -43,12 +43,13 @@ export const UploadBox = ({ onFilesSelected, files, onRemoveFile, onClearAll, is
         const validFiles = newFiles.filter(file => {
             const isDocx = file.name.toLowerCase().endsWith('.docx');
             const isPdf = file.name.toLowerCase().endsWith('.pdf');
-            const isSizeValid = file.size <= 10 * 1024 * 1024; // 10MB
-            return (isDocx || isPdf) && isSizeValid;
+            const isZip = file.name.toLowerCase().endsWith('.zip');
+            const isSizeValid = file.size <= (isZip ? 512 : 10) * 1024 * 1024; // 10MB, 512MB for archives
+            return (isDocx || isPdf || isZip) && isSizeValid;
         });
 
         if (validFiles.length < newFiles.length) {
-            alert("Some files were rejected. Only .docx/.pdf under 10MB allowed.");
+            alert("Some files were rejected. Only .docx/.pdf under 10MB or .zip archives under 512MB allowed.");
         }
 
         onFilesSelected(validFiles);
@@ -73,12 +74,12 @@ export const UploadBox = ({ onFilesSelected, files, onRemoveFile, onClearAll, is
                     id="fileInput"
                     onChange={handleFileInput}
                     disabled={isProcessing}
-                    accept=".docx,.pdf"
+                    accept=".docx,.pdf,.zip"
                 />
                 <label htmlFor="fileInput" className="flex flex-col items-center cursor-pointer w-full h-full">
                     <UploadCloud className="w-12 h-12 text-blue-500 mb-4" />
                     <p className="text-lg font-medium text-gray-700">Drag & drop files here</p>
-                    <p className="text-sm text-gray-500 mt-2">or click to browse (DOCX, PDF)</p>
+                    <p className="text-sm text-gray-500 mt-2">or click to browse (DOCX, PDF, ZIP)</p>
                     <p className="text-xs text-gray-400 mt-4">Max 10MB per file</p>
                 </label>
             </div>
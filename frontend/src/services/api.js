@@ -16,19 +16,37 @@ export const checkHealth = async () => {
   }
 };
 
-export const parseFiles = async (files) => {
+const JOB_POLL_INTERVAL_MS = 1500;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Submits the batch as a background job and polls until it finishes, so large
+// batches are not bound by a single request timeout. Resolves to the /parse payload.
+export const parseFiles = async (files, onProgress) => {
   const formData = new FormData();
   files.forEach((file) => {
     formData.append('files', file);
   });
 
   try {
-    const response = await api.post('/parse', formData, {
+    const { data: job } = await api.post('/jobs', formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
       },
-      timeout: 120000, // 2 minutes timeout for large batches
     });
+
+    // Each poll only carries the file results finished since the previous one
+    let since = 0;
+    for (;;) {
+      const { data: status } = await api.get(`/jobs/${job.job_id}`, { params: { since } });
+      since = status.next;
+      if (onProgress) onProgress(status);
+      if (status.status === 'done') break;
+      if (status.status === 'failed') throw new Error(status.error_message || 'Job failed');
+      await sleep(JOB_POLL_INTERVAL_MS);
+    }
+
+    const response = await api.get(`/jobs/${job.job_id}/results`);
     return response.data;
   } catch (error) {
     console.error("Parse failed:", error);
@@ -36,11 +54,22 @@ export const parseFiles = async (files) => {
   }
 };
 
-export const exportCSV = async (data) => {
+// Unedited results are exported from the server-side copy by job_id, so the
+// results array is only uploaded again when the user has edited it (or the copy expired).
+const fetchExport = async (format, data, jobId) => {
+  if (jobId) {
+    try {
+      return await api.get(`/export/${format}`, { params: { job_id: jobId }, responseType: 'blob' });
+    } catch (error) {
+      if (error.response?.status !== 404) throw error;
+    }
+  }
+  return api.post(`/export/${format}`, data, { responseType: 'blob' });
+};
+
+export const exportCSV = async (data, jobId) => {
   try {
-    const response = await api.post('/export/csv', data, {
-      responseType: 'blob',
-    });
+    const response = await fetchExport('csv', data, jobId);
     const url = window.URL.createObjectURL(new Blob([response.data]));
     const link = document.createElement('a');
     link.href = url;
@@ -54,11 +83,9 @@ export const exportCSV = async (data) => {
   }
 };
 
-export const exportXLSX = async (data) => {
+export const exportXLSX = async (data, jobId) => {
   try {
-    const response = await api.post('/export/xlsx', data, {
-      responseType: 'blob',
-    });
+    const response = await fetchExport('xlsx', data, jobId);
     const url = window.URL.createObjectURL(new Blob([response.data]));
     const link = document.createElement('a');
     link.href = url;